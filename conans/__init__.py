@@ -18,7 +18,10 @@ REVISIONS = "revisions"  # Only when enabled in config, not by default look at s
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
 MATRIX_PARAMS = "matrix_params"
 OAUTH_TOKEN = "oauth_token"
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+# Recipes and packages can be copied to other user/channel in the server
+SERVER_COPY = "server_copy"
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS,
+                       SERVER_COPY]  # Server is always with revisions
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.24.0-dev'
@@ -5,7 +5,9 @@ from collections import OrderedDict
 from os.path import join
 
 from conans.client.cache.editable import EditablePackages
+from conans.client.cache.remote_lookups import RemoteLookups
 from conans.client.cache.remote_registry import RemoteRegistry
+from conans.client.cache.trash import TRASH_FOLDER, Trash
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, get_default_settings_yml
 from conans.client.conf.detect import detect_defaults_settings
 from conans.client.output import Color
@@ -14,7 +16,7 @@ from conans.errors import ConanException
 from conans.model.profile import Profile
 from conans.model.ref import ConanFileReference
 from conans.model.settings import Settings
-from conans.paths import ARTIFACTS_PROPERTIES_FILE
+from conans.paths import ARTIFACTS_PROPERTIES_FILE, EXPORT_FOLDER
 from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
 from conans.paths.package_layouts.package_editable_layout import PackageEditableLayout
 from conans.unicode import get_cwd
@@ -68,9 +70,11 @@ class ClientCache(object):
         # Caching
         self._no_lock = None
         self._config = None
+        self._remote_lookups = None
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
         self._store_folder = self.config.storage_path or self.cache_folder
+        self._secondary_store_folder = None
         # Just call it to make it raise in case of short_paths misconfiguration
         self.config.short_paths_home
 
@@ -89,7 +93,11 @@ class ClientCache(object):
     def config_install_file(self):
         return os.path.join(self.cache_folder, "config_install.json")
 
-    def package_layout(self, ref, short_paths=None):
+    def package_layout(self, ref, short_paths=None, secondary=True):
+        """ :param secondary: if the recipe is not in this cache, but it is in the secondary
+        storage, the layout reads it and its packages from there. Use False to write or remove
+        the recipe, so it is done only in this cache
+        """
         assert isinstance(ref, ConanFileReference), "It is a {}".format(type(ref))
         edited_ref = self.editable_packages.get(ref.copy_clear_rev())
         if edited_ref:
@@ -99,8 +107,15 @@ class ClientCache(object):
         else:
             check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
+            secondary_folder = None
+            if secondary and self._secondary_store():
+                folder = os.path.normpath(os.path.join(self._secondary_store(), ref.dir_repr()))
+                if (not os.path.exists(os.path.join(base_folder, EXPORT_FOLDER)) and
+                        os.path.exists(os.path.join(folder, EXPORT_FOLDER))):
+                    secondary_folder = folder
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      secondary_folder=secondary_folder)
 
     @property
     def remotes_path(self):
@@ -110,6 +125,21 @@ class ClientCache(object):
     def registry(self):
         return RemoteRegistry(self, self._output)
 
+    @property
+    def remote_lookups(self):
+        if self._remote_lookups is None:
+            self._remote_lookups = RemoteLookups(self.cache_folder, self.config.remote_lookups_ttl)
+        return self._remote_lookups
+
+    def flush_remote_lookups(self):
+        if self._remote_lookups is not None:
+            self._remote_lookups.flush()
+
+    def _secondary_store(self):
+        if self._secondary_store_folder is None:
+            self._secondary_store_folder = self.config.secondary_storage_path or ""
+        return self._secondary_store_folder
+
     def _no_locks(self):
         if self._no_lock is None:
             self._no_lock = self.config.cache_no_locks
@@ -241,6 +271,10 @@ class ClientCache(object):
                         break  # not empty
                 ref_path = os.path.dirname(ref_path)
 
+    @property
+    def trash(self):
+        return Trash(join(self.cache_folder, TRASH_FOLDER))
+
     def remove_locks(self):
         folders = list_folder_subdirs(self._store_folder, 4)
         for folder in folders:
@@ -0,0 +1,81 @@
+import json
+import os
+
+from conans.paths import CONAN_MANIFEST
+from conans.util.files import load, save
+from conans.util.log import logger
+
+
+def _dump_cpp_info(cpp_info):
+    # All the public attributes, the private ones are the paths computed from them
+    return {field: value for field, value in vars(cpp_info).items()
+            if not field.startswith("_") and field != "configs"}
+
+
+def _load_cpp_info(cpp_info, data):
+    for field, value in data.items():
+        setattr(cpp_info, field, value)
+
+
+class PackageInfoCache(object):
+    """ the cpp_info, env_info and user_info that the package_info() method of a package of the
+    cache declared, stored in a json file (general.package_info_cache) so later installs reuse
+    them without running the method. They are reused only for the same recipe and package
+    revisions, package folder, settings, options, requirements and environment. They are stored
+    before the post_package_info hook, the package_info hooks run when they are reused too
+    """
+
+    def __init__(self, path, conanfile, pref, package_folder):
+        self._path = path
+        try:
+            manifest_time = os.path.getmtime(os.path.join(package_folder, CONAN_MANIFEST))
+        except OSError:
+            manifest_time = None
+        info = conanfile.info
+        # Any change of the package folder (rebuilt, downloaded, restored) rewrites the manifest
+        self._key = {"package": pref.full_str(),
+                     "package_folder": package_folder,
+                     "manifest_time": manifest_time,
+                     "settings": info.full_settings.dumps(),
+                     "options": info.full_options.dumps(),
+                     "requires": info.full_requires.dumps(),
+                     "env": info.env_values.dumps()}
+
+    def load(self, conanfile):
+        """ assigns the stored information to the conanfile
+        :return: if it was stored and is still valid
+        """
+        try:
+            data = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            return False
+        if data.get("key") != self._key:
+            logger.debug("PACKAGE_INFO: Outdated %s" % self._path)
+            return False
+
+        cpp_info = conanfile.cpp_info
+        cpp_info_data = data["cpp_info"]
+        configs = cpp_info_data.pop("configs")
+        _load_cpp_info(cpp_info, cpp_info_data)
+        for config, config_data in configs.items():
+            _load_cpp_info(getattr(cpp_info, config), config_data)
+        for name, value in data["env_info"].items():
+            setattr(conanfile.env_info, name, value)
+        for name, value in data["user_info"].items():
+            setattr(conanfile.user_info, name, value)
+        return True
+
+    def save(self, conanfile):
+        cpp_info = conanfile.cpp_info
+        cpp_info_data = _dump_cpp_info(cpp_info)
+        cpp_info_data["configs"] = {config: _dump_cpp_info(config_info)
+                                    for config, config_info in cpp_info.configs.items()}
+        data = {"key": self._key,
+                "cpp_info": cpp_info_data,
+                "env_info": conanfile.env_info.vars,
+                "user_info": conanfile.user_info.vars}
+        try:
+            save(self._path, json.dumps(data, indent=True))
+        except (IOError, OSError, TypeError, ValueError) as e:
+            # e.g. read-only cache or values that are not serializable, it is not critical
+            logger.debug("PACKAGE_INFO: Cannot store %s: %s" % (self._path, str(e)))
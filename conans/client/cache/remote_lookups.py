@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+import time
+from os.path import join, normpath
+
+from conans.util.files import load, save
+from conans.util.locks import SimpleLock
+from conans.util.log import logger
+
+
+REMOTE_LOOKUPS_FILE = "remote_lookups.json"
+
+# Kinds of the cached answers
+SEARCH = "search"  # the references found by a search pattern
+NOT_FOUND = "not_found"  # the recipe reference is not in the remote
+LATEST_REVISION = "latest"  # the latest revision of a reference without revision
+
+
+class RemoteLookups(object):
+    """ Answers of the remotes to the lookups done while computing the graph, persisted in the
+    cache folder during 'ttl' seconds, so consecutive commands do not ask the same questions to
+    the remotes. The answers are keyed by the remote URL, and disabled if 'ttl' is not defined.
+    The new answers are kept in memory and written once, with flush(), at the end of the command
+    """
+    def __init__(self, cache_folder, ttl):
+        self._lookups_file = normpath(join(cache_folder, REMOTE_LOOKUPS_FILE))
+        self._ttl = ttl
+        self._lookups = None
+        self._changes = {}
+        # The remotes can be looked up concurrently
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self._ttl)
+
+    @staticmethod
+    def _key(kind, remote, key):
+        return " ".join((kind, remote.url, key))
+
+    def _load(self):
+        if not os.path.exists(self._lookups_file):
+            return {}
+        try:
+            lookups = json.loads(load(self._lookups_file))
+        except Exception as e:  # Corrupted file, just discard it
+            logger.error("Error loading remote lookups %s: %s" % (self._lookups_file, str(e)))
+            return {}
+        now = time.time()
+        return {k: v for k, v in lookups.items() if now - v[0] < self._ttl}
+
+    def get(self, kind, remote, key):
+        """ returns the value of the answer, or None if not cached or expired
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._lookups is None:
+                self._lookups = self._load()
+            timestamp, value = self._lookups.get(self._key(kind, remote, key), (None, None))
+        if timestamp is None or time.time() - timestamp >= self._ttl:
+            return None
+        return value
+
+    def set(self, kind, remote, key, value):
+        if not self.enabled:
+            return
+        self._change(self._key(kind, remote, key), [time.time(), value])
+
+    def remove(self, kind, remote, key):
+        if not self.enabled:
+            return
+        self._change(self._key(kind, remote, key), None)
+
+    def _change(self, key, value):
+        with self._lock:
+            if self._lookups is None:
+                self._lookups = self._load()
+            _apply(self._lookups, {key: value})
+            self._changes[key] = value
+
+    def flush(self):
+        """ writes the new answers, merged with the ones written meanwhile by other processes.
+        The expired ones are discarded
+        """
+        with self._lock:
+            if not self._changes:
+                return
+            try:
+                with SimpleLock(self._lookups_file + ".lock"):
+                    lookups = self._load()
+                    _apply(lookups, self._changes)
+                    save(self._lookups_file, json.dumps(lookups))
+            except (IOError, OSError) as e:  # e.g. read-only cache, it is not critical
+                logger.error("Error saving remote lookups %s: %s" % (self._lookups_file, str(e)))
+            else:
+                self._lookups = lookups
+            self._changes = {}
+
+
+def _apply(lookups, changes):
+    for k, v in changes.items():
+        if v is None:
+            lookups.pop(k, None)
+        else:
+            lookups[k] = v
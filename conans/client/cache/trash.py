@@ -0,0 +1,102 @@
+import os
+import platform
+import subprocess
+import sys
+import uuid
+from multiprocessing.pool import ThreadPool
+
+from conans.client.tools.oss import cpu_count
+from conans.util.files import mkdir
+from conans.util.log import logger
+from conans.util.runners import conan_subprocess
+from conans.util.windows import CONAN_LINK, rm_conandir
+
+TRASH_FOLDER = "trash"
+
+
+class Trash(object):
+    """ Folder of the cache where the removed folders are moved, with an atomic rename, so the
+    removals don't have to wait for them to be deleted. The folders in the trash are deleted in
+    parallel later, by the same process, by a background one (general.background_removal) or
+    with "conan cache clean-trash"
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    @property
+    def folder(self):
+        return self._folder
+
+    def move(self, path):
+        """ moves the folder into the trash, returning its new path. Returns None if it doesn't
+        exist or it cannot be moved, e.g. if it is in other filesystem than the trash or it is
+        a link to a short path, that has to be removed too
+        """
+        if not os.path.isdir(path) or os.path.exists(os.path.join(path, CONAN_LINK)):
+            return None
+        mkdir(self._folder)
+        dest = os.path.join(self._folder, uuid.uuid4().hex)
+        try:
+            os.rename(path, dest)
+        except OSError as e:
+            logger.debug("TRASH: Cannot move %s to the trash: %s" % (path, str(e)))
+            return None
+        logger.debug("TRASH: Moved %s to %s" % (path, dest))
+        return dest
+
+    def entries(self):
+        try:
+            return [os.path.join(self._folder, f) for f in os.listdir(self._folder)]
+        except OSError:
+            return []
+
+    def drain(self, entries=None, workers=None):
+        """ deletes in parallel the given entries of the trash, or all of them. The entries that
+        cannot be deleted, e.g. with open files, are kept to be deleted later.
+        Returns the number of deleted entries
+        """
+        entries = self.entries() if entries is None else entries
+        if not entries:
+            return 0
+
+        def delete(entry):
+            try:
+                rm_conandir(entry)
+            except OSError as e:  # Other process might be deleting it too
+                logger.debug("TRASH: Cannot delete %s: %s" % (entry, str(e)))
+            return not os.path.exists(entry)
+
+        pool = ThreadPool(min(len(entries), workers or cpu_count()))
+        try:
+            deleted = pool.map(delete, entries, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        return deleted.count(True)
+
+    def drain_background(self):
+        """ launches a detached process that deletes all the entries of the trash, that keeps
+        running after this one finishes. If it cannot be launched, they are deleted by this one
+        """
+        cache_folder = os.path.dirname(self._folder)
+        cmd, env = conan_subprocess(cache_folder, [__name__, self._folder],
+                                    ["cache", "clean-trash"])
+        if cmd:
+            if platform.system() == "Windows":
+                detached_process, new_process_group = 0x00000008, 0x00000200
+                kwargs = {"creationflags": detached_process | new_process_group}
+            else:
+                kwargs = {"preexec_fn": os.setsid}
+            try:
+                with open(os.devnull, "w") as devnull:
+                    subprocess.Popen(cmd, stdin=devnull, stdout=devnull, stderr=devnull, env=env,
+                                     close_fds=True, **kwargs)
+                return
+            except OSError as e:
+                logger.debug("TRASH: Cannot launch %s: %s" % (cmd, str(e)))
+        self.drain()
+
+
+if __name__ == "__main__":
+    Trash(sys.argv[1]).drain()
@@ -0,0 +1,337 @@
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import uuid
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from conans.client.cmd.uploader import compress_files
+from conans.client.remover import DiskRemover
+from conans.client.tools.oss import cpu_count
+from conans.errors import ConanException
+from conans.model.graph_lock import GraphLockFile
+from conans.model.manifest import FileTreeManifest, gather_files
+from conans.model.package_metadata import PackageMetadata
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import EXPORT_FOLDER, EXPORT_SRC_FOLDER, PACKAGES_FOLDER
+from conans.util.files import is_dirty, mkdir, rmdir, tar_extract
+
+BUNDLE_MANIFEST = "bundle.json"
+BUNDLE_VERSION = 1
+RECIPE_TGZ = "recipe.tgz"
+
+
+def bundle_references(references, lockfile, revisions_enabled):
+    """ the recipes and packages to bundle, from the references, package references and
+    lockfile given by the user
+    :return: {ref: None to bundle all its packages or the list of package IDs}
+    """
+    result = OrderedDict()
+
+    def add(ref, package_id, all_packages=False):
+        ref = ref if revisions_enabled else ref.copy_clear_rev()
+        package_ids = result.setdefault(ref, [])
+        if all_packages:
+            result[ref] = None
+        elif package_ids is not None and package_id is not None and package_id not in package_ids:
+            package_ids.append(package_id)
+
+    for reference in references or []:
+        if ":" in reference:
+            pref = PackageReference.loads(reference)
+            add(pref.ref, pref.id)
+        else:
+            add(ConanFileReference.loads(reference), None, all_packages=True)
+    if lockfile:
+        graph_lock = GraphLockFile.load(lockfile, revisions_enabled).graph_lock
+        for ref, package_id in graph_lock.packages():
+            add(ref, package_id)
+    if not result:
+        raise ConanException("Specify the references or the lockfile of the bundle")
+    return result
+
+
+class CacheBundler(object):
+    """ writes recipes and binary packages of the cache, with their metadata, into a bundle, a
+    tar archive that can be streamed, with the compressed recipes and packages as members, and
+    restores them in other cache, extracting them in parallel and checking their manifests.
+    The members are:
+        bundle.json: {"version", "recipes": [{"reference", "metadata", "packages"}]}
+        <ref folder>/recipe.tgz: the export and export_source folders
+        <ref folder>/package/<package_id>.tgz: the package folder
+    """
+
+    def __init__(self, cache, output, workers=None):
+        self._cache = cache
+        self._output = output
+        self._workers = workers or cpu_count()
+
+    def save(self, bundle_path, references):
+        """ :param references: {ref: None for all the packages or [package IDs]} """
+        recipes = [self._bundle_recipe(ref, package_ids) for ref, package_ids in references.items()]
+        tmp_folder = tempfile.mkdtemp(suffix="_conan_bundle")
+        try:
+            items = []  # (member name, folders to compress {prefix: folder})
+            for ref, layout, metadata, package_ids in recipes:
+                ref_folder = ref.dir_repr()
+                items.append(("%s/%s" % (ref_folder, RECIPE_TGZ),
+                              {EXPORT_FOLDER: layout.read_export(),
+                               EXPORT_SRC_FOLDER: layout.read_export_sources()}))
+                for package_id in package_ids:
+                    pref = PackageReference(layout.ref, package_id)
+                    items.append(("%s/%s/%s.tgz" % (ref_folder, PACKAGES_FOLDER, package_id),
+                                  {"": layout.read_package(pref)}))
+
+            def compress(item):
+                name, folders = item
+                files, symlinks = {}, {}
+                for prefix, folder in folders.items():
+                    folder_files, folder_symlinks = gather_files(folder)
+                    for src, dst in ((folder_files, files), (folder_symlinks, symlinks)):
+                        dst.update((_join(prefix, k), v) for k, v in src.items())
+                tgz_folder = os.path.join(tmp_folder, str(uuid.uuid4()))
+                mkdir(tgz_folder)
+                return name, compress_files(files, symlinks, os.path.basename(name), tgz_folder)
+
+            self._output.info("Compressing %d recipes and %d packages"
+                              % (len(recipes), len(items) - len(recipes)))
+            pool = ThreadPool(self._workers)
+            try:
+                compressed = pool.map(compress, items, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+            manifest = {"version": BUNDLE_VERSION,
+                        "recipes": [{"reference": repr(ref),
+                                     "metadata": json.loads(metadata.dumps()),
+                                     "packages": package_ids}
+                                    for ref, _, metadata, package_ids in recipes]}
+            mkdir(os.path.dirname(os.path.abspath(bundle_path)))
+            # Stream mode, so the bundle can be read sequentially while it is written or copied
+            with tarfile.open(bundle_path, "w|") as bundle:
+                data = json.dumps(manifest, indent=True).encode("utf-8")
+                info = tarfile.TarInfo(name=BUNDLE_MANIFEST)
+                info.size = len(data)
+                bundle.addfile(info, io.BytesIO(data))
+                for name, tgz_path in compressed:
+                    bundle.add(tgz_path, arcname=name)
+        finally:
+            rmdir(tmp_folder)
+        self._output.success("Saved %d recipes and %d packages to %s"
+                             % (len(recipes), len(items) - len(recipes), bundle_path))
+        return manifest
+
+    def _bundle_recipe(self, ref, package_ids):
+        layout = self._cache.package_layout(ref.copy_clear_rev())
+        if self._cache.installed_as_editable(ref) or not layout.recipe_exists():
+            raise ConanException("Recipe '%s' not found in the cache" % str(ref))
+        metadata = layout.load_metadata()
+        if ref.revision and ref.revision != metadata.recipe.revision:
+            raise ConanException("Recipe '%s' not found in the cache, the revision is '%s'"
+                                 % (ref.full_str(), metadata.recipe.revision))
+        ref = ref.copy_with_rev(metadata.recipe.revision)
+        if package_ids is None:
+            package_ids = sorted(layout.conan_packages())
+            if self._cache.config.revisions_enabled:  # Not the ones of other recipe revisions
+                package_ids = [p for p in package_ids if p in metadata.packages and
+                               metadata.packages[p].recipe_revision == ref.revision]
+        for package_id in package_ids:
+            pref = PackageReference(layout.ref, package_id)
+            if not layout.package_exists(pref) or is_dirty(layout.read_package(pref)):
+                raise ConanException("Package '%s' not found in the cache"
+                                     % repr(PackageReference(ref, package_id)))
+        # Only the metadata of the bundled packages
+        for package_id in list(metadata.packages):
+            if package_id not in package_ids:
+                metadata.clear_package(package_id)
+        return ref, layout, metadata, package_ids
+
+    def restore(self, bundle_path, force=False):
+        """ :param force: replace the recipes in the cache with other revision, removing their
+        packages. They are not restored otherwise
+        :return: {"recipes": [refs], "packages": [prefs], "skipped": [refs or prefs]}
+        """
+        result = {"recipes": [], "packages": [], "skipped": []}
+        tmp_folder = tempfile.mkdtemp(suffix="_conan_bundle", dir=self._cache.cache_folder)
+        errors = []
+        pool = ThreadPool(self._workers)
+        try:
+            with tarfile.open(bundle_path, "r|") as bundle:
+                members = iter(bundle)
+                member = next(members, None)
+                if member is None or member.name != BUNDLE_MANIFEST:
+                    raise ConanException("Invalid bundle '%s', missing %s"
+                                         % (bundle_path, BUNDLE_MANIFEST))
+                manifest = json.loads(bundle.extractfile(member).read().decode("utf-8"))
+                if manifest.get("version") != BUNDLE_VERSION:
+                    raise ConanException("Unsupported bundle version '%s'"
+                                         % manifest.get("version"))
+                recipes = self._prepare_restore(manifest, force, result)
+
+                pending = []
+                for member in members:
+                    item = self._member_item(member.name, recipes)
+                    if item is None:  # Skipped or unknown
+                        continue
+                    tgz_path = os.path.join(tmp_folder, str(uuid.uuid4()))
+                    with open(tgz_path, "wb") as f:
+                        shutil.copyfileobj(bundle.extractfile(member), f)
+                    pending.append(pool.apply_async(self._extract, (item, tgz_path, tmp_folder)))
+                extracted = {}
+                for p in pending:
+                    item, folder, error = p.get()
+                    if error:
+                        errors.append(error)
+                    else:
+                        extracted[item] = folder
+                errors.extend(self._move_in(recipes, extracted, force, result))
+        finally:
+            pool.close()
+            pool.join()
+            rmdir(tmp_folder)
+
+        if errors:
+            raise ConanException("Failed restoring the bundle:\n%s" % "\n".join(errors))
+        self._output.success("Restored %d recipes and %d packages from %s, %d skipped as they "
+                             "are already in the cache"
+                             % (len(result["recipes"]), len(result["packages"]), bundle_path,
+                                len(result["skipped"])))
+        return result
+
+    def _prepare_restore(self, manifest, force, result):
+        """ decides which recipes and packages of the bundle have to be restored
+        Nothing is removed from the cache yet, the replaced recipes are removed when the new
+        revision has been extracted and validated
+        :return: {ref: [metadata, [package IDs to restore], restore recipe]}
+        """
+        recipes = OrderedDict()
+        for recipe in manifest["recipes"]:
+            ref = ConanFileReference.loads(recipe["reference"])
+            metadata = PackageMetadata.loads(json.dumps(recipe["metadata"]))
+            if self._cache.installed_as_editable(ref):
+                raise ConanException("Cannot restore '%s', it is in editable mode" % str(ref))
+            layout = self._cache.package_layout(ref.copy_clear_rev(), secondary=False)
+            restore_recipe = True
+            if os.path.exists(layout.export()):
+                local_revision = layout.recipe_revision()
+                if local_revision == ref.revision:
+                    restore_recipe = False
+                    result["skipped"].append(repr(ref))
+                elif not force:
+                    raise ConanException("Recipe '%s' is in the cache with other revision '%s'. "
+                                         "Use --force to replace it" % (str(ref), local_revision))
+            package_ids = []
+            for package_id in recipe["packages"]:
+                pref = PackageReference(layout.ref, package_id)
+                if not restore_recipe and os.path.exists(layout.package(pref)):
+                    result["skipped"].append(repr(PackageReference(ref, package_id)))
+                else:
+                    package_ids.append(package_id)
+            recipes[ref] = [metadata, package_ids, restore_recipe]
+        return recipes
+
+    @staticmethod
+    def _member_item(name, recipes):
+        """ the (ref, package_id) to restore from the bundle member, package_id None for the
+        recipe, or None if it has not to be restored
+        """
+        for ref, (_, package_ids, restore_recipe) in recipes.items():
+            ref_folder = ref.dir_repr()
+            if name == "%s/%s" % (ref_folder, RECIPE_TGZ):
+                return (ref, None) if restore_recipe else None
+            prefix = "%s/%s/" % (ref_folder, PACKAGES_FOLDER)
+            if name.startswith(prefix) and name.endswith(".tgz"):
+                package_id = name[len(prefix):-len(".tgz")]
+                return (ref, package_id) if package_id in package_ids else None
+        return None
+
+    @staticmethod
+    def _extract(item, tgz_path, tmp_folder):
+        """ extracts a bundle member to a temporary folder and checks its manifest
+        :return: (item, extracted folder, error message or None if successful)
+        """
+        ref, package_id = item
+        folder = os.path.join(tmp_folder, str(uuid.uuid4()))
+        try:
+            with open(tgz_path, "rb") as f:
+                tar_extract(f, folder)
+            os.remove(tgz_path)
+            if package_id is None:
+                export, export_sources = (os.path.join(folder, EXPORT_FOLDER),
+                                          os.path.join(folder, EXPORT_SRC_FOLDER))
+                mkdir(export_sources)
+                if FileTreeManifest.load(export) != FileTreeManifest.create(export,
+                                                                            export_sources):
+                    return item, None, "%s: Manifest mismatch" % str(ref)
+            elif FileTreeManifest.load(folder) != FileTreeManifest.create(folder):
+                return item, None, ("%s: Manifest mismatch"
+                                    % repr(PackageReference(ref, package_id)))
+        except Exception as e:
+            name = str(ref) if package_id is None else repr(PackageReference(ref, package_id))
+            return item, None, "%s: %s" % (name, str(e))
+        return item, folder, None
+
+    def _move_in(self, recipes, extracted, force, result):
+        """ moves the extracted recipes and packages to the cache, with the recipe locked, and
+        writes the metadata of every item as it is moved. The packages of a recipe that could
+        not be restored are not restored either
+        :return: the error messages
+        """
+        errors = []
+        for ref, (metadata, package_ids, restore_recipe) in recipes.items():
+            layout = self._cache.package_layout(ref.copy_clear_rev(), secondary=False)
+            try:
+                with layout.conanfile_write_lock(self._output):
+                    if restore_recipe:
+                        folder = extracted.get((ref, None))
+                        if folder is None:
+                            continue
+                        self._move_recipe(ref, layout, folder, metadata, force)
+                        result["recipes"].append(repr(ref))
+                    for package_id in package_ids:
+                        folder = extracted.get((ref, package_id))
+                        if folder is None:
+                            continue
+                        pref = PackageReference(layout.ref, package_id)
+                        with layout.package_lock(pref):
+                            _move_folder(folder, layout.package(pref))
+                            with layout.update_metadata() as local_metadata:
+                                local_metadata.packages[package_id] = metadata.packages[package_id]
+                        result["packages"].append(repr(PackageReference(ref, package_id)))
+            except Exception as e:
+                errors.append("%s: %s" % (str(ref), str(e)))
+        return errors
+
+    def _move_recipe(self, ref, layout, folder, metadata, force):
+        # Checked again, it could have been exported meanwhile
+        local_revision = layout.recipe_revision() if os.path.exists(layout.export()) else None
+        replace = local_revision is not None and local_revision != ref.revision
+        if replace:
+            if not force:
+                raise ConanException("Recipe '%s' is in the cache with other revision '%s'. "
+                                     "Use --force to replace it" % (str(ref), local_revision))
+            self._output.warn("Replacing %s revision %s" % (str(ref), local_revision))
+            remover = DiskRemover()
+            remover.remove_src(layout)
+            remover.remove_builds(layout)
+            remover.remove_packages(layout)
+        _move_folder(os.path.join(folder, EXPORT_FOLDER), layout.export())
+        _move_folder(os.path.join(folder, EXPORT_SRC_FOLDER), layout.export_sources())
+        with layout.update_metadata() as local_metadata:
+            if replace:  # The packages of the replaced revision have been removed
+                local_metadata.clear()
+            local_metadata.recipe = metadata.recipe
+
+
+def _move_folder(src, dst):
+    rmdir(dst)
+    mkdir(os.path.dirname(dst))
+    shutil.move(src, dst)
+
+
+def _join(prefix, name):
+    return "%s/%s" % (prefix, name) if prefix else name
@@ -0,0 +1,207 @@
+import os
+import re
+import time
+
+from conans.client.remover import DiskRemover
+from conans.client.tools.files import UNIT_SIZE, human_size
+from conans.errors import ConanException
+from conans.model.ref import PackageReference
+
+BUILD = "build"
+PACKAGE = "package"
+RECIPE = "recipe"
+
+# The build folders are evicted first, then the packages and finally the recipes
+_TIERS = {BUILD: 0, PACKAGE: 1, RECIPE: 2}
+_SIZE_UNITS = {"": 1, "K": UNIT_SIZE, "M": UNIT_SIZE ** 2, "G": UNIT_SIZE ** 3,
+               "T": UNIT_SIZE ** 4}
+_AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_size(value):
+    """ "500M", "10GB" or "1024" to bytes """
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$", value, re.IGNORECASE)
+    if not match:
+        raise ConanException("Invalid size '%s', use a number of bytes with an optional "
+                             "K, M, G or T suffix, e.g. 10G" % value)
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def parse_age(value):
+    """ "90s", "30m", "12h", "7d" or "2w" to seconds """
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*$", value)
+    if not match:
+        raise ConanException("Invalid age '%s', use a number with a s, m, h, d or w suffix, "
+                             "e.g. 30d" % value)
+    return float(match.group(1)) * _AGE_UNITS[match.group(2)]
+
+
+def _folder_size(folder):
+    size = 0
+    for root, _, files in os.walk(folder):
+        for f in files:
+            try:
+                size += os.lstat(os.path.join(root, f)).st_size
+            except OSError:
+                pass
+    return size
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+
+class _Entry(object):
+
+    def __init__(self, kind, ref, package_id, size, last_used):
+        self.kind = kind
+        self.ref = ref
+        self.package_id = package_id
+        self.size = size
+        self.last_used = last_used
+
+    def __str__(self):
+        if self.kind == RECIPE:
+            return "recipe"
+        return "%s folder %s" % (self.kind, self.package_id)
+
+    def as_dict(self):
+        return {"reference": repr(self.ref), "type": self.kind, "package_id": self.package_id,
+                "size": self.size, "last_used": self.last_used}
+
+
+def _cache_entries(cache):
+    """ the build folders, packages and recipes of the cache, with their size and last usage.
+    The size of every recipe doesn't include its packages and build folders, but its last usage
+    is the last usage of any of them. The editable packages are not considered
+    """
+    result = []
+    for ref in cache.all_refs():
+        if cache.installed_as_editable(ref):
+            continue
+        layout = cache.package_layout(ref, secondary=False)
+        entries = []
+        for package_id in layout.conan_builds():
+            folder = layout.build(PackageReference(ref, package_id))
+            # The build_id() might make it differ from the package ID, take the folder date too
+            pref = PackageReference(ref, package_id)
+            last_used = max(layout.last_used(pref) or 0, _mtime(folder))
+            entries.append(_Entry(BUILD, ref, package_id, _folder_size(folder), last_used))
+        for package_id in layout.conan_packages():
+            pref = PackageReference(ref, package_id)
+            folder = layout.package(pref)
+            last_used = layout.last_used(pref) or _mtime(folder)
+            entries.append(_Entry(PACKAGE, ref, package_id, _folder_size(folder), last_used))
+        recipe_size = sum(_folder_size(f) for f in (layout.export(), layout.export_sources(),
+                                                    layout.source(), layout.scm_sources()))
+        last_used = max([layout.last_used() or _mtime(layout.export())] +
+                        [e.last_used for e in entries])
+        entries.append(_Entry(RECIPE, ref, None, recipe_size, last_used))
+        result.extend(entries)
+    return result
+
+
+class CacheGarbageCollector(object):
+    """ evicts the least recently used build folders, packages and recipes of the cache, the
+    ones not used for a given time and the ones exceeding the given size of the cache. The
+    folders locked by other processes are skipped
+    """
+
+    def __init__(self, cache, output):
+        self._cache = cache
+        self._output = output
+        self._remover = DiskRemover(trash=cache.trash)
+
+    def collect(self, max_size=None, older_than=None, dry_run=False):
+        """ :param max_size: bytes
+        :param older_than: seconds
+        :return: the list of evicted entries, as dicts
+        """
+        if max_size is None and older_than is None:
+            raise ConanException("Define the maximum size or age of the cache to collect it")
+
+        entries = _cache_entries(self._cache)
+        cache_size = sum(e.size for e in entries)
+        self._output.info("Cache size: %s" % human_size(cache_size))
+        limit = time.time() - older_than if older_than is not None else None
+
+        evicted = []
+        evicted_keys = set()  # (ref, kind, package_id)
+        for entry in sorted(entries, key=lambda e: (_TIERS[e.kind], e.last_used)):
+            if (entry.ref, entry.kind, entry.package_id) in evicted_keys:
+                continue
+            ref_entries = [e for e in entries if e.ref == entry.ref and
+                           (e.ref, e.kind, e.package_id) not in evicted_keys]
+            # A recipe takes with it the remaining packages and build folders
+            size = sum(e.size for e in ref_entries) if entry.kind == RECIPE else entry.size
+            too_old = limit is not None and entry.last_used < limit
+            too_big = max_size is not None and cache_size > max_size
+            if not too_old and not too_big:
+                continue
+            if not dry_run and not self._evict(entry):
+                continue
+            cache_size -= size
+            removed = ref_entries if entry.kind == RECIPE else [entry]
+            evicted_keys.update((e.ref, e.kind, e.package_id) for e in removed)
+            evicted.append(entry.as_dict())
+            self._output.info("%s: %s %s (%s, last used %s)"
+                              % (str(entry.ref), "Would remove" if dry_run else "Removed",
+                                 str(entry), human_size(size),
+                                 time.strftime("%Y-%m-%d %H:%M",
+                                               time.localtime(entry.last_used))))
+
+        self._empty_trash()
+        self._output.info("Cache size after collecting: %s" % human_size(cache_size))
+        return evicted
+
+    def _evict(self, entry):
+        """ removes the entry if it is not locked, returns if it was removed """
+        ref = entry.ref
+        layout = self._cache.package_layout(ref, short_paths=False, secondary=False)
+        recipe_lock = layout.conanfile_write_lock(self._output)
+        if not recipe_lock.try_acquire():
+            self._output.warn("%s: Skipping %s, locked by another process" % (str(ref), entry))
+            return False
+        try:
+            package_ids = layout.conan_packages() if entry.kind == RECIPE else [entry.package_id]
+            package_locks = [layout.package_lock(PackageReference(ref, package_id))
+                             for package_id in package_ids]
+            acquired = []
+            try:
+                for package_lock in package_locks:
+                    if not package_lock.try_acquire():
+                        self._output.warn("%s: Skipping %s, locked by another process"
+                                          % (str(ref), entry))
+                        return False
+                    acquired.append(package_lock)
+                if entry.kind == BUILD:
+                    self._remover.remove_builds(layout, [entry.package_id])
+                elif entry.kind == PACKAGE:
+                    self._remover.remove_packages(layout, [entry.package_id])
+                    with layout.update_metadata() as metadata:
+                        metadata.clear_package(entry.package_id)
+            finally:
+                for package_lock in acquired:
+                    package_lock.release()
+            if entry.kind == RECIPE:
+                # The package lock files are inside the removed folder, so they are released
+                self._remover.remove(layout, output=self._output)
+        finally:
+            recipe_lock.release()
+
+        if entry.kind == RECIPE:
+            layout.remove_package_locks()
+            self._cache.delete_empty_dirs([ref])
+        return True
+
+    def _empty_trash(self):
+        trashed = self._remover.trashed
+        if not trashed:
+            return
+        if self._cache.config.background_removal:
+            self._cache.trash.drain_background()
+        else:
+            self._cache.trash.drain(trashed)
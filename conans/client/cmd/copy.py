@@ -29,6 +29,18 @@ def cmd_copy(ref, user_channel, package_ids, cache, user_io, remote_manager, loa
     package_copy(ref, user_channel, package_ids, cache, user_io, short_paths, force)
 
 
+def cmd_remote_copy(ref, user_channel, package_ids, remote, remote_manager, output, force=False):
+    """ copies the recipe and binaries in the remote, without transferring them
+    param package_ids: Falsey=do not copy binaries. True=All existing. []=list of ids
+    """
+    dest_ref = ConanFileReference.loads("%s/%s@%s" % (ref.name, ref.version, user_channel))
+    package_ids = None if package_ids is True else (package_ids or [])
+    dest_ref, packages = remote_manager.copy_recipe(ref, dest_ref, package_ids, force, remote)
+    output.info("Copied %s to %s in remote '%s'" % (str(ref), str(dest_ref), remote.name))
+    for package_id in sorted(packages):
+        output.info("Copied %s to %s in remote '%s'" % (package_id, str(dest_ref), remote.name))
+
+
 def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths=False,
                  force=False):
     dest_ref = ConanFileReference.loads("%s/%s@%s" % (src_ref.name,
@@ -37,10 +49,10 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
     # Generate metadata
     src_layout = cache.package_layout(src_ref, short_paths)
     src_metadata = src_layout.load_metadata()
-    dst_layout = cache.package_layout(dest_ref, short_paths)
+    dst_layout = cache.package_layout(dest_ref, short_paths, secondary=False)
 
     # Copy export
-    export_origin = src_layout.export()
+    export_origin = src_layout.read_export()
     if not os.path.exists(export_origin):
         raise ConanException("'%s' doesn't exist" % str(src_ref))
     export_dest = dst_layout.export()
@@ -52,7 +64,7 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
     shutil.copytree(export_origin, export_dest, symlinks=True)
     user_io.out.info("Copied %s to %s" % (str(src_ref), str(dest_ref)))
 
-    export_sources_origin = src_layout.export_sources()
+    export_sources_origin = src_layout.read_export_sources()
     export_sources_dest = dst_layout.export_sources()
     if os.path.exists(export_sources_dest):
         rmdir(export_sources_dest)
@@ -64,7 +76,7 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
     for package_id in package_ids:
         pref_origin = PackageReference(src_ref, package_id)
         pref_dest = PackageReference(dest_ref, package_id)
-        package_path_origin = src_layout.package(pref_origin)
+        package_path_origin = src_layout.read_package(pref_origin)
         package_path_dest = dst_layout.package(pref_dest)
         if os.path.exists(package_path_dest):
             if not force and not user_io.request_boolean("Package '%s' already exist."
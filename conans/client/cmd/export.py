@@ -94,7 +94,9 @@ def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
                                        ref.user, ref.channel, python_requires)
 
     check_casing_conflict(cache=cache, ref=ref)
-    package_layout = cache.package_layout(ref, short_paths=conanfile.short_paths)
+    # The exported recipes are written in this cache, never in the secondary one
+    package_layout = cache.package_layout(ref, short_paths=conanfile.short_paths,
+                                          secondary=not export)
     if not export:
         metadata = package_layout.load_metadata()
         recipe_revision = metadata.recipe.revision
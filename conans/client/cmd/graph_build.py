@@ -0,0 +1,193 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from six import StringIO
+from six.moves import queue
+
+from conans.client.graph.graph import BINARY_BUILD, BINARY_UNKNOWN
+from conans.errors import ConanException
+from conans.model.graph_lock import GraphLockFile
+from conans.unicode import get_cwd
+from conans.util.files import load, mkdir, rmdir, save
+from conans.util.log import logger
+from conans.util.runners import conan_subprocess
+
+BUILT = "Built"
+FAILED = "Failed"
+SKIPPED = "Skipped"
+
+# The installs that cannot run in other process change the current folder and the global state
+_in_process_lock = threading.Lock()
+
+
+def build_dag(deps_graph):
+    """ returns the packages of the graph to build {node_id: (pref, {node_ids})} in build order,
+    with the IDs of the other packages to build that every one depends on (directly or
+    transitively). Nodes with the same package reference are built once, by the first of them
+    """
+    to_build = OrderedDict()  # {node_id: pref}
+    build_ids = {}  # {pref: node_id}
+    for level in deps_graph.new_build_order():
+        for node_id, pref in level:
+            to_build[node_id] = pref
+            build_ids[pref] = node_id
+
+    upstream = {}  # {node: IDs of the nodes to build it depends on}
+    for level in reversed(deps_graph.inverse_levels()):
+        for node in level:
+            ids = set()
+            for dep in node.neighbors():
+                ids.update(upstream[dep])
+                if dep.binary in (BINARY_UNKNOWN, BINARY_BUILD):
+                    ids.add(build_ids[dep.pref.copy_clear_prev()])
+            upstream[node] = ids
+
+    nodes = {node.id: node for node in deps_graph.nodes}
+    return OrderedDict((node_id, (pref, upstream[nodes[node_id]]))
+                       for node_id, pref in to_build.items())
+
+
+class GraphBuildCoordinator(object):
+    """ builds the packages of a lockfile, running a 'conan install --build' process per package
+    against the same cache, with up to 'workers' of them running concurrently. Every package is
+    scheduled as soon as all the packages it depends on have been built, and its resulting
+    lockfile is merged into the main one with GraphLock.update_lock(). If the processes cannot
+    be launched, the packages are built one by one in this process
+    """
+    def __init__(self, cache_folder, output, workers):
+        self._cache_folder = cache_folder
+        self._output = output
+        self._workers = workers
+
+    def build(self, dag, lockfile, revisions_enabled):
+        """ :param dag: {node_id: (pref, {node_ids})} as returned by build_dag()
+        :param lockfile: path of the lockfile, that will be updated with every built package
+        :return: [{"id", "reference", "status", "duration", "log"}] in completion order
+        """
+        lock = GraphLockFile.load(lockfile, revisions_enabled)
+        tmp_folder = tempfile.mkdtemp(suffix="_conan_graph_build")
+        pending = {node_id: set(deps) for node_id, (_, deps) in dag.items()}
+        finished = queue.Queue()
+        results = []
+        failed = False
+        running = 0
+
+        self._output.info("Building %d packages with %d workers" % (len(dag), self._workers))
+        pool = ThreadPool(self._workers)
+        try:
+            while pending or running:
+                ready = [n for n in dag if n in pending and not pending[n]]
+                for node_id in ready[:self._workers - running] if not failed else []:
+                    del pending[node_id]
+                    pref = dag[node_id][0]
+                    node_folder = os.path.join(tmp_folder, node_id)
+                    lock.save(os.path.join(node_folder, "conan.lock"))
+                    self._output.info("%s: Building (node %s)" % (pref.ref, node_id))
+                    pool.apply_async(self._install, (node_id, pref, node_folder),
+                                     callback=finished.put)
+                    running += 1
+                if not running:
+                    break  # Nothing else can be built after a failure
+
+                node_id, ok, duration, log_file = finished.get()
+                running -= 1
+                pref = dag[node_id][0]
+                result = {"id": node_id, "reference": repr(pref), "duration": duration,
+                          "log": log_file}
+                if ok:
+                    result["status"] = BUILT
+                    node_lock = GraphLockFile.load(os.path.dirname(log_file), revisions_enabled)
+                    lock.graph_lock.update_lock(node_lock.graph_lock)
+                    lock.save(lockfile)
+                    for deps in pending.values():
+                        deps.discard(node_id)
+                    self._output.info("%s: Built in %.2fs" % (pref.ref, duration))
+                else:
+                    result["status"] = FAILED
+                    failed = True
+                    self._output.error("%s: Build failed in %.2fs, log file: %s\n%s"
+                                       % (pref.ref, duration, log_file, load(log_file)))
+                results.append(result)
+        finally:
+            pool.close()
+            pool.join()
+
+        for node_id in pending:
+            results.append({"id": node_id, "reference": repr(dag[node_id][0]),
+                            "duration": None, "log": None, "status": SKIPPED})
+        self._summary(results)
+        if failed:
+            raise ConanException("Failed building %s" % ", ".join(r["reference"] for r in results
+                                                                   if r["status"] == FAILED))
+        rmdir(tmp_folder)
+        return results
+
+    def _install(self, node_id, pref, node_folder):
+        ref = pref.ref.copy_clear_rev()
+        reference = repr(ref) if ref.user else "%s@" % repr(ref)
+        args = ["install", reference, "--build=%s" % ref.name, "--lockfile"]
+        cmd, env = conan_subprocess(self._cache_folder, [__name__, self._cache_folder] + args,
+                                    args)
+
+        mkdir(node_folder)
+        log_file = os.path.join(node_folder, "build.log")
+        start = time.time()
+        ret = None
+        if cmd:
+            try:
+                with open(log_file, "wb") as log:
+                    ret = subprocess.call(cmd, cwd=node_folder, env=env, stdout=log,
+                                          stderr=subprocess.STDOUT)
+            except OSError as e:
+                logger.debug("GRAPH_BUILD: Cannot launch %s: %s" % (cmd, str(e)))
+        if ret is None:
+            ret = self._install_in_process(args, node_folder, log_file)
+        return node_id, ret == 0, time.time() - start, log_file
+
+    def _install_in_process(self, args, node_folder, log_file):
+        from conans.client.command import Command
+        from conans.client.conan_api import Conan
+        from conans.client.output import ConanOutput
+
+        with _in_process_lock:
+            stream = StringIO()
+            old_curdir = get_cwd()
+            os.chdir(node_folder)
+            try:
+                conan = Conan(cache_folder=self._cache_folder, output=ConanOutput(stream))
+                ret = Command(conan).run(args)
+            except Exception as e:
+                stream.write("Error running the build: %s\n" % str(e))
+                ret = -1
+            finally:
+                os.chdir(old_curdir)
+                save(log_file, stream.getvalue())
+        return ret
+
+    def _summary(self, results):
+        self._output.info("Build summary:")
+        for result in results:
+            duration = "%.2fs" % result["duration"] if result["duration"] is not None else "-"
+            self._output.writeln("    %s (node %s): %s %s" % (result["reference"], result["id"],
+                                                             result["status"], duration))
+
+
+def _worker_main(args):
+    """ runs a conan command with the cache folder of the coordinator
+    """
+    from conans.client.command import Command
+    from conans.client.conan_api import Conan
+
+    cache_folder, args = args[0], args[1:]
+    command = Command(Conan(cache_folder=cache_folder))
+    sys.exit(command.run(args))
+
+
+if __name__ == "__main__":
+    _worker_main(sys.argv[1:])
@@ -4,6 +4,7 @@ import tarfile
 import time
 import traceback
 from collections import defaultdict
+from functools import partial
 from multiprocessing.pool import ThreadPool
 
 from conans.util import progress_bar
@@ -11,13 +12,14 @@ from conans.util.env_reader import get_env
 from conans.util.progress_bar import left_justify_message
 from conans.client.remote_manager import is_package_snapshot_complete, calc_files_checksum
 from conans.client.source import complete_recipe_sources
+from conans.client.tools.oss import cpu_count
 from conans.errors import ConanException, NotFoundException
 from conans.model.manifest import gather_files, FileTreeManifest
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
                           EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
 from conans.search.search import search_packages, search_recipes
-from conans.util.files import (load, clean_dirty, is_dirty,
+from conans.util.files import (load, clean_dirty, is_dirty, md5sum,
                                gzopen_without_timestamps, set_dirty_context_manager)
 from conans.util.log import logger
 from conans.util.tracer import (log_recipe_upload, log_compressed_files,
@@ -41,7 +43,8 @@ class CmdUpload(object):
         the errors (don't upload packages with policy=build_always, and computing
         the full REVISIONS for every that has to be uploaded.
         No remote API calls are done in this step, everything is local
-    - Execute the upload. For every ref:
+    - Execute the upload, with 'parallel_upload' threads (1 by default, 8 with --parallel),
+      "_upload_remote". For every ref:
         - Upload the recipe of the ref: "_upload_recipe"
             - If not FORCE, check the date "_check_recipe_date", i.e. if there are
               changes, do not allow uploading if the remote date is newer than the
@@ -54,9 +57,13 @@ class CmdUpload(object):
               based on the different with the remote snapshot "_recipe_files_to_upload"
               This can raise if upload policy is not overwrite
             - Execute the real transfer "remote_manager.upload_recipe()"
-        - For every package_id of every ref: "_upload_package"
-            - Gather files and create package.tgz. "_compress_package_files"
+        - For every package_id of the ref, biggest packages first:
+            - Gather files and create package.tgz. "_compress_package_files". With several
+              threads, this is done in a different pool, once the recipe is uploaded. An
+              existing package.tgz is reused, for any remote, while the checksums stored in
+              the metadata when it was uploaded match its manifest. "_stored_package_checksums"
             - (Optional) Do the integrity check of the package
+            - "_upload_package"
             - Decide which files to upload and delete from server:
               "_package_files_to_upload". Can raise if policy is NOT overwrite
             - Do the actual upload
@@ -77,7 +84,6 @@ class CmdUpload(object):
         self._remote_manager = remote_manager
         self._loader = loader
         self._hook_manager = hook_manager
-        self._upload_thread_pool = None
         self._exceptions_list = []
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
@@ -88,29 +94,17 @@ class CmdUpload(object):
         refs_by_remote = self._collect_packages_to_upload(refs, confirm, remotes, all_packages,
                                                           query, package_id)
 
+        threads = self._cache.config.parallel_upload
         if parallel_upload:
-            self._upload_thread_pool = ThreadPool(8)
+            threads = threads or 8
+        threads = threads or 1
+        if threads > 1:
             self._user_io.disable_input()
-        else:
-            self._upload_thread_pool = ThreadPool(1)
 
         for remote, refs in refs_by_remote.items():
             self._output.info("Uploading to remote '{}':".format(remote.name))
-
-            def upload_ref(ref_conanfile_prefs):
-                _ref, _conanfile, _prefs = ref_conanfile_prefs
-                try:
-                    self._upload_ref(_conanfile, _ref, _prefs, retry, retry_wait,
-                                     integrity_check, policy, remote, upload_recorder, remotes)
-                except BaseException as base_exception:
-                    base_trace = traceback.format_exc()
-                    self._exceptions_list.append((base_exception, _ref, base_trace))
-
-            self._upload_thread_pool.map(upload_ref,
-                                         [(ref, conanfile, prefs) for (ref, conanfile, prefs) in
-                                          refs])
-            self._upload_thread_pool.close()
-            self._upload_thread_pool.join()
+            self._upload_remote(refs, remote, threads, retry, retry_wait, integrity_check,
+                                policy, upload_recorder, remotes)
 
             if len(self._exceptions_list) > 0:
                 for exc, ref, trace in self._exceptions_list:
@@ -123,6 +117,101 @@ class CmdUpload(object):
 
         logger.debug("UPLOAD: Time manager upload: %f" % (time.time() - t1))
 
+    def _upload_remote(self, refs, remote, threads, retry, retry_wait, integrity_check, policy,
+                       upload_recorder, remotes):
+        """ uploads every recipe and then its packages, the biggest ones first, so they don't
+        start the last. With several threads, the recipes are uploaded concurrently and the
+        packages of every uploaded recipe are compressed in a different pool, so the compression
+        of the next packages is done while the previous ones are being transferred. With one,
+        everything is done sequentially
+        """
+        if threads > 1:
+            upload_pool = ThreadPool(threads)
+            compress_pool = ThreadPool(min(threads, cpu_count(self._output)))
+        else:
+            upload_pool = compress_pool = None
+
+        def compress_package(pref):
+            try:
+                return self._compress_package(pref, integrity_check, remote), None
+            except BaseException as exc:
+                return None, (exc, pref, traceback.format_exc())
+
+        def upload_package(package):
+            index, total, pref, get_compressed = package
+            up_msg = "\rUploading package %d/%d: %s to '%s'" % (index + 1, total, str(pref.id),
+                                                                remote.name)
+            self._output.info(left_justify_message(up_msg))
+            compressed, error = get_compressed()
+            if error:
+                return error
+            try:
+                the_files, checksums = compressed
+                self._upload_package(pref, the_files, checksums, retry, retry_wait, policy,
+                                     remote)
+                upload_recorder.add_package(pref, remote.name, remote.url)
+            except BaseException as pkg_exc:
+                return pkg_exc, pref, traceback.format_exc()
+
+        def upload_ref(ref_conanfile_prefs):
+            _ref, _conanfile, _prefs = ref_conanfile_prefs
+            try:
+                self._upload_ref(_conanfile, _ref, retry, retry_wait, policy, remote,
+                                 upload_recorder, remotes)
+            except BaseException as base_exception:
+                base_trace = traceback.format_exc()
+                self._exceptions_list.append((base_exception, _ref, base_trace))
+                return
+
+            def upload_package_callback(ret):
+                package_exceptions = [r for r in ret if r is not None]
+                self._exceptions_list.extend(package_exceptions)
+                if not package_exceptions:
+                    # FIXME: I think it makes no sense to specify a remote to "post_upload"
+                    # FIXME: because the recipe can have one and the package a different one
+                    conanfile_path = self._cache.package_layout(_ref).conanfile()
+                    self._hook_manager.execute("post_upload", conanfile_path=conanfile_path,
+                                               reference=_ref, remote=remote)
+
+            packages = sorted(enumerate(_prefs), key=lambda p: self._package_size(p[1]),
+                              reverse=True)
+            if compress_pool is None or not packages:
+                upload_package_callback([upload_package((index, len(_prefs), pref,
+                                                         partial(compress_package, pref)))
+                                         for index, pref in packages])
+            else:
+                packages = [(index, len(_prefs), pref,
+                             compress_pool.apply_async(compress_package, (pref, )).get)
+                            for index, pref in packages]
+                # This doesn't wait for the packages to end, so the function returns
+                # and the "pool entry" for the recipe is released
+                upload_pool.map_async(upload_package, packages, chunksize=1,
+                                      callback=upload_package_callback)
+
+        if upload_pool is None:
+            for ref_conanfile_prefs in refs:
+                upload_ref(ref_conanfile_prefs)
+            return
+
+        try:
+            upload_pool.map(upload_ref, refs, chunksize=1)
+        finally:
+            upload_pool.close()
+            upload_pool.join()
+            compress_pool.close()
+            compress_pool.join()
+
+    def _package_size(self, pref):
+        package_folder = self._cache.package_layout(pref.ref, short_paths=None).read_package(pref)
+        tgz_path = os.path.join(package_folder, PACKAGE_TGZ_NAME)
+        if os.path.isfile(tgz_path):
+            return os.path.getsize(tgz_path)
+        size = 0
+        for root, _, files in os.walk(package_folder):
+            size += sum(os.path.getsize(os.path.join(root, f)) for f in files
+                        if not os.path.islink(os.path.join(root, f)))
+        return size
+
     def _collects_refs_to_upload(self, package_id, reference_or_pattern, confirm):
         """ validate inputs and compute the refs (without revisions) to be uploaded
         """
@@ -218,9 +307,9 @@ class CmdUpload(object):
 
         return refs_by_remote
 
-    def _upload_ref(self, conanfile, ref, prefs, retry, retry_wait, integrity_check, policy,
-                    recipe_remote, upload_recorder, remotes):
-        """ Uploads the recipes and binaries identified by ref
+    def _upload_ref(self, conanfile, ref, retry, retry_wait, policy, recipe_remote,
+                    upload_recorder, remotes):
+        """ Uploads the recipe identified by ref, the binaries are uploaded later
         """
         assert (ref.revision is not None), "Cannot upload a recipe without RREV"
         conanfile_path = self._cache.package_layout(ref).conanfile()
@@ -233,45 +322,6 @@ class CmdUpload(object):
         self._upload_recipe(ref, conanfile, retry, retry_wait, policy, recipe_remote, remotes)
         upload_recorder.add_recipe(ref, recipe_remote.name, recipe_remote.url)
 
-        # Now the binaries
-        if prefs:
-            total = len(prefs)
-            p_remote = recipe_remote
-
-            def upload_package_index(index_pref):
-                index, pref = index_pref
-                try:
-                    up_msg = "\rUploading package %d/%d: %s to '%s'" % (index + 1, total,
-                                                                        str(pref.id),
-                                                                        p_remote.name)
-                    self._output.info(left_justify_message(up_msg))
-                    self._upload_package(pref, retry, retry_wait, integrity_check, policy, p_remote)
-                    upload_recorder.add_package(pref, p_remote.name, p_remote.url)
-                except BaseException as pkg_exc:
-                    trace = traceback.format_exc()
-                    return pkg_exc, pref, trace
-
-            def upload_package_callback(ret):
-                package_exceptions = [r for r in ret if r is not None]
-                self._exceptions_list.extend(package_exceptions)
-                if not package_exceptions:
-                    # FIXME: I think it makes no sense to specify a remote to "post_upload"
-                    # FIXME: because the recipe can have one and the package a different one
-                    self._hook_manager.execute("post_upload", conanfile_path=conanfile_path,
-                                               reference=ref, remote=recipe_remote)
-
-            # This doesn't wait for the packages to end, so the function returns
-            # and the "pool entry" for the recipe is released
-            self._upload_thread_pool.map_async(upload_package_index,
-                                               [(index, pref) for index, pref
-                                                in enumerate(prefs)],
-                                               callback=upload_package_callback)
-        else:
-            # FIXME: I think it makes no sense to specify a remote to "post_upload"
-            # FIXME: because the recipe can have one and the package a different one
-            self._hook_manager.execute("post_upload", conanfile_path=conanfile_path, reference=ref,
-                                       remote=recipe_remote)
-
     def _upload_recipe(self, ref, conanfile, retry, retry_wait, policy, remote, remotes):
 
         current_remote_name = self._cache.package_layout(ref).load_metadata().recipe.remote
@@ -328,52 +378,59 @@ class CmdUpload(object):
 
         return ref
 
-    def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
-                        policy=None, p_remote=None):
-
+    def _compress_package(self, pref, integrity_check, p_remote):
         assert (pref.revision is not None), "Cannot upload a package without PREV"
         assert (pref.ref.revision is not None), "Cannot upload a package without RREV"
 
-        pkg_layout = self._cache.package_layout(pref.ref)
-        conanfile_path = pkg_layout.conanfile()
+        conanfile_path = self._cache.package_layout(pref.ref).conanfile()
         self._hook_manager.execute("pre_upload_package", conanfile_path=conanfile_path,
                                    reference=pref.ref,
                                    package_id=pref.id,
                                    remote=p_remote)
+        return self._compress_package_files(pref, integrity_check)
 
+    def _upload_package(self, pref, the_files, checksums, retry=None, retry_wait=None,
+                        policy=None, p_remote=None):
         t1 = time.time()
-        the_files = self._compress_package_files(pref, integrity_check)
-
+        pkg_layout = self._cache.package_layout(pref.ref)
         if policy == UPLOAD_POLICY_SKIP:
+            # Nothing is uploaded, the package.tgz is kept for the next uploads
+            with pkg_layout.update_metadata() as metadata:
+                metadata.packages[pref.id].checksums = checksums
             return None
         files_to_upload, deleted = self._package_files_to_upload(pref, policy, the_files, p_remote)
 
         if files_to_upload or deleted:
             self._remote_manager.upload_package(pref, files_to_upload, deleted, p_remote, retry,
-                                                retry_wait)
+                                                retry_wait, checksums)
             logger.debug("UPLOAD: Time upload package: %f" % (time.time() - t1))
         else:
             self._output.info("Package is up to date, upload skipped")
 
         duration = time.time() - t1
         log_package_upload(pref, duration, the_files, p_remote)
-        self._hook_manager.execute("post_upload_package", conanfile_path=conanfile_path,
+        self._hook_manager.execute("post_upload_package", conanfile_path=pkg_layout.conanfile(),
                                    reference=pref.ref, package_id=pref.id, remote=p_remote)
 
         logger.debug("UPLOAD: Time uploader upload_package: %f" % (time.time() - t1))
 
-        # Update the package metadata
-        checksums = calc_files_checksum(the_files)
+        # Update the package metadata, the checksums are stored once the package.tgz has been
+        # uploaded, so it is reused by the next uploads
         with pkg_layout.update_metadata() as metadata:
+            metadata.packages[pref.id].checksums = checksums
             cur_package_remote = metadata.packages[pref.id].remote
             if not cur_package_remote:
                 metadata.packages[pref.id].remote = p_remote.name
-            metadata.packages[pref.id].checksums = checksums
 
         return pref
 
     def _compress_recipe_files(self, ref):
-        export_folder = self._cache.package_layout(ref).export()
+        layout = self._cache.package_layout(ref)
+        export_folder = layout.export()
+        # The compressed files are written next to the recipe, never in the secondary storage
+        if layout.read_export() != export_folder:
+            raise ConanException("Cannot upload recipe '%s', it is in the read-only secondary "
+                                 "storage" % str(ref))
 
         for f in (EXPORT_TGZ_NAME, EXPORT_SOURCES_TGZ_NAME):
             tgz_path = os.path.join(export_folder, f)
@@ -396,7 +453,11 @@ class CmdUpload(object):
 
         t1 = time.time()
         # existing package, will use short paths if defined
-        package_folder = self._cache.package_layout(pref.ref, short_paths=None).package(pref)
+        layout = self._cache.package_layout(pref.ref, short_paths=None)
+        package_folder = layout.package(pref)
+        if layout.read_package(pref) != package_folder:
+            raise ConanException("Cannot upload package '%s', it is in the read-only secondary "
+                                 "storage" % str(pref))
 
         if is_dirty(package_folder):
             raise ConanException("Package %s is corrupted, aborting upload.\n"
@@ -420,8 +481,31 @@ class CmdUpload(object):
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
 
+        checksums = None
+        if PACKAGE_TGZ_NAME in files:
+            checksums = self._stored_package_checksums(pref, files)
+            if checksums is None:
+                self._output.info("%s: Removing outdated %s" % (str(pref), PACKAGE_TGZ_NAME))
+                os.remove(files.pop(PACKAGE_TGZ_NAME))
+
         the_files = _compress_package_files(files, symlinks, package_folder, self._output)
-        return the_files
+        if checksums is None:
+            checksums = calc_files_checksum(the_files)
+        return the_files, checksums
+
+    def _stored_package_checksums(self, pref, files):
+        """ returns the checksums stored in the metadata when the existing package.tgz was
+        uploaded, or None if it wasn't or the package manifest or conaninfo changed since then,
+        so the package.tgz is outdated
+        """
+        metadata = self._cache.package_layout(pref.ref).load_metadata()
+        checksums = metadata.packages[pref.id].checksums
+        if PACKAGE_TGZ_NAME not in checksums:
+            return None
+        for f in (CONAN_MANIFEST, CONANINFO):
+            if checksums.get(f, {}).get("md5") != md5sum(files[f]):
+                return None
+        return checksums
 
     def _recipe_files_to_upload(self, ref, policy, the_files, remote, remote_manifest,
                                 local_manifest):
@@ -454,6 +454,12 @@ class Command(object):
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='Path to a json file where the install information will be '
                             'written')
+        parser.add_argument("-mpr", "--multi-profile", action="append",
+                            help='Install one configuration for each given value, a comma '
+                            'separated list of profiles, in a subfolder of the install folder. '
+                            'Recipes, version ranges and remote lookups are shared, e.g., '
+                            '-mpr=debug -mpr=release. The --profile ones are applied first to '
+                            'all of them')
 
         _add_common_install_arguments(parser, build_help=_help_build_policies.format("never"))
 
@@ -468,6 +474,7 @@ class Command(object):
             if not path_is_reference:
                 name, version, user, channel, _ = get_reference_fields(args.reference,
                                                                        user_channel_input=True)
+                multi_profile_names = [m.split(",") for m in args.multi_profile or []]
                 info = self._conan.install(path=args.path_or_reference,
                                            name=name, version=version, user=user, channel=channel,
                                            settings=args.settings, options=args.options,
@@ -479,8 +486,11 @@ class Command(object):
                                            update=args.update, generators=args.generator,
                                            no_imports=args.no_imports,
                                            install_folder=args.install_folder,
-                                           lockfile=args.lockfile)
+                                           lockfile=args.lockfile,
+                                           multi_profile_names=multi_profile_names)
             else:
+                if args.multi_profile:
+                    raise ConanException("--multi-profile can only be used to install a path")
                 if args.reference:
                     raise ConanException("A full reference was provided as first argument, second "
                                          "argument not allowed")
@@ -1088,6 +1098,9 @@ class Command(object):
                             help='Copy all packages from the specified package recipe')
         parser.add_argument("--force", action='store_true', default=False,
                             help='Override destination packages and the package recipe')
+        parser.add_argument("-r", "--remote", action=OnceArgument,
+                            help='Copy the recipe and packages in this remote, without '
+                                 'downloading or uploading them. The remote has to support it')
         args = parser.parse_args(*args)
 
         try:
@@ -1116,7 +1129,8 @@ class Command(object):
         self._warn_python_version()
 
         return self._conan.copy(reference=reference, user_channel=args.user_channel,
-                                force=args.force, packages=packages_list or args.all)
+                                force=args.force, packages=packages_list or args.all,
+                                remote_name=args.remote)
 
     def user(self, *args):
         """
@@ -1350,8 +1364,9 @@ class Command(object):
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='json file path where the upload information will be written to')
         parser.add_argument("--parallel", action='store_true', default=False,
-                            help='Upload files in parallel using multiple threads '
-                                 'The default number of launched threads is 8')
+                            help='Upload files in parallel using multiple threads. '
+                                 'The number of threads is defined by the "parallel_upload" '
+                                 'conan.conf variable, 8 by default')
 
         args = parser.parse_args(*args)
 
@@ -1760,6 +1775,73 @@ class Command(object):
                 self._out.writeln("    Path: %s" % v["path"])
                 self._out.writeln("    Layout: %s" % v["layout"])
 
+    def cache(self, *args):
+        """
+        Manages the local cache.
+
+        Use the subcommand 'gc' to remove the least recently used build folders, packages and
+        recipes, 'save' and 'restore' to copy recipes and packages to other caches with a bundle
+        file, and 'clean-trash' to delete the folders of the removed packages that are still in
+        the trash of the cache.
+        """
+        parser = argparse.ArgumentParser(description=self.cache.__doc__,
+                                         prog="conan cache",
+                                         formatter_class=SmartFormatter)
+        subparsers = parser.add_subparsers(dest='subcommand', help='sub-command help')
+        subparsers.required = True
+
+        gc_cmd = subparsers.add_parser('gc', help='Remove the least recently used build folders, '
+                                       'then packages and then recipes of the cache')
+        gc_cmd.add_argument("--max-size", action=OnceArgument,
+                            help="Remove until the cache is not bigger than this size, "
+                                 "e.g. 500M, 10G")
+        gc_cmd.add_argument("--older-than", action=OnceArgument,
+                            help="Remove the ones not used for this time, e.g. 12h, 30d, 2w")
+        gc_cmd.add_argument("--dry-run", default=False, action="store_true",
+                            help="Print what would be removed, without removing it")
+        gc_cmd.add_argument("--json", action=OnceArgument,
+                            help="json file path where the removed items will be written to")
+
+        save_cmd = subparsers.add_parser('save', help='Save recipes and packages, with their '
+                                         'metadata, to a bundle file')
+        save_cmd.add_argument('bundle', help='Path of the bundle file')
+        save_cmd.add_argument('references', nargs="*",
+                              help='References of the recipes to save with all their packages, '
+                                   'e.g.: mylib/1.X@user/channel, or package references to save '
+                                   'just that package, e.g.: mylib/1.X@user/channel:package_id')
+        save_cmd.add_argument("-l", "--lockfile", action=OnceArgument,
+                              help="Save the recipes and packages of this lockfile")
+        save_cmd.add_argument("-w", "--workers", type=int, action=OnceArgument,
+                              help="Number of packages compressed concurrently. Defaults to the "
+                                   "number of cpus")
+
+        restore_cmd = subparsers.add_parser('restore', help='Restore the recipes and packages of '
+                                            'a bundle file in the cache')
+        restore_cmd.add_argument('bundle', help='Path of the bundle file')
+        restore_cmd.add_argument("-f", "--force", default=False, action="store_true",
+                                 help="Replace the recipes of the cache with other revision")
+        restore_cmd.add_argument("-w", "--workers", type=int, action=OnceArgument,
+                                 help="Number of packages extracted concurrently. Defaults to "
+                                      "the number of cpus")
+
+        subparsers.add_parser('clean-trash', help='Delete the folders in the trash of the cache')
+
+        args = parser.parse_args(*args)
+
+        if args.subcommand == "gc":
+            evicted = self._conan.cache_gc(max_size=args.max_size, older_than=args.older_than,
+                                           dry_run=args.dry_run)
+            if args.json:
+                json_file = _make_abs_path(args.json)
+                save(json_file, json.dumps(evicted, indent=True))
+        elif args.subcommand == "save":
+            self._conan.cache_save(args.bundle, args.references, args.lockfile, args.workers)
+        elif args.subcommand == "restore":
+            self._conan.cache_restore(args.bundle, args.force, args.workers)
+        elif args.subcommand == "clean-trash":
+            deleted = self._conan.cache_clean_trash()
+            self._out.success("Removed %d folders from the trash" % deleted)
+
     def graph(self, *args):
         """
         Generates and manipulates lock files.
@@ -1782,6 +1864,17 @@ class Command(object):
         build_order_cmd.add_argument("--json", action=OnceArgument,
                                      help="generate output file in json format")
 
+        build_cmd = subparsers.add_parser('build', help='Builds the packages of a lockfile '
+                                          'with concurrent processes')
+        build_cmd.add_argument('lockfile', help='lockfile folder')
+        build_cmd.add_argument("-b", "--build", action=Extender, nargs="?",
+                               help=_help_build_policies.format("never"))
+        build_cmd.add_argument("-w", "--workers", type=int, action=OnceArgument,
+                               help="Number of packages built concurrently, by different "
+                                    "'conan install' processes. Defaults to the number of cpus")
+        build_cmd.add_argument("--json", action=OnceArgument,
+                               help="generate output file in json format")
+
         clean_cmd = subparsers.add_parser('clean-modified', help='Clean modified')
         clean_cmd.add_argument('lockfile', help='lockfile folder')
 
@@ -1806,6 +1899,11 @@ class Command(object):
             if args.json:
                 json_file = _make_abs_path(args.json)
                 save(json_file, json.dumps(build_order, indent=True))
+        elif args.subcommand == "build":
+            results = self._conan.graph_build(args.lockfile, args.build, args.workers)
+            if args.json:
+                json_file = _make_abs_path(args.json)
+                save(json_file, json.dumps(results, indent=True))
         elif args.subcommand == "clean-modified":
             self._conan.lock_clean_modified(args.lockfile)
         elif args.subcommand == "lock":
@@ -1828,7 +1926,7 @@ class Command(object):
                 ("Package development commands", ("source", "build", "package", "editable",
                                                   "workspace")),
                 ("Misc commands", ("profile", "remote", "user", "imports", "copy", "remove",
-                                   "alias", "download", "inspect", "help", "graph"))]
+                                   "alias", "download", "inspect", "help", "graph", "cache"))]
 
         def check_all_commands_listed():
             """Keep updated the main directory, raise if don't"""
@@ -9,10 +9,13 @@ from conans import __version__ as client_version
 from conans.client import packager
 from conans.client.cache.cache import ClientCache
 from conans.client.cmd.build import cmd_build
+from conans.client.cmd.cache_bundle import CacheBundler, bundle_references
+from conans.client.cmd.cache_gc import CacheGarbageCollector, parse_age, parse_size
 from conans.client.cmd.create import create
 from conans.client.cmd.download import download
 from conans.client.cmd.export import cmd_export, export_alias
 from conans.client.cmd.export_pkg import export_pkg
+from conans.client.cmd.graph_build import GraphBuildCoordinator, build_dag
 from conans.client.cmd.profile import (cmd_profile_create, cmd_profile_delete_key, cmd_profile_get,
                                        cmd_profile_list, cmd_profile_update)
 from conans.client.cmd.search import Search
@@ -30,10 +33,10 @@ from conans.client.hook_manager import HookManager
 from conans.client.importer import run_imports, undo_imports
 from conans.client.installer import BinaryInstaller
 from conans.client.loader import ConanFileLoader
-from conans.client.manager import deps_install
+from conans.client.manager import deps_install, deps_install_multi
 from conans.client.migrations import ClientMigrator
 from conans.client.output import ConanOutput, colorama_initialize
-from conans.client.profile_loader import profile_from_args, read_profile
+from conans.client.profile_loader import get_profile_path, profile_from_args, read_profile
 from conans.client.recorder.action_recorder import ActionRecorder
 from conans.client.recorder.search_recorder import SearchRecorder
 from conans.client.recorder.upload_recoder import UploadRecorder
@@ -46,6 +49,7 @@ from conans.client.runner import ConanRunner
 from conans.client.source import config_source_local
 from conans.client.store.localdb import LocalDB
 from conans.client.tools.env import environment_append
+from conans.client.tools.oss import cpu_count
 from conans.client.userio import UserIO
 from conans.errors import (ConanException, RecipeNotFoundException,
                            PackageNotFoundException, NoRestV2Available, NotFoundException)
@@ -89,6 +93,9 @@ def api_method(f):
                 pass
             raise
         finally:
+            # The answers of the remotes are written once per command
+            if api.app is not None:
+                api.app.cache.flush_remote_lookups()
             os.chdir(old_curdir)
     return wrapper
 
@@ -107,6 +114,14 @@ def _make_abs_path(path, cwd=None, default=None):
     return abs_path
 
 
+def _multi_config_folder_name(profile_names):
+    """ name of the install subfolder of one configuration of a multi-configuration install,
+    e.g. ["gcc", "../profiles/debug.txt"] => "gcc_debug"
+    """
+    names = [os.path.splitext(os.path.basename(p))[0] for p in profile_names or []]
+    return "_".join(names) or "default"
+
+
 def _get_conanfile_path(path, cwd, py):
     """
     param py= True: Must be .py, False: Must be .txt, None: Try .py, then .txt
@@ -530,7 +545,7 @@ class ConanAPIV1(object):
                 remote_name=None, verify=None, manifests=None,
                 manifests_interactive=None, build=None, profile_names=None,
                 update=False, generators=None, no_imports=False, install_folder=None, cwd=None,
-                lockfile=None):
+                lockfile=None, multi_profile_names=None):
 
         try:
             recorder = ActionRecorder()
@@ -538,6 +553,13 @@ class ConanAPIV1(object):
             manifests = _parse_manifests_arguments(verify, manifests, manifests_interactive, cwd)
             manifest_folder, manifest_interactive, manifest_verify = manifests
 
+            if multi_profile_names:
+                return self._install_multi(path, name, version, user, channel, settings, options,
+                                           env, remote_name, manifest_folder, manifest_verify,
+                                           manifest_interactive, build, profile_names,
+                                           multi_profile_names, update, generators, no_imports,
+                                           install_folder, cwd, lockfile, recorder)
+
             lockfile = _make_abs_path(lockfile, cwd) if lockfile else None
             graph_info = get_graph_info(profile_names, settings, options, env, cwd, None,
                                         self.app.cache, self.app.out,
@@ -567,6 +589,56 @@ class ConanAPIV1(object):
             exc.info = recorder.get_info(self.app.config.revisions_enabled)
             raise
 
+    def _install_multi(self, path, name, version, user, channel, settings, options, env,
+                       remote_name, manifest_folder, manifest_verify, manifest_interactive, build,
+                       profile_names, multi_profile_names, update, generators, no_imports,
+                       install_folder, cwd, lockfile, recorder):
+        """ install the same conanfile for several configurations. Every item of
+        multi_profile_names is a list of profiles (composed) defining one configuration,
+        installed in a subfolder of the install folder named after its profiles. The
+        profile_names are common to all the configurations, composed before their own profiles
+        """
+        if lockfile:
+            raise ConanException("Lockfiles cannot be used when installing multiple "
+                                 "configurations")
+        install_folder = _make_abs_path(install_folder, cwd)
+        conanfile_path = _get_conanfile_path(path, cwd, py=None)
+
+        configurations = []
+        config_folders = {}  # {profile paths: folder name}
+        for index, config_profile_names in enumerate(multi_profile_names):
+            config_profile_names = (profile_names or []) + (config_profile_names or [])
+            profile_paths = tuple(get_profile_path(p, self.app.cache.profiles_path, cwd)
+                                  for p in config_profile_names)
+            # The common profiles are the same for all of them, not in the name
+            config_folder = _multi_config_folder_name(multi_profile_names[index])
+            if profile_paths in config_folders:
+                raise ConanException("Duplicated configuration '%s'" % config_folder)
+            if config_folder in config_folders.values():
+                # Other profiles with the same names, e.g. "debug" and "../other/debug"
+                config_folder = "%s_%d" % (config_folder, index + 1)
+            config_folders[profile_paths] = config_folder
+            config_install_folder = os.path.join(install_folder, config_folder)
+            graph_info = get_graph_info(config_profile_names, settings, options, env, cwd, None,
+                                        self.app.cache, self.app.out,
+                                        name=name, version=version, user=user, channel=channel)
+            configurations.append((config_install_folder, graph_info))
+
+        remotes = self.app.load_remotes(remote_name=remote_name, update=update)
+        deps_install_multi(app=self.app,
+                           ref_or_path=conanfile_path,
+                           configurations=configurations,
+                           remotes=remotes,
+                           build_modes=build,
+                           update=update,
+                           manifest_folder=manifest_folder,
+                           manifest_verify=manifest_verify,
+                           manifest_interactive=manifest_interactive,
+                           generators=generators,
+                           no_imports=no_imports,
+                           recorder=recorder)
+        return recorder.get_info(self.app.config.revisions_enabled)
+
     @api_method
     def config_get(self, item):
         if item == "storage.path":
@@ -767,14 +839,20 @@ class ConanAPIV1(object):
                        packages_query=query, outdated=outdated)
 
     @api_method
-    def copy(self, reference, user_channel, force=False, packages=None):
+    def copy(self, reference, user_channel, force=False, packages=None, remote_name=None):
         """
         param packages: None=No binaries, True=All binaries, else list of IDs
+        param remote_name: copy them in this remote, instead of in the local cache
         """
-        from conans.client.cmd.copy import cmd_copy
+        from conans.client.cmd.copy import cmd_copy, cmd_remote_copy
+        ref = ConanFileReference.loads(reference)
+        if remote_name:
+            remote = self.get_remote_by_name(remote_name)
+            cmd_remote_copy(ref, user_channel, packages, remote, self.app.remote_manager,
+                            self.app.out, force=force)
+            return
         remotes = self.app.load_remotes()
         # FIXME: conan copy does not support short-paths in Windows
-        ref = ConanFileReference.loads(reference)
         cmd_copy(ref, user_channel, packages, self.app.cache,
                  self.app.user_io, self.app.remote_manager, self.app.loader, remotes, force=force)
 
@@ -998,6 +1076,38 @@ class ConanAPIV1(object):
     def remove_locks(self):
         self.app.cache.remove_locks()
 
+    @api_method
+    def cache_gc(self, max_size=None, older_than=None, dry_run=False):
+        max_size = parse_size(max_size) if max_size is not None else None
+        older_than = parse_age(older_than) if older_than is not None else None
+        collector = CacheGarbageCollector(self.app.cache, self.app.out)
+        return collector.collect(max_size=max_size, older_than=older_than, dry_run=dry_run)
+
+    @api_method
+    def cache_save(self, bundle, references=None, lockfile=None, workers=None, cwd=None):
+        """ saves the recipes and packages of the references or lockfile to a bundle file,
+        returns its manifest
+        """
+        cwd = cwd or os.getcwd()
+        bundle = _make_abs_path(bundle, cwd)
+        lockfile = _make_abs_path(lockfile, cwd) if lockfile else None
+        refs = bundle_references(references, lockfile, self.app.config.revisions_enabled)
+        return CacheBundler(self.app.cache, self.app.out, workers).save(bundle, refs)
+
+    @api_method
+    def cache_restore(self, bundle, force=False, workers=None, cwd=None):
+        """ restores the recipes and packages of a bundle file in the cache, returns
+        {"recipes", "packages", "skipped"}
+        """
+        bundle = _make_abs_path(bundle, cwd or os.getcwd())
+        if not os.path.isfile(bundle):
+            raise ConanException("Bundle file '%s' doesn't exist" % bundle)
+        return CacheBundler(self.app.cache, self.app.out, workers).restore(bundle, force)
+
+    @api_method
+    def cache_clean_trash(self):
+        return self.app.cache.trash.drain()
+
     @api_method
     def profile_list(self):
         return cmd_profile_list(self.app.cache.profiles_path, self.app.out)
@@ -1198,11 +1308,7 @@ class ConanAPIV1(object):
         old_lock.graph_lock.update_lock(new_lock.graph_lock)
         old_lock.save(old_lockfile)
 
-    @api_method
-    def build_order(self, lockfile, build=None, cwd=None):
-        cwd = cwd or os.getcwd()
-        lockfile = _make_abs_path(lockfile, cwd)
-
+    def _load_lock_graph(self, lockfile, build, cwd):
         recorder = ActionRecorder()
         remotes = self.app.load_remotes()
 
@@ -1217,12 +1323,32 @@ class ConanAPIV1(object):
 
         print_graph(deps_graph, self.app.out)
         graph_info.save_lock(lockfile)
+        return deps_graph
+
+    @api_method
+    def build_order(self, lockfile, build=None, cwd=None):
+        cwd = cwd or os.getcwd()
+        lockfile = _make_abs_path(lockfile, cwd)
+        deps_graph = self._load_lock_graph(lockfile, build, cwd)
         build_order = deps_graph.new_build_order()
         # Build order returns refs, we need to convert to flat python primitives
         for level in build_order:
             level[:] = [(id_, repr(pref)) for id_, pref in level]
         return build_order
 
+    @api_method
+    def graph_build(self, lockfile, build=None, workers=None, cwd=None):
+        """ builds the packages of the lockfile with concurrent 'conan install' processes,
+        returns the list of {"id", "reference", "status", "duration", "log"} of every package
+        """
+        cwd = cwd or os.getcwd()
+        lockfile = _make_abs_path(lockfile, cwd)
+        deps_graph = self._load_lock_graph(lockfile, build, cwd)
+        dag = build_dag(deps_graph)
+        workers = workers or cpu_count(output=self.app.out)
+        coordinator = GraphBuildCoordinator(self.app.cache.cache_folder, self.app.out, workers)
+        return coordinator.build(dag, lockfile, self.app.config.revisions_enabled)
+
     @api_method
     def lock_clean_modified(self, lockfile, cwd=None):
         cwd = cwd or os.getcwd()
@@ -139,7 +139,7 @@ class CommandOutputer(object):
             # Paths
             if isinstance(ref, ConanFileReference) and grab_paths:
                 package_layout = self._cache.package_layout(ref, conanfile.short_paths)
-                item_data["export_folder"] = package_layout.export()
+                item_data["export_folder"] = package_layout.read_export()
                 item_data["source_folder"] = package_layout.source()
                 # @todo: check if this is correct or if it must always be package_id
                 package_id = build_id(conanfile) or package_id
@@ -147,7 +147,7 @@ class CommandOutputer(object):
                 item_data["build_folder"] = package_layout.build(pref)
 
                 pref = PackageReference(ref, package_id)
-                item_data["package_folder"] = package_layout.package(pref)
+                item_data["package_folder"] = package_layout.read_package(pref)
 
             try:
                 reg_remote = self._cache.package_layout(ref).load_metadata().recipe.remote
@@ -136,6 +136,9 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
     # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
     # cache_no_locks = True               # environment CONAN_CACHE_NO_LOCKS
+    # How imports() and deploy copy the package files: copy, hardlink, reflink or symlink.
+    # The hard and symbolic linked files are the cache ones, they require read_only_cache
+    # imports_mode = copy                 # environment CONAN_IMPORTS_MODE
     # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
     # use_always_short_paths = False      # environment CONAN_USE_ALWAYS_SHORT_PATHS
     # skip_vs_projects_upgrade = False    # environment CONAN_SKIP_VS_PROJECTS_UPGRADE
@@ -167,6 +170,11 @@ _t_default_client_conf = Template(textwrap.dedent("""
 
     # cacert_path                         # environment CONAN_CACERT_PATH
     # scm_to_conandata                    # environment CONAN_SCM_TO_CONANDATA
+    # parallel_remote_lookup = False      # environment CONAN_PARALLEL_REMOTE_LOOKUP
+    # remote_lookups_ttl = 300            # environment CONAN_REMOTE_LOOKUPS_TTL (seconds)
+    # parallel_upload = 8                 # environment CONAN_PARALLEL_UPLOAD
+    # background_removal = False          # environment CONAN_BACKGROUND_REMOVAL
+    # package_info_cache = False          # environment CONAN_PACKAGE_INFO_CACHE
     {% if conan_v2 %}
     revisions_enabled = 1
     {% endif %}
@@ -176,6 +184,9 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
     # with "~/", will be relative to the conan user home, not to the system user home)
     path = ./data
+    # Storage of another cache, e.g. in a shared drive, that is used read-only for the recipes
+    # that are not in this one. Its packages are used in place and the new ones go to this cache
+    # secondary_path = /mnt/conan/data    # environment CONAN_SECONDARY_STORAGE_PATH
 
     [proxies]
     # Empty (or missing) section will try to use system proxies.
@@ -231,6 +242,7 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_VS_INSTALLATION_PREFERENCE", "vs_installation_preference", None),
             ("CONAN_CPU_COUNT", "cpu_count", None),
             ("CONAN_READ_ONLY_CACHE", "read_only_cache", None),
+            ("CONAN_IMPORTS_MODE", "imports_mode", None),
             ("CONAN_USER_HOME_SHORT", "user_home_short", None),
             ("CONAN_USE_ALWAYS_SHORT_PATHS", "use_always_short_paths", None),
             ("CONAN_VERBOSE_TRACEBACK", "verbose_traceback", None),
@@ -426,6 +438,40 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    @property
+    def parallel_upload(self):
+        try:
+            parallel = get_env("CONAN_PARALLEL_UPLOAD")
+            if parallel is None:
+                parallel = self.get_item("general.parallel_upload")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_upload'")
+
+    @property
+    def background_removal(self):
+        try:
+            background_removal = get_env("CONAN_BACKGROUND_REMOVAL")
+            if background_removal is None:
+                background_removal = self.get_item("general.background_removal")
+            return str(background_removal).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def package_info_cache(self):
+        try:
+            package_info_cache = get_env("CONAN_PACKAGE_INFO_CACHE")
+            if package_info_cache is None:
+                package_info_cache = self.get_item("general.package_info_cache")
+            return str(package_info_cache).lower() in ("1", "true")
+        except ConanException:
+            return False
+
     @property
     def download_cache(self):
         try:
@@ -444,6 +490,29 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return True if os.environ.get(CONAN_V2_MODE_ENVVAR, False) else False
 
+    @property
+    def parallel_remote_lookup(self):
+        try:
+            parallel_lookup = get_env("CONAN_PARALLEL_REMOTE_LOOKUP")
+            if parallel_lookup is None:
+                parallel_lookup = self.get_item("general.parallel_remote_lookup")
+            return str(parallel_lookup).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def remote_lookups_ttl(self):
+        try:
+            ttl = get_env("CONAN_REMOTE_LOOKUPS_TTL")
+            if ttl is None:
+                ttl = self.get_item("general.remote_lookups_ttl")
+        except ConanException:
+            return None
+        try:
+            return float(ttl) if ttl else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'remote_lookups_ttl'")
+
     @property
     def default_package_id_mode(self):
         try:
@@ -521,6 +590,20 @@ class ConanClientConfigParser(ConfigParser, object):
                 raise ConanException("Conan storage path has to be an absolute path")
         return result
 
+    @property
+    def secondary_storage_path(self):
+        try:
+            result = get_env("CONAN_SECONDARY_STORAGE_PATH")
+            if result is None:
+                result = self.get_item("storage.secondary_path")
+        except ConanException:
+            return None
+        if result:
+            result = conan_expand_user(result)
+            if not os.path.isabs(result):
+                raise ConanException("Conan secondary storage path has to be an absolute path")
+        return result or None
+
     @property
     def proxies(self):
         try:  # optional field, might not exist
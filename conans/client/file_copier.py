@@ -1,6 +1,10 @@
 import fnmatch
 import os
+import platform
+import re
 import shutil
+import stat
+import time
 from collections import defaultdict
 
 from conans.errors import ConanException
@@ -27,13 +31,174 @@ def report_copied_files(copied, output, message_suffix="Copied"):
     return True
 
 
+COPY_MODES = ("copy", "hardlink", "reflink", "symlink")
+# The files linked with these modes are the original ones, a reflink is a copy on write
+SHARED_COPY_MODES = ("hardlink", "symlink")
+
+_FICLONE = 0x40049409  # Linux ioctl to clone (reflink) the contents of a file
+
+
+def _reflink(src, dst):
+    if platform.system() != "Linux":
+        raise OSError("reflinks not supported")
+    import fcntl
+    with open(src, "rb") as src_file:
+        with open(dst, "wb") as dst_file:
+            try:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            except (IOError, OSError):
+                dst_file.close()
+                os.remove(dst)
+                raise
+    shutil.copystat(src, dst)
+
+
+def _make_file_read_only(path):
+    mode = os.stat(path).st_mode
+    os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def copy_file(src, dst, mode="copy", copy_function=None):
+    """ copies the src file to dst, creating a hard link, a reflink (copy on write clone) or a
+    symbolic link instead of a real copy if the mode says so. If the file system does not
+    support the link, a regular copy is done with the copy_function (shutil.copy2 by
+    default). The hard or symbolic linked files are made read-only, as modifying them would
+    modify the src file too
+    """
+    # Never write through an existing link, it would modify the original file
+    if mode != "copy" or os.path.islink(dst) or (os.path.isfile(dst) and
+                                                 os.stat(dst).st_nlink > 1):
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+    try:
+        if mode == "hardlink":
+            os.link(src, dst)
+            _make_file_read_only(src)
+            return
+        if mode == "symlink":
+            os.symlink(os.path.abspath(src), dst)  # @UndefinedVariable
+            _make_file_read_only(src)
+            return
+        if mode == "reflink":
+            _reflink(src, dst)
+            return
+    except (OSError, AttributeError):  # Cross-device, not supported or not in Windows py2
+        pass
+    (copy_function or shutil.copy2)(src, dst)
+
+
+_MATCHERS = {}  # {pattern: matcher}
+_MATCHERS_MAX_SIZE = 512
+
+
+def _matcher(pattern):
+    """ precompiled equivalent of fnmatch.fnmatch(name, pattern)
+    """
+    matcher = _MATCHERS.get(pattern)
+    if matcher is None:
+        match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+        def matcher(name):
+            return match(os.path.normcase(name)) is not None
+        if len(_MATCHERS) >= _MATCHERS_MAX_SIZE:
+            _MATCHERS.clear()
+        _MATCHERS[pattern] = matcher
+    return matcher
+
+
+class _FolderIndex(object):
+    """ the recursive listing (following symlinks) of a source folder, computed once and reused
+    by the different FileCopier calls over the same folder or over any of its subfolders.
+    Every listed directory stores its modification time, so if any of the walked ones has
+    changed (files or subfolders added or removed) since it was listed, the index is computed
+    again
+    """
+    # Timestamps resolution of some file systems, a directory modified closer than this to the
+    # moment it was checked might change again keeping its timestamp, so its contents are
+    # compared instead
+    _mtime_resolution = 2
+
+    def __init__(self, root, excluded_folders):
+        self.root = root
+        self._excluded_folders = excluded_folders
+        # [(dir, mtime, is_link, files, names)] in os.walk top-down order
+        self._entries = None
+        self._folders = None
+        self._timestamp = None  # When the entries were last listed or checked
+
+    def _load(self):
+        self._timestamp = time.time()
+        entries = []
+        for root, subfolders, files in walk(self.root, followlinks=True):
+            names = frozenset(subfolders + files)
+            if root in self._excluded_folders:
+                subfolders[:] = []
+                continue
+            basename = os.path.basename(root)
+            # Skip git or svn subfolders
+            if basename in [".git", ".svn"]:
+                subfolders[:] = []
+                continue
+            if basename == "test_package":  # DO NOT export test_package/build folder
+                try:
+                    subfolders.remove("build")
+                except ValueError:
+                    pass
+            try:
+                mtime = os.stat(root).st_mtime
+            except OSError:
+                mtime = None
+            entries.append((root, mtime, os.path.islink(root), files, names))
+        self._entries = entries
+        self._folders = set(e[0] for e in entries)
+
+    def _is_valid(self, entries):
+        """ if the given entries are still the contents of their directories """
+        timestamp = time.time()
+        recent = self._timestamp - self._mtime_resolution
+        for root, mtime, _, _, names in entries:
+            try:
+                if mtime is None or os.stat(root).st_mtime != mtime:
+                    return False
+                if mtime >= recent and frozenset(os.listdir(root)) != names:
+                    return False
+            except OSError:
+                return False
+        if len(entries) == len(self._entries):  # The other ones still have to be listed
+            self._timestamp = timestamp
+        return True
+
+    def contains(self, folder):
+        """ if the folder was listed in this index, not pruned, so it can be reused for it
+        """
+        return self._folders is not None and folder in self._folders
+
+    def walk(self, folder):
+        """ (dir, is_link, files) tuples, top-down, of the given folder, which is the root of
+        the index or any of its subfolders
+        """
+        prefix = folder + os.sep
+
+        def subtree():
+            return [e for e in self._entries if e[0] == folder or e[0].startswith(prefix)]
+
+        entries = subtree() if self._entries is not None else None
+        if entries is None or not self._is_valid(entries):
+            self._load()
+            entries = subtree()
+        for root, _, is_link, files, _ in entries:
+            yield root, is_link, files
+
+
 class FileCopier(object):
     """ main responsible of copying files from place to place:
     package: build folder -> package folder
     imports: package folder -> user folder
     export: user folder -> store "export" folder
     """
-    def __init__(self, source_folders, root_destination_folder):
+    def __init__(self, source_folders, root_destination_folder, indexes=None, copy_mode=None):
         """
         Takes the base folders to copy resources src -> dst. These folders names
         will not be used in the relative names while copying
@@ -41,11 +206,38 @@ class FileCopier(object):
                                   store build folder
         param root_destination_folder: The base folder to copy things to, typically the
                                        store package folder
+        param indexes: dict of the source folders listings, it can be shared among different
+                       FileCopier objects copying from the same folders
+        param copy_mode: one of COPY_MODES, to link the files instead of copying them
         """
         assert isinstance(source_folders, list), "source folders must be a list"
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
         self._copied = []
+        self._indexes = indexes if indexes is not None else {}
+        self._copy_mode = copy_mode or "copy"
+
+    def _folder_index(self, folder, excluded_folders):
+        """ returns the index of the given folder, or of the closest of its parent folders
+        already indexed with the same excluded folders
+        """
+        excluded_folders = [os.path.normpath(os.path.abspath(f)) for f in excluded_folders]
+
+        def excluded_in(root):  # Only the excluded folders inside the index root are relevant
+            return tuple(sorted(f for f in excluded_folders
+                                if f == root or f.startswith(root + os.sep)))
+
+        key = folder, excluded_in(folder)
+        index = self._indexes.get(key)
+        if index is None:
+            candidates = [i for (root, excluded), i in self._indexes.items()
+                          if i.contains(folder) and excluded == excluded_in(root)]
+            if candidates:
+                index = max(candidates, key=lambda i: len(i.root))
+            else:
+                index = _FolderIndex(*key)
+                self._indexes[key] = index
+        return index
 
     def report(self, output):
         return report_copied_files(self._copied, output)
@@ -95,15 +287,21 @@ class FileCopier(object):
         src = os.path.join(base_src, src)
         dst = os.path.join(self._dst_folder, dst)
 
+        # A trailing separator, as in the default src="", means the src folder itself is not
+        # considered a link even if it is
+        src_is_link = os.path.islink(src)
+        src = os.path.normpath(os.path.abspath(src))
+        folder_index = self._folder_index(src, excluded_folders)
         files_to_copy, link_folders = self._filter_files(src, pattern, symlinks, excludes,
-                                                         ignore_case, excluded_folders)
-        copied_files = self._copy_files(files_to_copy, src, dst, keep_path, symlinks)
+                                                         ignore_case, folder_index, src_is_link)
+        copied_files = self._copy_files(files_to_copy, src, dst, keep_path, symlinks,
+                                        self._copy_mode)
         self.link_folders(src, dst, link_folders)
         self._copied.extend(files_to_copy)
         return copied_files
 
     @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _filter_files(src, pattern, links, excludes, ignore_case, folder_index, src_is_link):
 
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
@@ -118,33 +316,25 @@ class FileCopier(object):
                 excludes = [e.lower() for e in excludes]
         else:
             excludes = []
+        excludes = [_matcher(e) for e in excludes]
 
-        for root, subfolders, files in walk(src, followlinks=True):
-            if root in excluded_folders:
-                subfolders[:] = []
+        pruned = None  # Index is top-down, the subfolders of a pruned one come right after it
+        for root, is_link, files in folder_index.walk(src):
+            if pruned is not None and root.startswith(pruned):
                 continue
+            pruned = None
 
-            if links and os.path.islink(root):
+            if root == src:
+                is_link = src_is_link
+            if links and is_link:
                 linked_folders.append(os.path.relpath(root, src))
-                subfolders[:] = []
+                pruned = root + os.sep
                 continue
-            basename = os.path.basename(root)
-            # Skip git or svn subfolders
-            if basename in [".git", ".svn"]:
-                subfolders[:] = []
-                continue
-            if basename == "test_package":  # DO NOT export test_package/build folder
-                try:
-                    subfolders.remove("build")
-                except ValueError:
-                    pass
 
             relative_path = os.path.relpath(root, src)
-            for exclude in excludes:
-                if fnmatch.fnmatch(relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
-                    break
+            if any(exclude(relative_path) for exclude in excludes):
+                pruned = root + os.sep
+                continue
             for f in files:
                 relative_name = os.path.normpath(os.path.join(relative_path, f))
                 filenames.append(relative_name)
@@ -153,9 +343,10 @@ class FileCopier(object):
             filenames = {f.lower(): f for f in filenames}
             pattern = pattern.lower()
 
-        files_to_copy = fnmatch.filter(filenames, pattern)
+        match = _matcher(pattern)
+        files_to_copy = [f for f in filenames if match(f)]
         for exclude in excludes:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f, exclude)]
+            files_to_copy = [f for f in files_to_copy if not exclude(f)]
 
         if ignore_case:
             files_to_copy = [filenames[f] for f in files_to_copy]
@@ -209,7 +400,7 @@ class FileCopier(object):
                     base_path = os.path.dirname(base_path)
 
     @staticmethod
-    def _copy_files(files, src, dst, keep_path, symlinks):
+    def _copy_files(files, src, dst, keep_path, symlinks, copy_mode="copy"):
         """ executes a multiple file copy from [(src_file, dst_file), (..)]
         managing symlinks if necessary
         """
@@ -230,6 +421,6 @@ class FileCopier(object):
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
             else:
-                shutil.copy2(abs_src_name, abs_dst_name)
+                copy_file(abs_src_name, abs_dst_name, copy_mode)
             copied_files.append(abs_dst_name)
         return copied_files
@@ -3,6 +3,8 @@ import os
 import shutil
 import time
 
+from conans.client.file_copier import copy_file
+from conans.client.importer import imports_mode
 from conans.model import Generator
 from conans.model.manifest import FileTreeManifest
 from conans.paths import BUILD_INFO_DEPLOY
@@ -29,6 +31,7 @@ class DeployGenerator(Generator):
     @property
     def content(self):
         copied_files = []
+        copy_mode = imports_mode()
 
         for dep_name in self.conanfile.deps_cpp_info.deps:
             rootpath = self.conanfile.deps_cpp_info[dep_name].rootpath
@@ -41,6 +44,6 @@ class DeployGenerator(Generator):
                                        os.path.relpath(root, rootpath), f)
                     dst = os.path.normpath(dst)
                     mkdir(os.path.dirname(dst))
-                    shutil.copy(src, dst)
+                    copy_file(src, dst, copy_mode, copy_function=shutil.copy)
                     copied_files.append(dst)
         return self.deploy_manifest_content(copied_files)
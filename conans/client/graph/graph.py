@@ -27,6 +27,7 @@ CONTEXT_BUILD = "build"
 
 
 class _NodeOrderedDict(object):
+    __slots__ = ("_nodes",)
 
     def __init__(self):
         self._nodes = OrderedDict()
@@ -59,6 +60,12 @@ class _NodeOrderedDict(object):
 
 
 class Node(object):
+    __slots__ = ("ref", "path", "_package_id", "prev", "conanfile", "dependencies", "dependants",
+                 "binary", "binary_non_skip", "recipe", "remote", "binary_remote",
+                 "revision_pinned", "context", "_public_deps", "_public_closure",
+                 "_transitive_closure", "inverse_closure", "ancestors", "_id", "graph_lock_node",
+                 "id_direct_prefs", "id_indirect_prefs")
+
     def __init__(self, ref, conanfile, context, recipe=None, path=None):
         self.ref = ref
         self.path = path  # path to the consumer conanfile.xx for consumer, None otherwise
@@ -68,6 +75,7 @@ class Node(object):
         self.dependencies = []  # Ordered Edges
         self.dependants = set()  # Edges
         self.binary = None
+        self.binary_non_skip = None  # The binary of the node before being skipped
         self.recipe = recipe
         self.remote = None
         self.binary_remote = None
@@ -86,6 +94,9 @@ class Node(object):
         self.ancestors = None  # set{ref.name}
         self._id = None  # Unique ID (uuid at the moment) of a node in the graph
         self.graph_lock_node = None  # the locking information can be None
+        # The package references that define the package_id, for the fixed package_id mode
+        self.id_direct_prefs = None
+        self.id_indirect_prefs = None
 
     @property
     def id(self):
@@ -213,6 +224,8 @@ class Node(object):
 
 
 class Edge(object):
+    __slots__ = ("src", "dst", "require")
+
     def __init__(self, src, dst, require):
         self.src = src
         self.dst = dst
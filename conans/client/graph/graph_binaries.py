@@ -1,5 +1,6 @@
 import os
 
+from conans.client.cache.remote_lookups import LATEST_REVISION
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
@@ -72,6 +73,11 @@ class GraphBinariesAnalyzer(object):
 
     def _evaluate_cache_pkg(self, node, package_layout, pref, metadata, remote, remotes, update,
                             package_folder):
+        if update and node.graph_lock_node and self._cache.config.revisions_enabled:
+            # A package revision locked by a lockfile cannot change, no need to check the remotes
+            metadata = metadata or package_layout.load_metadata()
+            if pref.revision and pref.revision == metadata.packages[pref.id].revision:
+                update = False
         if update:
             output = node.conanfile.output
             if remote:
@@ -96,11 +102,29 @@ class GraphBinariesAnalyzer(object):
             node.prev = metadata.packages[pref.id].revision
             assert node.prev, "PREV for %s is None: %s" % (str(pref), metadata.dumps())
 
-    def _evaluate_remote_pkg(self, node, pref, remote, remotes):
+    def _get_package_info(self, pref, remote, update):
+        # The latest package revision known from previous commands is used unless updating
+        remote_lookups = self._cache.remote_lookups
+        if pref.revision or update:
+            return self._remote_manager.get_package_info(pref, remote)
+        latest = remote_lookups.get(LATEST_REVISION, remote, pref.full_str())
+        try:
+            info, new_pref = self._remote_manager.get_package_info(
+                pref.copy_with_revs(pref.ref.revision, latest) if latest else pref, remote)
+        except NotFoundException:
+            if not latest:
+                raise
+            # The known latest revision might have been removed from the remote
+            remote_lookups.remove(LATEST_REVISION, remote, pref.full_str())
+            info, new_pref = self._remote_manager.get_package_info(pref, remote)
+        remote_lookups.set(LATEST_REVISION, remote, pref.full_str(), new_pref.revision)
+        return info, new_pref
+
+    def _evaluate_remote_pkg(self, node, pref, remote, remotes, update):
         remote_info = None
         if remote:
             try:
-                remote_info, pref = self._remote_manager.get_package_info(pref, remote)
+                remote_info, pref = self._get_package_info(pref, remote, update)
             except NotFoundException:
                 pass
             except Exception:
@@ -112,7 +136,7 @@ class GraphBinariesAnalyzer(object):
         if not remote or (not remote_info and self._cache.config.revisions_enabled):
             for r in remotes.values():
                 try:
-                    remote_info, pref = self._remote_manager.get_package_info(pref, r)
+                    remote_info, pref = self._get_package_info(pref, r, update)
                 except NotFoundException:
                     pass
                 else:
@@ -207,6 +231,9 @@ class GraphBinariesAnalyzer(object):
         package_layout = self._cache.package_layout(pref.ref, short_paths=conanfile.short_paths)
         package_folder = package_layout.package(pref)
         metadata = self._evaluate_clean_pkg_folder_dirty(node, package_layout, package_folder, pref)
+        # Builds and downloads always go to the local cache, the existing binary can be read from
+        # the secondary storage
+        package_folder = package_layout.read_package(pref)
 
         remote = remotes.selected
         if not remote:
@@ -222,7 +249,7 @@ class GraphBinariesAnalyzer(object):
             recipe_hash = None
         else:  # Binary does NOT exist locally
             # Returned remote might be different than the passed one if iterating remotes
-            recipe_hash, remote = self._evaluate_remote_pkg(node, pref, remote, remotes)
+            recipe_hash, remote = self._evaluate_remote_pkg(node, pref, remote, remotes, update)
 
         if build_mode.outdated:
             if node.binary in (BINARY_CACHE, BINARY_DOWNLOAD, BINARY_UPDATE):
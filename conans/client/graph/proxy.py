@@ -1,14 +1,18 @@
 import os
+from multiprocessing.pool import ThreadPool
 
 from requests.exceptions import RequestException
 
+from conans import DEFAULT_REVISION_V1
+from conans.client.cache.remote_lookups import LATEST_REVISION, NOT_FOUND
 from conans.client.graph.graph import (RECIPE_DOWNLOADED, RECIPE_INCACHE, RECIPE_NEWER,
                                        RECIPE_NOT_IN_REMOTE, RECIPE_NO_REMOTE, RECIPE_UPDATEABLE,
                                        RECIPE_UPDATED, RECIPE_EDITABLE)
 from conans.client.output import ScopedOutput
 from conans.client.recorder.action_recorder import INSTALL_ERROR_MISSING, INSTALL_ERROR_NETWORK
 from conans.client.remover import DiskRemover
-from conans.errors import ConanException, NotFoundException, RecipeNotFoundException
+from conans.errors import ConanException, NotFoundException, NoRestV2Available, \
+    RecipeNotFoundException
 from conans.paths.package_layouts.package_editable_layout import PackageEditableLayout
 from conans.util.tracer import log_recipe_got_from_local_cache
 
@@ -20,7 +24,7 @@ class ConanProxy(object):
         self._out = output
         self._remote_manager = remote_manager
 
-    def get_recipe(self, ref, check_updates, update, remotes, recorder):
+    def get_recipe(self, ref, check_updates, update, remotes, recorder, locked=False):
         layout = self._cache.package_layout(ref)
         if isinstance(layout, PackageEditableLayout):
             conanfile_path = layout.conanfile()
@@ -30,8 +34,10 @@ class ConanProxy(object):
             return conanfile_path, status, None, ref
 
         with layout.conanfile_write_lock(self._out):
-            result = self._get_recipe(layout, ref, check_updates, update, remotes, recorder)
+            result = self._get_recipe(layout, ref, check_updates, update, remotes, recorder,
+                                      locked)
             conanfile_path, status, remote, new_ref = result
+            layout.record_usage()
 
             if status not in (RECIPE_DOWNLOADED, RECIPE_UPDATED):
                 log_recipe_got_from_local_cache(new_ref)
@@ -39,7 +45,7 @@ class ConanProxy(object):
 
         return conanfile_path, status, remote, new_ref
 
-    def _get_recipe(self, layout, ref, check_updates, update, remotes, recorder):
+    def _get_recipe(self, layout, ref, check_updates, update, remotes, recorder, locked):
         output = ScopedOutput(str(ref), self._out)
         # check if it is in disk
         conanfile_path = layout.conanfile()
@@ -47,7 +53,7 @@ class ConanProxy(object):
         # NOT in disk, must be retrieved from remotes
         if not os.path.exists(conanfile_path):
             remote, new_ref = self._download_recipe(layout, ref, output, remotes, remotes.selected,
-                                                    recorder)
+                                                    recorder, check_updates or update)
             status = RECIPE_DOWNLOADED
             return conanfile_path, status, remote, new_ref
 
@@ -62,14 +68,15 @@ class ConanProxy(object):
         if requested_different_revision:
             if check_updates:
                 remote, new_ref = self._download_recipe(layout, ref, output, remotes,
-                                                        selected_remote, recorder)
+                                                        selected_remote, recorder, check_updates)
                 status = RECIPE_DOWNLOADED
                 return conanfile_path, status, remote, new_ref
             else:
                 raise NotFoundException("The recipe in the local cache doesn't match the specified "
                                         "revision. Use '--update' to check in the remote.")
 
-        if not check_updates:
+        # A revision locked by a lockfile cannot change, no need to check the remotes
+        if not check_updates or (locked and ref.revision is not None):
             status = RECIPE_INCACHE
             ref = ref.copy_with_rev(cur_revision)
             return conanfile_path, status, cur_remote, ref
@@ -93,9 +100,8 @@ class ConanProxy(object):
                 if update:
                     DiskRemover().remove_recipe(layout, output=output)
                     output.info("Retrieving from remote '%s'..." % selected_remote.name)
-                    self._download_recipe(layout, ref, output, remotes, selected_remote, recorder)
-                    with layout.update_metadata() as metadata:
-                        metadata.recipe.remote = selected_remote.name
+                    self._download_recipe(layout, ref, output, remotes, selected_remote, recorder,
+                                          update)
                     status = RECIPE_UPDATED
                     return conanfile_path, status, selected_remote, ref
                 else:
@@ -108,15 +114,31 @@ class ConanProxy(object):
         ref = ref.copy_with_rev(cur_revision)
         return conanfile_path, status, selected_remote, ref
 
-    def _download_recipe(self, layout, ref, output, remotes, remote, recorder):
+    def _download_recipe(self, layout, ref, output, remotes, remote, recorder, update):
+        # The answers of the remotes to previous commands are used unless updating
+        remote_lookups = self._cache.remote_lookups
 
-        def _retrieve_from_remote(the_remote):
+        def _retrieve_from_remote(the_remote, found_ref=None):
             output.info("Trying with '%s'..." % the_remote.name)
             # If incomplete, resolve the latest in server
-            _ref = self._remote_manager.get_recipe(ref, the_remote)
+            if found_ref:  # Already resolved by the concurrent lookup
+                _ref = self._remote_manager.get_recipe(found_ref, the_remote)
+            elif ref.revision or update:
+                _ref = self._remote_manager.get_recipe(ref, the_remote)
+            else:
+                latest = remote_lookups.get(LATEST_REVISION, the_remote, str(ref))
+                try:
+                    _ref = self._remote_manager.get_recipe(ref.copy_with_rev(latest) if latest
+                                                           else ref, the_remote)
+                except NotFoundException:
+                    if not latest:
+                        raise
+                    # The known latest revision might have been removed from the remote
+                    remote_lookups.remove(LATEST_REVISION, the_remote, str(ref))
+                    _ref = self._remote_manager.get_recipe(ref, the_remote)
+            if not ref.revision:
+                remote_lookups.set(LATEST_REVISION, the_remote, str(ref), _ref.revision)
             output.info("Downloaded recipe revision %s" % _ref.revision)
-            with layout.update_metadata() as metadata:
-                metadata.recipe.remote = the_remote.name
             recorder.recipe_downloaded(ref, the_remote.url)
             return _ref
 
@@ -151,15 +173,65 @@ class ConanProxy(object):
         remotes = remotes.values()
         if not remotes:
             raise ConanException("No remote defined")
-        for remote in remotes:
+        if not update:
+            remotes = [r for r in remotes
+                       if not remote_lookups.get(NOT_FOUND, r, ref.full_str())]
+        if len(remotes) > 1 and self._cache.config.parallel_remote_lookup:
+            lookups = self._lookup_remotes(ref, remotes)
+        else:
+            lookups = [(r, None) for r in remotes]
+        for remote, found_ref in lookups:
             try:
-                new_ref = _retrieve_from_remote(remote)
+                new_ref = _retrieve_from_remote(remote, found_ref)
                 return remote, new_ref
             # If not found continue with the next, else raise
             except NotFoundException:
-                pass
+                remote_lookups.set(NOT_FOUND, remote, ref.full_str(), True)
         else:
             msg = "Unable to find '%s' in remotes" % ref.full_str()
             recorder.recipe_install_error(ref, INSTALL_ERROR_MISSING,
                                           msg, None)
             raise NotFoundException(msg)
+
+    def _lookup_remotes(self, ref, remotes):
+        """ Checks concurrently in which remotes the recipe exists, and returns the remotes to
+        retrieve it from, in priority order, starting with the first one that has it, together
+        with the reference resolved in it (None for the following ones). Errors different to a
+        NotFoundException are raised as in the sequential lookup
+        """
+        def _check_remote(remote):
+            try:
+                return self._find_recipe_revision(ref, remote), None
+            except NotFoundException:
+                return None, None
+            except Exception as exc:
+                return None, exc
+
+        pool = ThreadPool(len(remotes))
+        try:
+            # imap() yields in the remotes order, as soon as the preceding ones are resolved
+            results = pool.imap(_check_remote, remotes)
+            for index, (found_ref, error) in enumerate(results):
+                if error is not None:
+                    raise error
+                if found_ref is not None:
+                    return [(remotes[index], found_ref)] + [(r, None) for r in remotes[index + 1:]]
+                self._cache.remote_lookups.set(NOT_FOUND, remotes[index], ref.full_str(), True)
+            return []
+        finally:
+            # Do not wait for the lower priority remotes once the result is known
+            pool.close()
+
+    def _find_recipe_revision(self, ref, remote):
+        """ the reference with the revision the remote has, without downloading any file, or
+        None if the remote doesn't have the recipe
+        """
+        if ref.revision is None:
+            try:
+                return self._remote_manager.get_latest_recipe_revision(ref, remote)
+            except NoRestV2Available:
+                ref = ref.copy_with_rev(DEFAULT_REVISION_V1)
+        # The snapshot is the list of files of the recipe, empty if it doesn't exist
+        if self._remote_manager.get_recipe_snapshot(ref, remote):
+            return ref
+        return None
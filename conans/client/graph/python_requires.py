@@ -129,7 +129,8 @@ class PyRequireLoader(object):
 
     def _load_pyreq_conanfile(self, loader, lock_python_requires, ref):
         recipe = self._proxy.get_recipe(ref, self._check_updates, self._update,
-                                        remotes=self._remotes, recorder=ActionRecorder())
+                                        remotes=self._remotes, recorder=ActionRecorder(),
+                                        locked=lock_python_requires is not None)
         path, _, _, new_ref = recipe
         conanfile, module = loader.load_basic_module(path, lock_python_requires, user=new_ref.user,
                                                      channel=new_ref.channel)
@@ -180,7 +181,8 @@ class ConanPythonRequire(object):
             ref = requirement.ref
             result = self._proxy.get_recipe(ref, self._check_updates, self._update,
                                             remotes=self._remotes,
-                                            recorder=ActionRecorder())
+                                            recorder=ActionRecorder(),
+                                            locked=self.locked_versions is not None)
             path, _, _, new_ref = result
             module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self)
 
@@ -190,8 +192,8 @@ class ConanPythonRequire(object):
                 python_require = self._look_for_require(conanfile.alias)
             else:
                 package_layout = self._proxy._cache.package_layout(new_ref, conanfile.short_paths)
-                exports_sources_folder = package_layout.export_sources()
-                exports_folder = package_layout.export()
+                exports_sources_folder = package_layout.read_export_sources()
+                exports_folder = package_layout.read_export()
                 python_require = PythonRequire(new_ref, module, conanfile,
                                                exports_folder, exports_sources_folder)
             self._cached_requires[ref] = python_require
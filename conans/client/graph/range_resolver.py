@@ -1,5 +1,6 @@
 import re
 
+from conans.client.cache.remote_lookups import SEARCH
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
 from conans.search.search import search_recipes
@@ -119,7 +120,8 @@ class RangeResolver(object):
         search_ref = ConanFileReference(ref.name, "*", ref.user, ref.channel)
 
         if update:
-            resolved_ref, remote_name = self._resolve_remote(search_ref, version_range, remotes)
+            resolved_ref, remote_name = self._resolve_remote(search_ref, version_range, remotes,
+                                                             update)
             if not resolved_ref:
                 remote_name = None
                 resolved_ref = self._resolve_local(search_ref, version_range)
@@ -127,7 +129,8 @@ class RangeResolver(object):
             remote_name = None
             resolved_ref = self._resolve_local(search_ref, version_range)
             if not resolved_ref:
-                resolved_ref, remote_name = self._resolve_remote(search_ref, version_range, remotes)
+                resolved_ref, remote_name = self._resolve_remote(search_ref, version_range,
+                                                                 remotes, update)
 
         origin = ("remote '%s'" % remote_name) if remote_name else "local cache"
         if resolved_ref:
@@ -147,11 +150,21 @@ class RangeResolver(object):
         if local_found:
             return self._resolve_version(version_range, local_found)
 
-    def _search_remotes(self, search_ref, remotes):
+    def _search_remote(self, remote, search_ref, update):
+        # The answers of previous commands are used unless updating
+        remote_lookups = self._cache.remote_lookups
+        search_result = None if update else remote_lookups.get(SEARCH, remote, search_ref.name)
+        if search_result is not None:
+            return [ConanFileReference.loads(r) for r in search_result]
+        search_result = self._remote_manager.search_recipes(remote, search_ref.name,
+                                                            ignorecase=False)
+        remote_lookups.set(SEARCH, remote, search_ref.name, [r.full_str() for r in search_result])
+        return search_result
+
+    def _search_remotes(self, search_ref, remotes, update):
         for remote in remotes.values():
             if not remotes.selected or remote == remotes.selected:
-                search_result = self._remote_manager.search_recipes(remote, search_ref.name,
-                                                                    ignorecase=False)
+                search_result = self._search_remote(remote, search_ref, update)
                 search_result = [ref for ref in search_result
                                  if ref.user == search_ref.user and
                                  ref.channel == search_ref.channel]
@@ -159,12 +172,12 @@ class RangeResolver(object):
                     return search_result, remote.name
         return None, None
 
-    def _resolve_remote(self, search_ref, version_range, remotes):
+    def _resolve_remote(self, search_ref, version_range, remotes, update):
         # We should use ignorecase=False, we want the exact case!
         found_refs, remote_name = self._cached_remote_found.get(search_ref, (None, None))
         if found_refs is None:
             # Searching for just the name is much faster in remotes like Artifactory
-            found_refs, remote_name = self._search_remotes(search_ref, remotes)
+            found_refs, remote_name = self._search_remotes(search_ref, remotes, update)
             if found_refs:
                 self._result.append("%s versions found in '%s' remote" % (search_ref, remote_name))
             else:
@@ -5,7 +5,8 @@ import stat
 import time
 
 from conans.client import tools
-from conans.client.file_copier import FileCopier, report_copied_files
+from conans.client.file_copier import COPY_MODES, SHARED_COPY_MODES, FileCopier, \
+    report_copied_files
 from conans.client.output import ScopedOutput
 from conans.errors import ConanException
 from conans.model.conan_file import get_env_context_manager
@@ -68,9 +69,29 @@ def _make_files_writable(file_names):
         return
 
     for file_name in file_names:
+        # Linked files share the permissions with the cache ones, that have to stay read-only
+        if os.path.islink(file_name) or os.stat(file_name).st_nlink > 1:
+            continue
         os.chmod(file_name, os.stat(file_name).st_mode | stat.S_IWRITE)
 
 
+def imports_mode():
+    """ how the files are imported or deployed from the packages: a regular copy, or a hard
+    link, reflink or symbolic link to the package file, falling back to a copy when the file
+    system does not support it. Hard and symbolic linked files are the cache ones, so they
+    are only allowed for read-only caches
+    """
+    mode = get_env("CONAN_IMPORTS_MODE", "copy")
+    if mode not in COPY_MODES:
+        raise ConanException("Invalid imports mode '%s', allowed values: %s"
+                             % (mode, ", ".join(COPY_MODES)))
+    if mode in SHARED_COPY_MODES and not get_env("CONAN_READ_ONLY_CACHE", False):
+        raise ConanException("Imports mode '%s' requires a read-only cache "
+                             "(general.read_only_cache), modifying the imported files would "
+                             "modify the cache packages" % mode)
+    return mode
+
+
 def run_imports(conanfile, dest_folder):
     if not hasattr(conanfile, "imports"):
         return []
@@ -100,11 +121,14 @@ def run_deploy(conanfile, install_folder):
     deploy_output = ScopedOutput("%s deploy()" % conanfile.display_name, conanfile.output)
     file_importer = _FileImporter(conanfile, install_folder)
     package_copied = set()
+    indexes = {}  # The package folder is listed once for all the copy() calls
+    copy_mode = imports_mode()
 
     # This is necessary to capture FileCopier full destination paths
     # Maybe could be improved in FileCopier
     def file_copier(*args, **kwargs):
-        file_copy = FileCopier([conanfile.package_folder], install_folder)
+        file_copy = FileCopier([conanfile.package_folder], install_folder, indexes=indexes,
+                               copy_mode=copy_mode)
         copied = file_copy(*args, **kwargs)
         _make_files_writable(copied)
         package_copied.update(copied)
@@ -135,6 +159,9 @@ class _FileImporter(object):
         self._conanfile = conanfile
         self._dst_folder = dst_folder
         self.copied_files = set()
+        # Listings of the packages folders, shared by all the calls
+        self._indexes = {}
+        self._copy_mode = imports_mode()
 
     def __call__(self, pattern, dst="", src="", root_package=None, folder=False,
                  ignore_case=False, excludes=None, keep_path=True):
@@ -160,7 +187,8 @@ class _FileImporter(object):
         src_dirs = [src]  # hardcoded src="bin" origin
         for pkg_name, cpp_info in pkgs:
             final_dst_path = os.path.join(real_dst_folder, pkg_name) if folder else real_dst_folder
-            file_copier = FileCopier([cpp_info.rootpath], final_dst_path)
+            file_copier = FileCopier([cpp_info.rootpath], final_dst_path, indexes=self._indexes,
+                                     copy_mode=self._copy_mode)
             if symbolic_dir_name:  # Syntax for package folder symbolic names instead of hardcoded
                 try:
                     src_dirs = getattr(cpp_info, symbolic_dir_name)
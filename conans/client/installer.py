@@ -5,6 +5,7 @@ from multiprocessing.pool import ThreadPool
 
 from conans.client import tools
 from conans.client.build.build import run_build_method
+from conans.client.cache.package_info import PackageInfoCache
 from conans.client.file_copier import report_copied_files
 from conans.client.generators import TXTGenerator, write_generators
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
@@ -90,8 +91,8 @@ class _PackageBuilder(object):
 
     def _prepare_sources(self, conanfile, pref, package_layout, conanfile_path, source_folder,
                          build_folder, remotes):
-        export_folder = package_layout.export()
-        export_source_folder = package_layout.export_sources()
+        export_folder = package_layout.read_export()
+        export_source_folder = package_layout.read_export_sources()
         scm_sources_folder = package_layout.scm_sources()
 
         complete_recipe_sources(self._remote_manager, self._cache, conanfile, pref.ref, remotes)
@@ -296,6 +297,9 @@ class BinaryInstaller(object):
         self._recorder = recorder
         self._binaries_analyzer = app.binaries_analyzer
         self._hook_manager = app.hook_manager
+        # The same installer can install several graphs (multi-configuration install), the
+        # package references already downloaded or built are processed only once
+        self._processed_package_refs = {}  # {pref without revision: (binary, prev)}
 
     def install(self, deps_graph, remotes, build_mode, update, keep_build=False, graph_info=None):
         # order by levels and separate the root node (ref=None) from the rest
@@ -306,6 +310,18 @@ class BinaryInstaller(object):
         self._out.info("Installing (downloading, building) binaries...")
         self._build(nodes_by_level, keep_build, root_node, graph_info, remotes, build_mode, update)
 
+    def download(self, deps_graphs, parallel):
+        """ retrieves in advance the binaries to be downloaded of several graphs, concurrently and
+        only once for every PREF, so installing each one of the graphs later doesn't need to
+        download them again
+        """
+        downloads = []
+        for deps_graph in deps_graphs:
+            missing, graph_downloads = self._classify(deps_graph.by_levels())
+            self._raise_missing(missing)
+            downloads.extend(graph_downloads)
+        self._download(downloads, self._processed_package_refs, parallel)
+
     @staticmethod
     def _classify(nodes_by_level):
         missing, downloads = [], []
@@ -334,7 +350,7 @@ class BinaryInstaller(object):
         raise_package_not_found_error(conanfile, ref, package_id, dependencies,
                                       out=conanfile.output, recorder=self._recorder)
 
-    def _download(self, downloads, processed_package_refs):
+    def _download(self, downloads, processed_package_refs, parallel=None):
         """ executes the download of packages (both download and update), only once for a given
         PREF, even if node duplicated
         :param downloads: all nodes to be downloaded or updated, included repetitions
@@ -344,11 +360,11 @@ class BinaryInstaller(object):
 
         download_nodes = []
         for node in downloads:
-            pref = node.pref
+            pref = node.pref.copy_clear_prev()
             if pref in processed_package_refs:
                 continue
-            processed_package_refs.add(pref)
             assert node.prev, "PREV for %s is None" % str(node.pref)
+            processed_package_refs[pref] = node.binary, node.prev
             download_nodes.append(node)
 
         def _download(n):
@@ -357,7 +373,7 @@ class BinaryInstaller(object):
             with layout.package_lock(npref):
                 self._download_pkg(layout, npref, n)
 
-        parallel = self._cache.config.parallel_download
+        parallel = parallel or self._cache.config.parallel_download
         if parallel is not None:
             self._out.info("Downloading binary packages in %s parallel threads" % parallel)
             thread_pool = ThreadPool(parallel)
@@ -376,14 +392,12 @@ class BinaryInstaller(object):
             self._remote_manager.get_package(pref, package_folder, node.binary_remote,
                                              output, self._recorder)
             output.info("Downloaded package revision %s" % pref.revision)
-            with layout.update_metadata() as metadata:
-                metadata.packages[pref.id].remote = node.binary_remote.name
 
     def _build(self, nodes_by_level, keep_build, root_node, graph_info, remotes, build_mode, update):
         using_build_profile = bool(graph_info.profile_build)
         missing, downloads = self._classify(nodes_by_level)
         self._raise_missing(missing)
-        processed_package_refs = set()
+        processed_package_refs = self._processed_package_refs
         self._download(downloads, processed_package_refs)
 
         for level in nodes_by_level:
@@ -453,8 +467,10 @@ class BinaryInstaller(object):
         package_folder = layout.package(pref)
 
         with layout.package_lock(pref):
-            if pref not in processed_package_references:
-                processed_package_references.add(pref)
+            processed = processed_package_references.get(pref.copy_clear_prev())
+            if processed is not None:
+                self._set_processed(node, *processed)
+            else:
                 if node.binary == BINARY_BUILD:
                     assert node.prev is None, "PREV for %s to be built should be None" % str(pref)
                     with set_dirty_context_manager(package_folder):
@@ -470,11 +486,29 @@ class BinaryInstaller(object):
                     output.success('Already installed!')
                     log_package_got_from_local_cache(pref)
                     self._recorder.package_fetched_from_cache(pref)
+                processed_package_references[pref.copy_clear_prev()] = node.binary, node.prev
+            layout.record_usage(pref)
 
+            # The package can be read from the secondary storage, if it was not built or
+            # downloaded to this cache
+            package_folder = layout.read_package(pref)
             # Call the info method
-            self._call_package_info(conanfile, package_folder, ref=pref.ref)
+            info_cache = None
+            if self._cache.config.package_info_cache:
+                info_cache = PackageInfoCache(layout.package_info_cache(node.pref), conanfile,
+                                              node.pref, package_folder)
+            self._call_package_info(conanfile, package_folder, ref=pref.ref, info_cache=info_cache)
             self._recorder.package_cpp_info(pref, conanfile.cpp_info)
 
+    @staticmethod
+    def _set_processed(node, binary, prev):
+        """ the package was already built or retrieved for other node, in this graph or in
+        other graph of the same installer
+        """
+        node.prev = prev
+        if binary == BINARY_BUILD and node.binary == BINARY_BUILD and node.graph_lock_node:
+            node.graph_lock_node.modified = GraphLockNode.MODIFIED_BUILT
+
     def _build_package(self, node, output, keep_build, remotes):
         conanfile = node.conanfile
         # It is necessary to complete the sources of python requires, which might be used
@@ -533,7 +567,7 @@ class BinaryInstaller(object):
         subtree_libnames = [node.ref.name for node in node_order]
         add_env_conaninfo(conan_file, subtree_libnames)
 
-    def _call_package_info(self, conanfile, package_folder, ref):
+    def _call_package_info(self, conanfile, package_folder, ref, info_cache=None):
         conanfile.cpp_info = CppInfo(package_folder)
         conanfile.cpp_info.name = conanfile.name
         conanfile.cpp_info.version = conanfile.version
@@ -556,6 +590,9 @@ class BinaryInstaller(object):
                     conanfile.install_folder = None
                     self._hook_manager.execute("pre_package_info", conanfile=conanfile,
                                                reference=ref)
-                    conanfile.package_info()
+                    if info_cache is None or not info_cache.load(conanfile):
+                        conanfile.package_info()
+                        if info_cache is not None:  # The post hook runs again when reused
+                            info_cache.save(conanfile)
                     self._hook_manager.execute("post_package_info", conanfile=conanfile,
                                                reference=ref)
@@ -35,22 +35,72 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
     @param no_imports: Install specified packages but avoid running imports
 
     """
-    out, user_io, graph_manager, cache = app.out, app.user_io, app.graph_manager, app.cache
-    remote_manager, hook_manager = app.remote_manager, app.hook_manager
+    out = app.out
     if generators is not False:
         generators = set(generators) if generators else set()
         generators.add("txt")  # Add txt generator by default
 
+    deps_graph = _load_graph(app, ref_or_path, graph_info, build_modes, update, remotes,
+                             create_reference, recorder)
+    installer = BinaryInstaller(app, recorder=recorder)
+    # TODO: Extract this from the GraphManager, reuse same object, check args earlier
+    build_modes = BuildMode(build_modes, out)
+    _install_graph(app, installer, deps_graph, ref_or_path, install_folder, graph_info, remotes,
+                   build_modes, update, manifest_folder, manifest_verify, manifest_interactive,
+                   generators, no_imports, create_reference, keep_build, use_lock)
+
+
+def deps_install_multi(app, ref_or_path, configurations, remotes=None, build_modes=None,
+                       update=False, manifest_folder=None, manifest_verify=False,
+                       manifest_interactive=False, generators=None, no_imports=False,
+                       recorder=None):
+    """ Fetch and build all dependencies for the given reference or path, for several
+    configurations (profiles) in the same invocation. The same ConanApp is used for all of them,
+    so loaded recipes, resolved version ranges and remote lookups are shared among the graphs.
+    Then, the binaries of all the graphs are downloaded concurrently, and finally every
+    configuration is installed in its own install folder
+    :param app: The ConanApp instance with all collaborators
+    @param ref_or_path: ConanFileReference or path to user space conanfile
+    @param configurations: list of (install_folder, graph_info) tuples, one per configuration
+    The rest of parameters are the same as in deps_install()
+    """
+    out = app.out
+    if generators is not False:
+        generators = set(generators) if generators else set()
+        generators.add("txt")  # Add txt generator by default
+
+    graphs = []
+    for install_folder, graph_info in configurations:
+        out.highlight("Computing dependency graph for '%s'" % install_folder)
+        deps_graph = _load_graph(app, ref_or_path, graph_info, build_modes, update, remotes,
+                                 create_reference=None, recorder=recorder)
+        graphs.append(deps_graph)
+
+    installer = BinaryInstaller(app, recorder=recorder)
+    parallel = app.cache.config.parallel_download or len(configurations)
+    installer.download(graphs, parallel)
+
+    build_modes = BuildMode(build_modes, out)
+    for (install_folder, graph_info), deps_graph in zip(configurations, graphs):
+        out.highlight("Installing configuration '%s'" % install_folder)
+        _install_graph(app, installer, deps_graph, ref_or_path, install_folder, graph_info,
+                       remotes, build_modes, update, manifest_folder, manifest_verify,
+                       manifest_interactive, generators, no_imports, create_reference=None,
+                       keep_build=False, use_lock=False)
+
+
+def _load_graph(app, ref_or_path, graph_info, build_modes, update, remotes, create_reference,
+                recorder):
+    out = app.out
     out.info("Configuration:")
     out.writeln(graph_info.profile_host.dumps())
-    deps_graph = graph_manager.load_graph(ref_or_path, create_reference, graph_info, build_modes,
-                                          False, update, remotes, recorder)
+    deps_graph = app.graph_manager.load_graph(ref_or_path, create_reference, graph_info,
+                                              build_modes, False, update, remotes, recorder)
     root_node = deps_graph.root
-    conanfile = root_node.conanfile
     if root_node.recipe == RECIPE_VIRTUAL:
         out.highlight("Installing package: %s" % str(ref_or_path))
     else:
-        conanfile.output.highlight("Installing package")
+        root_node.conanfile.output.highlight("Installing package")
     print_graph(deps_graph, out)
 
     try:
@@ -60,10 +110,17 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
             out.writeln(message, Color.BRIGHT_MAGENTA)
     except ConanException:  # Setting os doesn't exist
         pass
+    return deps_graph
+
+
+def _install_graph(app, installer, deps_graph, ref_or_path, install_folder, graph_info, remotes,
+                   build_modes, update, manifest_folder, manifest_verify, manifest_interactive,
+                   generators, no_imports, create_reference, keep_build, use_lock):
+    out, user_io, cache = app.out, app.user_io, app.cache
+    remote_manager = app.remote_manager
+    root_node = deps_graph.root
+    conanfile = root_node.conanfile
 
-    installer = BinaryInstaller(app, recorder=recorder)
-    # TODO: Extract this from the GraphManager, reuse same object, check args earlier
-    build_modes = BuildMode(build_modes, out)
     installer.install(deps_graph, remotes, build_modes, update, keep_build=keep_build,
                       graph_info=graph_info)
     # GraphLock always != None here (because of graph_manager.load_graph)
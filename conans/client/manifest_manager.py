@@ -28,8 +28,8 @@ class ManifestManager(object):
     def _handle_recipe(self, node, verify, interactive):
         ref = node.ref
         layout = self._cache.package_layout(ref)
-        export = layout.export()
-        exports_sources_folder = layout.export_sources()
+        export = layout.read_export()
+        exports_sources_folder = layout.read_export_sources()
         read_manifest = FileTreeManifest.load(export)
         expected_manifest = FileTreeManifest.create(export, exports_sources_folder)
         self._check_not_corrupted(ref, read_manifest, expected_manifest)
@@ -39,7 +39,7 @@ class ManifestManager(object):
     def _handle_package(self, node, verify, interactive):
         ref = node.ref
         pref = PackageReference(ref, node.package_id)
-        package_folder = self._cache.package_layout(pref.ref).package(pref)
+        package_folder = self._cache.package_layout(pref.ref).read_package(pref)
         read_manifest = FileTreeManifest.load(package_folder)
         expected_manifest = FileTreeManifest.create(package_folder)
         self._check_not_corrupted(pref, read_manifest, expected_manifest)
@@ -49,11 +49,12 @@ class RemoteManager(object):
         self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
                           retry, retry_wait)
 
-    def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait):
+    def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait,
+                       checksums=None):
         assert pref.ref.revision, "upload_package requires RREV"
         assert pref.revision, "upload_package requires PREV"
         self._call_remote(remote, "upload_package", pref,
-                          files_to_upload, deleted, retry, retry_wait)
+                          files_to_upload, deleted, retry, retry_wait, checksums)
 
     def get_recipe_manifest(self, ref, remote):
         ref = self._resolve_latest_ref(ref, remote)
@@ -77,7 +78,7 @@ class RemoteManager(object):
         returns (dict relative_filepath:abs_path , remote_name)"""
 
         self._hook_manager.execute("pre_download_recipe", reference=ref, remote=remote)
-        dest_folder = self._cache.package_layout(ref).export()
+        dest_folder = self._cache.package_layout(ref, secondary=False).export()
         rmdir(dest_folder)
 
         ref = self._resolve_latest_ref(ref, remote)
@@ -99,6 +100,7 @@ class RemoteManager(object):
         with package_layout.update_metadata() as metadata:
             metadata.recipe.revision = ref.revision
             metadata.recipe.checksums = recipe_checksums
+            metadata.recipe.remote = remote.name
 
         self._hook_manager.execute("post_download_recipe", conanfile_path=conanfile_path,
                                    reference=ref, remote=remote)
@@ -143,10 +145,12 @@ class RemoteManager(object):
 
             package_checksums = calc_files_checksum(zipped_files)
 
+            # Written once for every downloaded package
             with self._cache.package_layout(pref.ref).update_metadata() as metadata:
                 metadata.packages[pref.id].revision = pref.revision
                 metadata.packages[pref.id].recipe_revision = pref.ref.revision
                 metadata.packages[pref.id].checksums = package_checksums
+                metadata.packages[pref.id].remote = remote.name
 
             duration = time.time() - t1
             log_package_download(pref, duration, remote, zipped_files)
@@ -191,6 +195,9 @@ class RemoteManager(object):
     def remove_packages(self, ref, remove_ids, remote):
         return self._call_remote(remote, "remove_packages", ref, remove_ids)
 
+    def copy_recipe(self, ref, dest_ref, package_ids, force, remote):
+        return self._call_remote(remote, "copy_recipe", ref, dest_ref, package_ids, force)
+
     def get_recipe_path(self, ref, path, remote):
         return self._call_remote(remote, "get_recipe_path", ref, path)
 
@@ -11,10 +11,20 @@ from conans.util.log import logger
 
 class DiskRemover(object):
 
+    def __init__(self, trash=None):
+        """ :param trash: if defined, the folders are moved into it, to be deleted later
+        """
+        self._trash = trash
+        self.trashed = []  # The folders moved to the trash
+
     def _remove(self, path, ref, msg=""):
         try:
             logger.debug("REMOVE: folder %s" % path)
-            rm_conandir(path)
+            trashed = self._trash.move(path) if self._trash is not None else None
+            if trashed:
+                self.trashed.append(trashed)
+            else:
+                rm_conandir(path)
         except OSError:
             error_msg = "Folder busy (open or some file open): %s" % path
             raise ConanException("%s: Unable to remove %s\n\t%s" % (repr(ref), msg, error_msg))
@@ -78,6 +88,9 @@ class DiskRemover(object):
                 pkg_folder = package_layout.package(pref)
                 self._remove(pkg_folder, package_layout.ref, "package:%s" % id_)
                 self._remove_file(pkg_folder + ".dirty", package_layout.ref, "dirty flag")
+                self._remove_file(package_layout.usage(pref), package_layout.ref, "usage")
+                self._remove_file(package_layout.package_info_cache(pref), package_layout.ref,
+                                  "package_info")
                 self._remove_file(package_layout.system_reqs_package(pref), package_layout.ref,
                                   "%s/%s" % (id_, SYSTEM_REQS))
 
@@ -90,6 +103,7 @@ class ConanRemover(object):
         self._cache = cache
         self._remote_manager = remote_manager
         self._remotes = remotes
+        self._disk_remover = DiskRemover(trash=cache.trash)
 
     def _remote_remove(self, ref, package_ids, remote):
         assert(isinstance(remote, Remote))
@@ -112,10 +126,11 @@ class ConanRemover(object):
 
         # Get the package layout using 'short_paths=False', remover will make use of the
         #  function 'rm_conandir' which already takes care of the linked folder.
-        package_layout = self._cache.package_layout(ref, short_paths=False)
+        # The secondary storage is read-only, only the items in this cache are removed
+        package_layout = self._cache.package_layout(ref, short_paths=False, secondary=False)
 
         package_layout.remove_package_locks()  # Make sure to clean the locks too
-        remover = DiskRemover()
+        remover = self._disk_remover
         if src:
             remover.remove_src(package_layout)
         if build_ids is not None:
@@ -187,48 +202,63 @@ class ConanRemover(object):
             refs = [r.copy_clear_rev() for r in refs]
 
         deleted_refs = []
-        for ref in refs:
-            assert isinstance(ref, ConanFileReference)
-            package_layout = self._cache.package_layout(ref)
-            package_ids = package_ids_filter
-            if packages_query or outdated:
-                # search packages
-                if remote_name:
-                    packages = self._remote_manager.search_packages(remote, ref, packages_query)
-                else:
-                    packages = search_packages(package_layout, packages_query)
-                if outdated:
+        try:
+            for ref in refs:
+                assert isinstance(ref, ConanFileReference)
+                package_layout = self._cache.package_layout(ref)
+                package_ids = package_ids_filter
+                if packages_query or outdated:
+                    # search packages
                     if remote_name:
-                        manifest, ref = self._remote_manager.get_recipe_manifest(ref, remote)
-                        recipe_hash = manifest.summary_hash
+                        packages = self._remote_manager.search_packages(remote, ref, packages_query)
                     else:
-                        recipe_hash = package_layout.recipe_manifest().summary_hash
-                    packages = filter_outdated(packages, recipe_hash)
-                if package_ids_filter:
-                    package_ids = [p for p in packages if p in package_ids_filter]
-                else:
-                    package_ids = list(packages.keys())
-                if not package_ids:
-                    self._user_io.out.warn("No matching packages to remove for %s"
-                                           % ref.full_str())
-                    continue
-
-            if self._ask_permission(ref, src, build_ids, package_ids, force):
-                try:
-                    if remote_name:
-                        self._remote_remove(ref, package_ids, remote)
+                        packages = search_packages(package_layout, packages_query)
+                    if outdated:
+                        if remote_name:
+                            manifest, ref = self._remote_manager.get_recipe_manifest(ref, remote)
+                            recipe_hash = manifest.summary_hash
+                        else:
+                            recipe_hash = package_layout.recipe_manifest().summary_hash
+                        packages = filter_outdated(packages, recipe_hash)
+                    if package_ids_filter:
+                        package_ids = [p for p in packages if p in package_ids_filter]
+                    else:
+                        package_ids = list(packages.keys())
+                    if not package_ids:
+                        self._user_io.out.warn("No matching packages to remove for %s"
+                                               % ref.full_str())
+                        continue
+
+                if self._ask_permission(ref, src, build_ids, package_ids, force):
+                    try:
+                        if remote_name:
+                            self._remote_remove(ref, package_ids, remote)
+                        else:
+                            self._local_remove(ref, src, build_ids, package_ids)
+                    except NotFoundException:
+                        # If we didn't specify a pattern but a concrete ref, fail if there is no
+                        # ref to remove
+                        if input_ref:
+                            raise
                     else:
-                        self._local_remove(ref, src, build_ids, package_ids)
-                except NotFoundException:
-                    # If we didn't specify a pattern but a concrete ref, fail if there is no
-                    # ref to remove
-                    if input_ref:
-                        raise
-                else:
-                    deleted_refs.append(ref)
-
-        if not remote_name:
-            self._cache.delete_empty_dirs(deleted_refs)
+                        deleted_refs.append(ref)
+
+            if not remote_name:
+                self._cache.delete_empty_dirs(deleted_refs)
+        finally:
+            self._empty_trash()
+
+    def _empty_trash(self):
+        """ the removed folders were moved to the trash, so they are deleted now, in parallel, or
+        by a background process
+        """
+        trashed = self._disk_remover.trashed
+        if not trashed:
+            return
+        if self._cache.config.background_removal:
+            self._cache.trash.drain_background()
+        else:
+            self._cache.trash.drain(trashed)
 
     def _ask_permission(self, ref, src, build_ids, package_ids_filter, force):
         def stringlist(alist):
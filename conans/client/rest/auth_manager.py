@@ -12,6 +12,7 @@ Flow:
 """
 
 import hashlib
+import threading
 from uuid import getnode as get_mac
 
 from conans.client.cmd.user import update_localdb
@@ -27,6 +28,8 @@ class ConanApiAuthManager(object):
         self._user_io = user_io
         self._rest_client_factory = rest_client_factory
         self._localdb = localdb
+        # The remotes can be called concurrently, only one of the calls asks for credentials
+        self._auth_lock = threading.RLock()
 
     def call_rest_api_method(self, remote, method_name, *args, **kwargs):
         """Handles AuthenticationException and request user to input a user and a password"""
@@ -42,30 +45,35 @@ class ConanApiAuthManager(object):
         except ForbiddenException:
             raise ForbiddenException("Permission denied for user: '%s'" % user)
         except AuthenticationException:
-            # User valid but not enough permissions
-            if user is None or token is None:
-                # token is None when you change user with user command
-                # Anonymous is not enough, ask for a user
-                self._user_io.out.info('Please log in to "%s" to perform this action. '
-                                       'Execute "conan user" command.' % remote.name)
-                if "bintray" in remote.url:
-                    self._user_io.out.info('If you don\'t have an account sign up here: '
-                                           'https://bintray.com/signup/oss')
-                return self._retry_with_new_token(user, remote, method_name, *args, **kwargs)
-            elif token and refresh_token:
-                # If we have a refresh token try to refresh the access token
-                try:
-                    self._authenticate(remote, user, None)
-                except AuthenticationException as exc:
-                    logger.info("Cannot refresh the token, cleaning and retrying: {}".format(exc))
+            with self._auth_lock:
+                # Other call might have logged in meanwhile, then just retry with it
+                if self._localdb.get_login(remote.url)[1] != token:
+                    return self.call_rest_api_method(remote, method_name, *args, **kwargs)
+                # User valid but not enough permissions
+                if user is None or token is None:
+                    # token is None when you change user with user command
+                    # Anonymous is not enough, ask for a user
+                    self._user_io.out.info('Please log in to "%s" to perform this action. '
+                                           'Execute "conan user" command.' % remote.name)
+                    if "bintray" in remote.url:
+                        self._user_io.out.info('If you don\'t have an account sign up here: '
+                                               'https://bintray.com/signup/oss')
+                    return self._retry_with_new_token(user, remote, method_name, *args, **kwargs)
+                elif token and refresh_token:
+                    # If we have a refresh token try to refresh the access token
+                    try:
+                        self._authenticate(remote, user, None)
+                    except AuthenticationException as exc:
+                        logger.info("Cannot refresh the token, cleaning and retrying: "
+                                    "{}".format(exc))
+                        self._clear_user_tokens_in_db(user, remote)
+                    return self.call_rest_api_method(remote, method_name, *args, **kwargs)
+                else:
+                    # Token expired or not valid, so clean the token and repeat the call
+                    # (will be anonymous call but exporting who is calling)
+                    logger.info("Token expired or not valid, cleaning the saved token and retrying")
                     self._clear_user_tokens_in_db(user, remote)
-                return self.call_rest_api_method(remote, method_name, *args, **kwargs)
-            else:
-                # Token expired or not valid, so clean the token and repeat the call
-                # (will be anonymous call but exporting who is calling)
-                logger.info("Token expired or not valid, cleaning the saved token and retrying")
-                self._clear_user_tokens_in_db(user, remote)
-                return self._retry_with_new_token(user, remote, method_name, *args, **kwargs)
+                    return self._retry_with_new_token(user, remote, method_name, *args, **kwargs)
 
     def _retry_with_new_token(self, user, remote, method_name, *args, **kwargs):
         """Try LOGIN_RETRIES to obtain a password from user input for which
@@ -217,6 +217,11 @@ class ClientV2Router(ClientCommonRouter):
         assert pref.ref.revision is not None, "Cannot get the latest package without RREV"
         return self.base_url + _format_pref(self.routes.package_revision_latest, pref)
 
+    def recipe_copy(self, ref):
+        """Copy a recipe revision to another user/channel url"""
+        assert ref.revision is not None, "recipe_copy needs RREV"
+        return self.base_url + _format_ref(self.routes.recipe_revision_copy, ref)
+
     def recipe_latest(self, ref):
         """Get the latest of a recipe"""
         assert ref.revision is None, "for_recipe_latest shouldn't receive RREV"
@@ -8,7 +8,7 @@ from conans.client.rest import response_to_str
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
 from conans.util import progress_bar
-from conans.util.files import mkdir
+from conans.util.files import md5sum, mkdir
 from conans.util.log import logger
 from conans.util.tracer import log_download
 
@@ -35,6 +35,9 @@ class FileDownloader(object):
             if overwrite:
                 if self._output:
                     self._output.warn("file '%s' already exists, overwriting" % file_path)
+                # Servers using the md5 as ETag (as conan_server) won't send it again if equal
+                headers = dict(headers or {})
+                headers["If-None-Match"] = '"%s"' % md5sum(file_path)
             else:
                 # Should not happen, better to raise, probably we had to remove
                 # the dest folder before
@@ -51,6 +54,12 @@ class FileDownloader(object):
         except Exception as exc:
             raise ConanException("Error downloading file %s: '%s'" % (url, exc))
 
+        if response.status_code == 304 and file_path:
+            response.close()
+            if self._output:
+                self._output.info("file '%s' is already up to date" % file_path)
+            return None
+
         if not response.ok:
             if response.status_code == 404:
                 raise NotFoundException("Not found: %s" % url)
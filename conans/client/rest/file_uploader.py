@@ -47,7 +47,9 @@ class FileUploader(object):
             return response
 
     def upload(self, url, abs_path, auth=None, dedup=False, retry=None, retry_wait=None,
-               headers=None, display_name=None):
+               headers=None, display_name=None, sha1=None):
+        """ sha1: checksum of the file, if it is already known, so it is not computed again
+        """
         retry = retry if retry is not None else self._config.retry
         retry = retry if retry is not None else 1
         retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
@@ -55,7 +57,7 @@ class FileUploader(object):
 
         # Send always the header with the Sha1
         headers = copy(headers) or {}
-        headers["X-Checksum-Sha1"] = sha1sum(abs_path)
+        headers["X-Checksum-Sha1"] = sha1 or sha1sum(abs_path)
         if dedup:
             response = self._dedup(url, headers, auth)
             if response:
@@ -1,7 +1,7 @@
-from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS
+from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS, SERVER_COPY
 from conans.client.rest.rest_client_v1 import RestV1Methods
 from conans.client.rest.rest_client_v2 import RestV2Methods
-from conans.errors import OnlyV2Available, AuthenticationException
+from conans.errors import OnlyV2Available, AuthenticationException, ConanException
 from conans.search.search import filter_packages
 from conans.util.log import logger
 
@@ -106,8 +106,9 @@ class RestApiClient(object):
     def upload_recipe(self, ref, files_to_upload, deleted, retry, retry_wait):
         return self._get_api().upload_recipe(ref, files_to_upload, deleted, retry, retry_wait)
 
-    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait):
-        return self._get_api().upload_package(pref, files_to_upload, deleted, retry, retry_wait)
+    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait, checksums=None):
+        return self._get_api().upload_package(pref, files_to_upload, deleted, retry, retry_wait,
+                                              checksums)
 
     def authenticate(self, user, password):
         api_v1 = RestV1Methods(self._remote_url, self._token, self._custom_headers, self._output,
@@ -149,6 +150,17 @@ class RestApiClient(object):
     def remove_packages(self, ref, package_ids=None):
         return self._get_api().remove_packages(ref, package_ids)
 
+    def copy_recipe(self, ref, dest_ref, package_ids=None, force=False):
+        if not self._capable(SERVER_COPY):
+            raise ConanException("The remote '%s' doesn't support copying packages in the server"
+                                 % self._remote_url)
+        # The copy is only implemented in the APIv2, that any server with the capability has
+        api_v2 = RestV2Methods(self._remote_url, self._token, self._custom_headers, self._output,
+                               self._requester, self._config, self._verify_ssl,
+                               self._artifacts_properties,
+                               matrix_params=self._capable(MATRIX_PARAMS))
+        return api_v2.copy_recipe(ref, dest_ref, package_ids, force)
+
     def server_capabilities(self):
         return self._get_api().server_capabilities()
 
@@ -223,9 +223,11 @@ class RestCommonMethods(object):
         snap = self._get_snapshot(url)
         return snap
 
-    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait):
+    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait, checksums=None):
+        """ checksums: {filename: {"md5", "sha1"}} of the files, if they are already known
+        """
         if files_to_upload:
-            self._upload_package(pref, files_to_upload, retry, retry_wait)
+            self._upload_package(pref, files_to_upload, retry, retry_wait, checksums)
         if deleted:
             raise Exception("This shouldn't be happening, deleted files "
                             "in local package present in remote: %s.\n Please, report it at "
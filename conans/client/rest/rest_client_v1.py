@@ -140,7 +140,7 @@ class RestV1Methods(RestCommonMethods):
         self._upload_files(urls, files_to_upload, self._output, retry, retry_wait,
                            display_name=str(ref))
 
-    def _upload_package(self, pref, files_to_upload, retry, retry_wait):
+    def _upload_package(self, pref, files_to_upload, retry, retry_wait, checksums=None):
         # Get the upload urls and then upload files
         url = self.router.package_upload_urls(pref)
         file_sizes = {filename: os.stat(abs_path).st_size for filename,
@@ -152,9 +152,10 @@ class RestV1Methods(RestCommonMethods):
         logger.debug("Requesting upload urls...Done!")
         short_pref_name = "%s:%s" % (pref.ref, pref.id[0:4])
         self._upload_files(urls, files_to_upload, self._output, retry, retry_wait,
-                           display_name=short_pref_name)
+                           display_name=short_pref_name, checksums=checksums)
 
-    def _upload_files(self, file_urls, files, output, retry, retry_wait, display_name=None):
+    def _upload_files(self, file_urls, files, output, retry, retry_wait, display_name=None,
+                      checksums=None):
         t1 = time.time()
         failed = []
         uploader = FileUploader(self.requester, output, self.verify_ssl, self._config)
@@ -168,9 +169,10 @@ class RestV1Methods(RestCommonMethods):
             auth, dedup = self._file_server_capabilities(resource_url)
             try:
                 headers = self._artifacts_properties if not self._matrix_params else {}
+                sha1 = (checksums or {}).get(filename, {}).get("sha1")
                 uploader.upload(resource_url, files[filename], auth=auth, dedup=dedup,
                                 retry=retry, retry_wait=retry_wait,
-                                headers=headers, display_name=display_name)
+                                headers=headers, display_name=display_name, sha1=sha1)
             except Exception as exc:
                 output.error("\nError uploading file: %s, '%s'" % (filename, exc))
                 failed.append(filename)
@@ -13,7 +13,7 @@ from conans.errors import ConanException, NotFoundException, PackageNotFoundExce
     RecipeNotFoundException, AuthenticationException, ForbiddenException
 from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
-from conans.model.ref import PackageReference
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
 from conans.util.files import decode_text
 from conans.util.log import logger
@@ -179,14 +179,15 @@ class RestV2Methods(RestCommonMethods):
                 for fn in files_to_upload}
         self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=str(ref))
 
-    def _upload_package(self, pref, files_to_upload, retry, retry_wait):
+    def _upload_package(self, pref, files_to_upload, retry, retry_wait, checksums=None):
         urls = {fn: self.router.package_file(pref, fn, add_matrix_params=True)
                 for fn in files_to_upload}
 
         short_pref_name = "%s:%s" % (pref.ref, pref.id[0:4])
-        self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=short_pref_name)
+        self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=short_pref_name,
+                           checksums=checksums)
 
-    def _upload_files(self, files, urls, retry, retry_wait, display_name=None):
+    def _upload_files(self, files, urls, retry, retry_wait, display_name=None, checksums=None):
         t1 = time.time()
         failed = []
         uploader = FileUploader(self.requester, self._output, self.verify_ssl, self._config)
@@ -200,9 +201,10 @@ class RestV2Methods(RestCommonMethods):
             resource_url = urls[filename]
             try:
                 headers = self._artifacts_properties if not self._matrix_params else {}
+                sha1 = (checksums or {}).get(filename, {}).get("sha1")
                 uploader.upload(resource_url, files[filename], auth=self.auth,
                                 dedup=self._checksum_deploy, retry=retry, retry_wait=retry_wait,
-                                headers=headers, display_name=display_name)
+                                headers=headers, display_name=display_name, sha1=sha1)
             except (AuthenticationException, ForbiddenException):
                 raise
             except Exception as exc:
@@ -293,6 +295,20 @@ class RestV2Methods(RestCommonMethods):
                 response.charset = "utf-8"
                 raise get_exception_from_error(response.status_code)(response.text)
 
+    def copy_recipe(self, ref, dest_ref, package_ids=None, force=False):
+        """ Copies the recipe revision (the latest one if not specified) and the latest revision
+        of the given binaries (all of them if None) to dest_ref, in the server.
+        Returns the copied reference, with revision, and the {package_id: prev} copied
+        """
+        self.check_credentials()
+        if ref.revision is None:
+            ref = self.get_latest_recipe_revision(ref)
+        url = self.router.recipe_copy(ref)
+        data = {"user": dest_ref.user, "channel": dest_ref.channel,
+                "package_ids": package_ids, "force": force}
+        ret = self.get_json(url, data)
+        return ConanFileReference.loads(ret["reference"]), ret["packages"]
+
     def get_recipe_revisions(self, ref):
         url = self.router.recipe_revisions(ref)
         tmp = self.get_json(url)["revisions"]
@@ -8,7 +8,7 @@ import six
 
 from conans.errors import ConanException
 from conans.unicode import get_cwd
-from conans.util.files import decode_text
+from conans.util.files import _detect_encoding, decode_text
 from conans.util.runners import pyinstaller_bundle_env_cleaned
 
 
@@ -21,6 +21,45 @@ class _UnbufferedWrite(object):
         self._stream.flush()
 
 
+def _decoded_lines(the_stream, chunk_size=64 * 1024):
+    """ reads the output of a process in chunks, as soon as it is available, and yields blocks of
+    complete lines, both raw and decoded. The blocks are decoded at once, and only if they are
+    not valid UTF-8 they are decoded line by line, detecting the encoding of every line
+    """
+    fd = the_stream.fileno()
+    pending = b""
+    by_lines = False
+    first = True
+    while True:
+        data = os.read(fd, chunk_size)
+        if data:
+            pending += data
+            index = pending.rfind(b"\n")
+            if index == -1:
+                continue
+            block, pending = pending[:index + 1], pending[index + 1:]
+        elif pending:
+            block, pending = pending, b""
+        else:
+            return
+
+        text = block
+        if first:  # A BOM can only be at the beginning of the output
+            first = False
+            encoding, bom_length = _detect_encoding(block)
+            if encoding == "utf_8_sig":
+                text = block[bom_length:]
+            elif bom_length:  # Other BOMs are not line based encodings, very rare
+                by_lines = True
+        if not by_lines:
+            try:
+                yield block, text.decode("utf-8")
+                continue
+            except UnicodeDecodeError:
+                pass
+        yield block, "".join(decode_text(line) for line in block.splitlines(True))
+
+
 class ConanRunner(object):
 
     def __init__(self, print_commands_to_output=False, generate_run_log_file=False,
@@ -81,11 +120,7 @@ class ConanRunner(object):
             raise ConanException("Error while executing '%s'\n\t%s" % (command, str(e)))
 
         def get_stream_lines(the_stream):
-            while True:
-                line = the_stream.readline()
-                if not line:
-                    break
-                decoded_line = decode_text(line)
+            for line, decoded_line in _decoded_lines(the_stream):
                 if stream_output and self._log_run_to_output:
                     try:
                         stream_output.write(decoded_line)
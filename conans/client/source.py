@@ -21,9 +21,9 @@ def complete_recipe_sources(remote_manager, cache, conanfile, ref, remotes):
     complete
     """
     package_layout = cache.package_layout(ref, conanfile.short_paths)
-    sources_folder = package_layout.export_sources()
-    if os.path.exists(sources_folder):
+    if os.path.exists(package_layout.read_export_sources()):
         return None
+    sources_folder = package_layout.export_sources()
 
     if conanfile.exports_sources is None:
         mkdir(sources_folder)
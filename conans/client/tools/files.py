@@ -1,7 +1,9 @@
 import logging
 import os
 import platform
+import shutil
 import sys
+import threading
 from contextlib import contextmanager
 from fnmatch import fnmatch
 
@@ -12,7 +14,7 @@ from conans.client.output import ConanOutput
 from conans.errors import ConanException
 from conans.unicode import get_cwd
 from conans.util.fallbacks import default_output
-from conans.util.files import (_generic_algorithm_sum, load, save)
+from conans.util.files import (_generic_algorithm_sum, load, mkdir, save)
 
 UNIT_SIZE = 1000.0
 # Library extensions supported by collect_libs
@@ -52,7 +54,8 @@ def human_size(size_bytes):
     return "%s%s" % (formatted_size, suffix)
 
 
-def unzip(filename, destination=".", keep_permissions=False, pattern=None, output=None):
+def unzip(filename, destination=".", keep_permissions=False, pattern=None, output=None,
+          threads=None):
     """
     Unzip a zipped file
     :param filename: Path to the zip file
@@ -64,6 +67,8 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
     :param pattern: Extract only paths matching the pattern. This should be a
     Unix shell-style wildcard, see fnmatch documentation for more details.
     :param output: output
+    :param threads: Number of threads extracting the members of .zip files concurrently. The
+    default extracts them one by one.
     :return:
     """
     output = default_output(output, 'conans.client.tools.files.unzip')
@@ -74,10 +79,13 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
         return untargz(filename, destination, pattern)
     if filename.endswith(".gz"):
         import gzip
-        with gzip.open(filename, 'rb') as f:
-            file_content = f.read()
         target_name = filename[:-3] if destination == "." else destination
-        save(target_name, file_content)
+        target_folder = os.path.dirname(target_name)
+        if target_folder:
+            mkdir(target_folder)
+        # Streamed, the file can be bigger than the available memory
+        with gzip.open(filename, 'rb') as fin, open(target_name, 'wb') as fout:
+            shutil.copyfileobj(fin, fout, 1024 * 1024)
         return
     if filename.endswith(".tar.xz") or filename.endswith(".txz"):
         if six.PY2:
@@ -114,7 +122,10 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
         extracted_size = 0
 
         print_progress.last_size = -1
-        if platform.system() == "Windows":
+        if threads and threads > 1:
+            _unzip_parallel(filename, zip_info, full_path, keep_permissions, threads,
+                            uncompress_size, print_progress, output)
+        elif platform.system() == "Windows":
             for file_ in zip_info:
                 extracted_size += file_.file_size
                 print_progress(extracted_size, uncompress_size)
@@ -137,6 +148,45 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
                     output.error("Error extract %s\n%s" % (file_.filename, str(e)))
 
 
+def _unzip_parallel(filename, zip_info, full_path, keep_permissions, threads, uncompress_size,
+                    print_progress, output):
+    import zipfile
+    from multiprocessing.pool import ThreadPool
+
+    # Folders are created in advance, so the threads do not race to create them
+    for file_ in zip_info:
+        parts = [p for p in file_.filename.split("/")[:-1] if p not in ("", ".", "..")]
+        if parts:
+            mkdir(os.path.join(full_path, *parts))
+
+    progress_lock = threading.Lock()
+    extracted = [0]
+
+    def _extract(members):
+        # ZipFile objects cannot be shared among threads, each one reads with its own
+        with zipfile.ZipFile(filename, "r") as z:
+            for file_ in members:
+                try:
+                    z.extract(file_, full_path)
+                    if keep_permissions and platform.system() != "Windows":
+                        # Could be dangerous if the ZIP has been created in a non nix system
+                        # https://bugs.python.org/issue15795
+                        perm = file_.external_attr >> 16 & 0xFFF
+                        os.chmod(os.path.join(full_path, file_.filename), perm)
+                except Exception as e:
+                    output.error("Error extract %s\n%s" % (file_.filename, str(e)))
+                with progress_lock:
+                    extracted[0] += file_.file_size
+                    print_progress(extracted[0], uncompress_size)
+
+    # Balance the work, distributing the biggest members first
+    members = sorted(zip_info, key=lambda m: m.file_size, reverse=True)
+    pool = ThreadPool(threads)
+    pool.map(_extract, [members[i::threads] for i in range(threads)])
+    pool.close()
+    pool.join()
+
+
 def untargz(filename, destination=".", pattern=None):
     import tarfile
     with tarfile.TarFile.open(filename, 'r:*') as tarredgzippedFile:
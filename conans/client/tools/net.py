@@ -9,7 +9,7 @@ from conans.util.fallbacks import default_output, default_requester
 
 def get(url, md5='', sha1='', sha256='', destination=".", filename="", keep_permissions=False,
         pattern=None, requester=None, output=None, verify=True, retry=None, retry_wait=None,
-        overwrite=False, auth=None, headers=None):
+        overwrite=False, auth=None, headers=None, threads=None):
     """ high level downloader + unzipper + (optional hash checker) + delete temporary zip
     """
     if not filename and ("?" in url or "=" in url):
@@ -20,7 +20,7 @@ def get(url, md5='', sha1='', sha256='', destination=".", filename="", keep_perm
              retry_wait=retry_wait, overwrite=overwrite, auth=auth, headers=headers,
              md5=md5, sha1=sha1, sha256=sha256)
     unzip(filename, destination=destination, keep_permissions=keep_permissions, pattern=pattern,
-          output=output)
+          output=output, threads=threads)
     os.unlink(filename)
 
 
@@ -83,12 +83,19 @@ class GraphLockNode(object):
                  modified=None):
         self.pref = pref
         self.python_requires = python_requires
-        self.options = options
+        self._options = options
+        self._options_text = None  # The serialized options, parsed only when necessary
         self.modified = modified  # variable
         self.requires = requires
         self.build_requires = build_requires
         self.path = path
 
+    @property
+    def options(self):
+        if self._options is None:
+            self._options = OptionsValues.loads(self._options_text)
+        return self._options
+
     @staticmethod
     def from_dict(data):
         """ constructs a GraphLockNode from a json like dict
@@ -99,20 +106,22 @@ class GraphLockNode(object):
         if python_requires:
             python_requires = [ConanFileReference.loads(ref, validate=False)
                                for ref in python_requires]
-        options = OptionsValues.loads(data["options"])
         modified = data.get("modified")
         requires = data.get("requires", [])
         build_requires = data.get("build_requires", [])
         path = data.get("path")
-        return GraphLockNode(pref, python_requires, options, requires, build_requires, path,
-                             modified)
+        result = GraphLockNode(pref, python_requires, None, requires, build_requires, path,
+                               modified)
+        result._options_text = data["options"]
+        return result
 
     def as_dict(self):
         """ returns the object serialized as a dict of plain python types
         that can be converted to json
         """
+        options = self._options.dumps() if self._options is not None else self._options_text
         result = {"pref": repr(self.pref) if self.pref else None,
-                  "options": self.options.dumps()}
+                  "options": options}
         if self.python_requires:
             result["python_requires"] = [repr(r) for r in self.python_requires]
         if self.modified:
@@ -130,6 +139,10 @@ class GraphLock(object):
 
     def __init__(self, graph=None):
         self._nodes = {}  # {numeric id: PREF or None}
+        # Indexes of the nodes, computed when necessary, reset when the nodes change
+        self._inverse_index = None  # {node id: [ids of the nodes that depend on it]}
+        self._refs_index = None  # {repr(ref): [ids]}
+        self._names_index = None  # {name: [ids]}
         self.revisions_enabled = None
         self.relax = False
 
@@ -171,6 +184,22 @@ class GraphLock(object):
                                    node.path, modified)
         node.graph_lock_node = graph_node
         self._nodes[node.id] = graph_node
+        self._reset_indexes()
+
+    def _reset_indexes(self, dependencies=True):
+        self._refs_index = self._names_index = None
+        if dependencies:
+            self._inverse_index = None
+
+    def _compute_refs_indexes(self):
+        if self._refs_index is None:
+            refs_index = {}
+            names_index = {}
+            for id_, node in self._nodes.items():
+                if node.pref:
+                    refs_index.setdefault(repr(node.pref.ref), []).append(id_)
+                    names_index.setdefault(node.pref.ref.name, []).append(id_)
+            self._refs_index, self._names_index = refs_index, names_index
 
     @property
     def initial_counter(self):
@@ -223,6 +252,7 @@ class GraphLock(object):
         for id_, node in new_lock._nodes.items():
             if node.modified:
                 self._nodes[id_] = node
+        self._reset_indexes()
 
     def clean_modified(self):
         """ remove all the "modified" flags from the lockfile
@@ -240,8 +270,7 @@ class GraphLock(object):
         while current:
             new_current = set()
             for n in current:
-                new_neighs = self._inverse_neighbors(n)
-                to_add = set(new_neighs).difference(current)
+                to_add = set(self._inverse_neighbors(n)).difference(closure)
                 new_current.update(to_add)
                 closure.update(to_add)
             current = new_current
@@ -252,13 +281,15 @@ class GraphLock(object):
         """ return all the nodes that have an edge to the "node_id". Useful for computing
         the set of nodes affected downstream by a change in one package
         """
-        result = []
-        for id_, node in self._nodes.items():
-            if node_id in node.requires:
-                result.append(id_)
-            if node_id in node.build_requires:
-                result.append(id_)
-        return result
+        if self._inverse_index is None:
+            inverse_index = {}
+            for id_, node in self._nodes.items():
+                for dep_id in node.requires:
+                    inverse_index.setdefault(dep_id, []).append(id_)
+                for dep_id in node.build_requires:
+                    inverse_index.setdefault(dep_id, []).append(id_)
+            self._inverse_index = inverse_index
+        return self._inverse_index.get(node_id, [])
 
     def update_check_graph(self, deps_graph, output):
         """ update the lockfile, checking for security that only nodes that are being built
@@ -289,6 +320,8 @@ class GraphLock(object):
                 if (pref.id == PACKAGE_ID_UNKNOWN or pref.is_compatible_with(node_pref) or
                         node.binary == BINARY_BUILD or node.id in affected or
                         node.recipe == RECIPE_CONSUMER):
+                    if lock_node.pref.ref != node.pref.ref:
+                        self._reset_indexes(dependencies=False)
                     lock_node.pref = node.pref
                 else:
                     raise ConanException("Mismatch between lock and graph:\nLock:  %s\nGraph: %s"
@@ -350,6 +383,19 @@ class GraphLock(object):
     def pref(self, node_id):
         return self._nodes[node_id].pref
 
+    def packages(self):
+        """ [(ref, package_id)] of all the locked nodes, except the consumer one. The package_id
+        is None for the python_requires and for the packages without a known ID yet
+        """
+        result = []
+        for node in self._nodes.values():
+            if node.pref:
+                package_id = node.pref.id if node.pref.id != PACKAGE_ID_UNKNOWN else None
+                result.append((node.pref.ref, package_id))
+            for ref in node.python_requires or []:
+                result.append((ref, None))
+        return result
+
     def get_node(self, ref):
         """ given a REF, return the Node of the package in the lockfile that correspond to that
         REF, or raise if it cannot find it.
@@ -362,22 +408,16 @@ class GraphLock(object):
                 if not node.pref and node.path:
                     return id_
 
+        self._compute_refs_indexes()
         # First search by ref (without RREV)
-        ids = []
-        search_ref = repr(ref)
-        for id_, node in self._nodes.items():
-            if node.pref and repr(node.pref.ref) == search_ref:
-                ids.append(id_)
+        ids = self._refs_index.get(repr(ref))
         if ids:
             if len(ids) == 1:
                 return ids[0]
             raise ConanException("There are %s binaries for ref %s" % (len(ids), ref))
 
         # Search by approximate name
-        ids = []
-        for id_, node in self._nodes.items():
-            if node.pref and node.pref.ref.name == ref.name:
-                ids.append(id_)
+        ids = self._names_index.get(ref.name)
         if ids:
             if len(ids) == 1:
                 return ids[0]
@@ -394,3 +434,4 @@ class GraphLock(object):
         if lock_node.pref.ref != ref:
             lock_node.pref = PackageReference(ref, lock_node.pref.id)
             lock_node.modified = GraphLockNode.MODIFIED_EXPORTED
+            self._reset_indexes(dependencies=False)
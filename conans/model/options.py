@@ -56,6 +56,8 @@ class PackageOptionValues(object):
     These are non-validating, not constrained.
     Used for UserOptions, which is a dict{package_name: PackageOptionValues}
     """
+    __slots__ = ("_dict", "_modified", "_freeze")
+
     def __init__(self):
         self._dict = {}  # {option_name: PackageOptionValue}
         self._modified = {}
@@ -166,6 +168,8 @@ class OptionsValues(object):
     Boost.static = False,
     Poco.optimized = True
     """
+    __slots__ = ("_package_values", "_reqs_options")
+
     def __init__(self, values=None):
         self._package_values = PackageOptionValues()
         self._reqs_options = {}  # {name("Boost": PackageOptionValues}
@@ -303,6 +307,8 @@ class OptionsValues(object):
 
 
 class PackageOption(object):
+    __slots__ = ("_name", "_value", "_possible_values")
+
     def __init__(self, possible_values, name):
         self._name = name
         self._value = None
@@ -372,6 +378,8 @@ class PackageOption(object):
 
 
 class PackageOptions(object):
+    __slots__ = ("_data", "_modified", "_freeze")
+
     def __init__(self, definition):
         definition = definition or {}
         self._data = {str(k): PackageOption(v, str(k))
@@ -507,6 +515,8 @@ class Options(object):
     """ All options of a package, both its own options and the upstream ones.
     Owned by ConanFile.
     """
+    __slots__ = ("_package_options", "_deps_package_values")
+
     def __init__(self, options):
         assert isinstance(options, PackageOptions)
         self._package_options = options
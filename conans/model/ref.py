@@ -2,6 +2,7 @@ import re
 from collections import namedtuple
 
 from six import string_types
+from six.moves import intern
 
 from conans.errors import ConanException, InvalidNameException
 from conans.model.version import Version
@@ -20,6 +21,16 @@ def _split_pair(pair, split_char):
         return words
 
 
+def _intern(text):
+    """ the same names, users, channels, revisions and package IDs are repeated in all the
+    references of a graph, share a single copy of every string
+    """
+    try:
+        return intern(text)
+    except TypeError:  # None, or unicode in py2
+        return text
+
+
 def _noneize(text):
     if not text or text == "_":
         return None
@@ -90,6 +101,47 @@ def check_valid_ref(reference, strict_mode=True):
         return False
 
 
+class _Interned(object):
+    """ process-wide {key: value} map of the parsed references and of their string forms.
+    The references are immutable, so the same object can be shared by all the callers, and
+    its validation and formatting are done once. It is just emptied when full, most of the
+    lookups are done by a command for the references of the same graph
+    """
+    def __init__(self, max_size=50000):
+        self._entries = {}
+        self._max_size = max_size
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        if len(self._entries) >= self._max_size:
+            self._entries.clear()
+        self._entries[key] = value
+        return value
+
+
+_loaded_refs = _Interned()  # {text: (ConanFileReference, validated)}
+_loaded_prefs = _Interned()  # {text: (PackageReference, validated)}
+_ref_strings = _Interned()  # {(method, reference): string}
+
+
+def _cached_string(method):
+    """ decorator of the methods formatting a reference, to do it once per reference
+    """
+    name = method.__name__
+
+    def wrapper(ref):
+        key = (name, ref)
+        result = _ref_strings.get(key)
+        if result is None:
+            result = _ref_strings.set(key, method(ref))
+        return result
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
 class ConanName(object):
     _max_chars = 51
     _min_chars = 2
@@ -151,6 +203,7 @@ class ConanFileReference(namedtuple("ConanFileReference", "name version user cha
     """ Full reference of a package recipes, e.g.:
     opencv/2.4.10@lasote/testing
     """
+    __slots__ = ()
 
     def __new__(cls, name, version, user, channel, revision=None, validate=True):
         """Simple name creation.
@@ -164,10 +217,11 @@ class ConanFileReference(namedtuple("ConanFileReference", "name version user cha
             raise InvalidNameException("Specify the 'user' and the 'channel' or neither of them")
 
         version = Version(version) if version is not None else None
-        user = _noneize(user)
-        channel = _noneize(channel)
+        user = _intern(_noneize(user))
+        channel = _intern(_noneize(channel))
 
-        obj = super(cls, ConanFileReference).__new__(cls, name, version, user, channel, revision)
+        obj = super(cls, ConanFileReference).__new__(cls, _intern(name), version, user, channel,
+                                                     _intern(revision))
         if validate:
             obj._validate()
         return obj
@@ -192,10 +246,17 @@ class ConanFileReference(namedtuple("ConanFileReference", "name version user cha
 
     @staticmethod
     def loads(text, validate=True):
-        """ Parses a text string to generate a ConanFileReference object
+        """ Parses a text string to generate a ConanFileReference object. The same text
+        always returns the same shared object
         """
-        name, version, user, channel, revision = get_reference_fields(text)
-        ref = ConanFileReference(name, version, user, channel, revision, validate=validate)
+        ref, validated = _loaded_refs.get(text) or (None, False)
+        if ref is None:
+            name, version, user, channel, revision = get_reference_fields(text)
+            ref = ConanFileReference(name, version, user, channel, revision, validate=validate)
+            _loaded_refs.set(text, (ref, validate))
+        elif validate and not validated:
+            ref._validate()
+            _loaded_refs.set(text, (ref, True))
         return ref
 
     @staticmethod
@@ -207,6 +268,7 @@ class ConanFileReference(namedtuple("ConanFileReference", "name version user cha
             channel = None
         return ConanFileReference(name, version, user, channel)
 
+    @_cached_string
     def __str__(self):
         if self.name is None and self.version is None:
             return ""
@@ -214,15 +276,18 @@ class ConanFileReference(namedtuple("ConanFileReference", "name version user cha
             return "%s/%s" % (self.name, self.version)
         return "%s/%s@%s/%s" % (self.name, self.version, self.user, self.channel)
 
+    @_cached_string
     def __repr__(self):
         str_rev = "#%s" % self.revision if self.revision else ""
         user_channel = "@%s/%s" % (self.user, self.channel) if self.user or self.channel else ""
         return "%s/%s%s%s" % (self.name, self.version, user_channel, str_rev)
 
+    @_cached_string
     def full_str(self):
         str_rev = "#%s" % self.revision if self.revision else ""
         return "%s%s" % (str(self), str_rev)
 
+    @_cached_string
     def dir_repr(self):
         return "/".join([self.name, self.version, self.user or "_", self.channel or "_"])
 
@@ -255,11 +320,13 @@ class PackageReference(namedtuple("PackageReference", "ref id revision")):
     """ Full package reference, e.g.:
     opencv/2.4.10@lasote/testing, fe566a677f77734ae
     """
+    __slots__ = ()
 
     def __new__(cls, ref, package_id, revision=None, validate=True):
         if "#" in package_id:
             package_id, revision = package_id.rsplit("#", 1)
-        obj = super(cls, PackageReference).__new__(cls, ref, package_id, revision)
+        obj = super(cls, PackageReference).__new__(cls, ref, _intern(package_id),
+                                                   _intern(revision))
         if validate:
             obj.validate()
         return obj
@@ -270,23 +337,35 @@ class PackageReference(namedtuple("PackageReference", "ref id revision")):
 
     @staticmethod
     def loads(text, validate=True):
-        text = text.strip()
-        tmp = text.split(":")
+        pref, validated = _loaded_prefs.get(text) or (None, False)
+        if pref is not None:
+            if validate and not validated:
+                pref.ref._validate()
+                pref.validate()
+                _loaded_prefs.set(text, (pref, True))
+            return pref
+
+        tmp = text.strip().split(":")
         try:
             ref = ConanFileReference.loads(tmp[0].strip(), validate=validate)
             package_id = tmp[1].strip()
         except IndexError:
-            raise ConanException("Wrong package reference %s" % text)
-        return PackageReference(ref, package_id, validate=validate)
+            raise ConanException("Wrong package reference %s" % text.strip())
+        pref = PackageReference(ref, package_id, validate=validate)
+        _loaded_prefs.set(text, (pref, validate))
+        return pref
 
+    @_cached_string
     def __repr__(self):
         str_rev = "#%s" % self.revision if self.revision else ""
         tmp = "%s:%s%s" % (repr(self.ref), self.id, str_rev)
         return tmp
 
+    @_cached_string
     def __str__(self):
         return "%s:%s" % (self.ref, self.id)
 
+    @_cached_string
     def full_str(self):
         str_rev = "#%s" % self.revision if self.revision else ""
         tmp = "%s:%s%s" % (self.ref.full_str(), self.id, str_rev)
@@ -11,6 +11,9 @@ class Requirement(object):
     """ A reference to a package plus some attributes of how to
     depend on that package
     """
+    __slots__ = ("ref", "range_ref", "override", "private", "build_require",
+                 "build_require_context", "_locked_id")
+
     def __init__(self, ref, private=False, override=False):
         """
         param override: True means that this is not an actual requirement, but something to
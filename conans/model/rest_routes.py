@@ -33,6 +33,10 @@ class RestRoutes(object):
     def recipe_revisions(self):
         return '%s/revisions' % self.recipe
 
+    @property
+    def recipe_revision_copy(self):
+        return '%s/copy' % self.recipe_revision
+
     @property
     def recipe_revision_file(self):
         return '%s/files/{path}' % self.recipe_revision
@@ -3,6 +3,8 @@ from conans.util.sha import sha1
 
 
 class Values(object):
+    __slots__ = ("_value", "_dict", "_modified")
+
     def __init__(self, value="values"):
         self._value = str(value)
         self._dict = {}  # {key: Values()}
@@ -60,3 +60,5 @@ BUILD_FOLDER = "build"
 PACKAGES_FOLDER = "package"
 SYSTEM_REQS_FOLDER = "system_reqs"
 SCM_SRC_FOLDER = "scm_source"
+USAGE_FOLDER = "usage"
+PACKAGE_INFO_FOLDER = "package_info"
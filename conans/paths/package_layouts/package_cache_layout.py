@@ -16,7 +16,8 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    USAGE_FOLDER, PACKAGE_INFO_FOLDER
 from conans.util.files import load, save, rmdir
 from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
 from conans.util.log import logger
@@ -38,12 +39,32 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, secondary_folder=None):
+        """ :param secondary_folder: folder of the same reference in a read-only storage, where
+        the recipe, its metadata and packages are read from, if they are not in base_folder.
+        Its packages are used only while its recipe is. Only the read_xxx() methods return its
+        folders, all the others are in base_folder
+        """
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._secondary_folder = secondary_folder
+
+    def _secondary_path(self, relpath):
+        """ the path in the secondary folder if it is only there, None otherwise """
+        if self._secondary_folder is None:
+            return None
+        if os.path.exists(os.path.join(self._base_folder, relpath)):
+            return None
+        secondary = os.path.join(self._secondary_folder, relpath)
+        if not os.path.exists(secondary):
+            return None
+        if platform.system() == "Windows":
+            from conans.util.windows import path_shortener
+            secondary = path_shortener(secondary, None)  # Never creates the short path
+        return secondary
 
     @property
     def ref(self):
@@ -56,14 +77,24 @@ class PackageCacheLayout(object):
     def export(self):
         return os.path.join(self._base_folder, EXPORT_FOLDER)
 
+    def read_export(self):
+        """ the export folder, of this cache or of the secondary storage, only for reading """
+        return self._secondary_path(EXPORT_FOLDER) or self.export()
+
     def conanfile(self):
-        export = self.export()
+        export = self.read_export()
         return os.path.join(export, CONANFILE)
 
     @short_path
     def export_sources(self):
         return os.path.join(self._base_folder, EXPORT_SRC_FOLDER)
 
+    def read_export_sources(self):
+        """ the export_source folder, of this cache or of the secondary storage, only for
+        reading
+        """
+        return self._secondary_path(EXPORT_SRC_FOLDER) or self.export_sources()
+
     @short_path
     def source(self):
         return os.path.join(self._base_folder, SRC_FOLDER)
@@ -110,27 +141,35 @@ class PackageCacheLayout(object):
         assert pref.ref == self._ref, "{!r} != {!r}".format(pref.ref, self._ref)
         return os.path.join(self._base_folder, PACKAGES_FOLDER, pref.id)
 
+    def read_package(self, pref):
+        """ the package folder, of this cache or of the secondary storage, only for reading """
+        assert isinstance(pref, PackageReference)
+        assert pref.ref == self._ref, "{!r} != {!r}".format(pref.ref, self._ref)
+        if self._secondary_path(EXPORT_FOLDER) is None:  # A recipe of this cache overrides it
+            return self.package(pref)
+        return self._secondary_path(os.path.join(PACKAGES_FOLDER, pref.id)) or self.package(pref)
+
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
 
     def recipe_manifest(self):
-        return FileTreeManifest.load(self.export())
+        return FileTreeManifest.load(self.read_export())
 
     def package_manifests(self, pref):
-        package_folder = self.package(pref)
+        package_folder = self.read_package(pref)
         readed_manifest = FileTreeManifest.load(package_folder)
         expected_manifest = FileTreeManifest.create(package_folder)
         return readed_manifest, expected_manifest
 
     def recipe_exists(self):
-        return os.path.exists(self.export()) and \
+        return os.path.exists(self.read_export()) and \
                (not self._ref.revision or self.recipe_revision() == self._ref.revision)
 
     def package_exists(self, pref):
         assert isinstance(pref, PackageReference)
         assert pref.ref == self._ref
         return (self.recipe_exists() and
-                os.path.exists(self.package(pref)) and
+                os.path.exists(self.read_package(pref)) and
                 (not pref.revision or self.package_revision(pref) == pref.revision))
 
     def recipe_revision(self):
@@ -155,41 +194,87 @@ class PackageCacheLayout(object):
         return builds
 
     def conan_packages(self):
-        packages_dir = self.packages()
-        try:
-            packages = [dirname for dirname in os.listdir(packages_dir)
-                        if os.path.isdir(os.path.join(packages_dir, dirname))]
-        except OSError:  # if there isn't any package folder
-            packages = []
+        packages = []
+        for packages_dir in self._packages_folders():
+            try:
+                packages.extend(dirname for dirname in os.listdir(packages_dir)
+                                if os.path.isdir(os.path.join(packages_dir, dirname)) and
+                                dirname not in packages)
+            except OSError:  # if there isn't any package folder
+                pass
         return packages
 
+    def _packages_folders(self):
+        if self._secondary_path(EXPORT_FOLDER) is None:
+            return [self.packages()]
+        return [self.packages(), os.path.join(self._secondary_folder, PACKAGES_FOLDER)]
+
     # Metadata
     def load_metadata(self):
         try:
-            text = load(self.package_metadata())
+            text = load(self._secondary_path(PACKAGE_METADATA) or self.package_metadata())
         except IOError:
             raise RecipeNotFoundException(self._ref)
         return PackageMetadata.loads(text)
 
     _metadata_locks = {}  # Needs to be shared among all instances
 
+    def _load_or_new_metadata(self):
+        """ returns the metadata and its stored contents, None if it has to be created """
+        try:
+            metadata = self.load_metadata()
+        except RecipeNotFoundException:
+            return PackageMetadata(), None
+        if not os.path.exists(self.package_metadata()):  # Read from the secondary storage
+            return metadata, None
+        return metadata, metadata.dumps()
+
     @contextmanager
     def update_metadata(self):
+        # Always written in this cache, starting from the secondary one if it is only there
         metadata_path = self.package_metadata()
         lockfile = metadata_path + ".lock"
-        with fasteners.InterProcessLock(lockfile, logger=logger):
-            lock_name = self.package_metadata()  # The path is the thing that defines mutex
-            thread_lock = PackageCacheLayout._metadata_locks.setdefault(lock_name, threading.Lock())
-            thread_lock.acquire()
-            try:
-                try:
-                    metadata = self.load_metadata()
-                except RecipeNotFoundException:
-                    metadata = PackageMetadata()
+        # The path is the thing that defines mutex
+        thread_lock = PackageCacheLayout._metadata_locks.setdefault(metadata_path,
+                                                                    threading.Lock())
+        with thread_lock:
+            with fasteners.InterProcessLock(lockfile, logger=logger):
+                metadata, stored = self._load_or_new_metadata()
                 yield metadata
-                save(metadata_path, metadata.dumps())
-            finally:
-                thread_lock.release()
+                content = metadata.dumps()
+                if content != stored:  # Not rewritten if nothing changed
+                    save(metadata_path, content)
+
+    # Usage
+    def usage(self, pref=None):
+        """ file whose modification time is the last time the recipe, or the package if
+        defined, was used. They are not in the metadata, so it is not rewritten for every use
+        """
+        name = pref.id if pref is not None else "recipe"
+        return os.path.join(self._base_folder, USAGE_FOLDER, name)
+
+    def record_usage(self, pref=None):
+        usage = self.usage(pref)
+        try:
+            try:
+                os.utime(usage, None)
+            except OSError:  # First use
+                save(usage, "")
+        except (IOError, OSError) as e:  # e.g. read-only cache, the usage is not critical
+            logger.debug("USAGE: Cannot record the usage of %s: %s" % (usage, str(e)))
+
+    def last_used(self, pref=None):
+        """ timestamp of the last use of the recipe or package, None if never recorded """
+        try:
+            return os.path.getmtime(self.usage(pref))
+        except OSError:
+            return None
+
+    def package_info_cache(self, pref):
+        """ json file with the results of the package_info() of the package """
+        assert isinstance(pref, PackageReference)
+        assert pref.ref == self._ref, "{!r} != {!r}".format(pref.ref, self._ref)
+        return os.path.join(self._base_folder, PACKAGE_INFO_FOLDER, "%s.json" % pref.id)
 
     # Locks
     def conanfile_read_lock(self, output):
@@ -229,10 +314,10 @@ class PackageCacheLayout(object):
         assert not os.path.isabs(path)
 
         if package_id is None:  # Get the file in the exported files
-            folder = self.export()
+            folder = self.read_export()
         else:
             pref = PackageReference(self._ref, package_id)
-            folder = self.package(pref)
+            folder = self.read_package(pref)
 
         abs_path = os.path.join(folder, path)
         if not os.path.exists(abs_path):
@@ -243,9 +328,8 @@ class PackageCacheLayout(object):
             return load(abs_path)
 
     def packages_ids(self):
-        packages_folder = self.packages()
-        if os.path.exists(packages_folder):
-            pkg_ids = [d for d in os.listdir(packages_folder)]
-        else:
-            pkg_ids = []
+        pkg_ids = []
+        for packages_folder in self._packages_folders():
+            if os.path.exists(packages_folder):
+                pkg_ids.extend(d for d in os.listdir(packages_folder) if d not in pkg_ids)
         return pkg_ids
@@ -41,9 +41,15 @@ class PackageEditableLayout(object):
     def export(self):
         raise ConanException("Operation not allowed on a package installed as editable")
 
+    def read_export(self):
+        raise ConanException("Operation not allowed on a package installed as editable")
+
     def export_sources(self):
         raise ConanException("Operation not allowed on a package installed as editable")
 
+    def read_export_sources(self):
+        raise ConanException("Operation not allowed on a package installed as editable")
+
     def source(self):
         raise ConanException("Operation not allowed on a package installed as editable")
 
@@ -55,6 +61,11 @@ class PackageEditableLayout(object):
         assert pref.ref == self._ref
         raise ConanException("Operation not allowed on a package installed as editable")
 
+    def read_package(self, pref):
+        assert isinstance(pref, PackageReference)
+        assert pref.ref == self._ref
+        raise ConanException("Operation not allowed on a package installed as editable")
+
     def package_metadata(self):
         raise ConanException("Package metadata is not available for editable packages")
 
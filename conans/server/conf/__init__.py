@@ -49,6 +49,8 @@ class ConanServerConfigParser(ConfigParser):
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
+                           "revisions_cache_check": get_env("CONAN_SERVER_REVISIONS_CACHE_CHECK",
+                                                            None, environment),
                            # "user:pass,user2:pass2"
                            "users": get_env("CONAN_SERVER_USERS", None, environment)}
 
@@ -92,6 +94,14 @@ class ConanServerConfigParser(ConfigParser):
         except ConanException:
             return None
 
+    @property
+    def revisions_cache_check(self):
+        try:
+            check = str(self._get_conf_server_string("revisions_cache_check")).lower()
+            return check not in ("false", "0")
+        except ConanException:
+            return True
+
     @property
     def port(self):
         return int(self._get_conf_server_string("port"))
@@ -220,9 +230,10 @@ class ConanServerConfigParser(ConfigParser):
         return timedelta(minutes=float(self._get_conf_server_string("jwt_expire_minutes")))
 
 
-def get_server_store(disk_storage_path, public_url, updown_auth_manager):
+def get_server_store(disk_storage_path, public_url, updown_auth_manager,
+                     revisions_cache_check=True):
     disk_controller_url = "%s/%s" % (public_url, "files")
     if not updown_auth_manager:
         raise Exception("Updown auth manager needed for disk controller (not s3)")
     adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager)
-    return ServerStore(adapter)
+    return ServerStore(adapter, revisions_cache_check=revisions_cache_check)
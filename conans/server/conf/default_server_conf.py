@@ -20,6 +20,9 @@ disk_storage_path: ./data
 disk_authorize_timeout: 1800
 updown_secret: {updown_secret}
 
+# The revisions files are cached in memory. Every lookup checks that the file wasn't modified
+# by other processes, disable it only if a single conan_server process uses the storage
+# revisions_cache_check: True
 
 # Check docs.conan.io to implement a different authenticator plugin for conan_server
 # if custom_authenticator is not specified, [users] section will be used to authenticate
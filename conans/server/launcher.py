@@ -37,7 +37,8 @@ class ServerLauncher(object):
 
         server_store = get_server_store(server_config.disk_storage_path,
                                         server_config.public_url,
-                                        updown_auth_manager=updown_auth_manager)
+                                        updown_auth_manager=updown_auth_manager,
+                                        revisions_cache_check=server_config.revisions_cache_check)
 
         server_capabilities = SERVER_CAPABILITIES
         server_capabilities.append(REVISIONS)
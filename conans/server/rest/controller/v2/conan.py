@@ -61,3 +61,15 @@ class ConanControllerV2(object):
             ref = ConanFileReference(name, version, username, channel, revision)
             conan_service.upload_recipe_file(request.body, request.headers, ref, the_path, auth_user)
 
+        @app.route(r.recipe_revision_copy, method=["POST"])
+        def copy_recipe(name, version, username, channel, auth_user, revision):
+            """ Copies the recipe revision, and its binaries, to another user/channel. The body is
+            a JSON with the destination "user" and "channel", the "package_ids" to copy (all
+            if null) and "force" to override the destination
+            """
+            ref = ConanFileReference(name, version, username, channel, revision)
+            data = request.json or {}
+            dest_ref = ConanFileReference(name, version, data.get("user"), data.get("channel"))
+            return conan_service.copy_recipe(ref, dest_ref, data.get("package_ids"),
+                                             data.get("force", False), auth_user)
+
@@ -0,0 +1,75 @@
+import email.utils
+import mimetypes
+import os
+
+from bottle import HTTPError, HTTPResponse, parse_range_header, request
+
+from conans.server.service.mime import get_mime_type
+from conans.server.store.disk_adapter import get_checksum
+
+
+def _file_range(f, offset, size, chunk_size=1024 * 1024):
+    try:
+        f.seek(offset)
+        while size > 0:
+            chunk = f.read(min(size, chunk_size))
+            if not chunk:
+                break
+            size -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
+def serve_file(path):
+    """ equivalent to bottle static_file() for a stored file, but using its stored md5 as the
+    ETag, so conditional requests (If-None-Match, If-Range) are answered without reading it.
+    Full contents are returned as a file object, that bottle passes to the WSGI server file
+    wrapper (zero-copy sendfile() in most of the production servers)
+    """
+    if not os.path.isfile(path):
+        return HTTPError(404, "File does not exist.")
+    if not os.access(path, os.R_OK):
+        return HTTPError(403, "You do not have permission to access this file.")
+
+    headers = {}
+    mimetype = get_mime_type(path)
+    if mimetype == "auto":
+        mimetype, encoding = mimetypes.guess_type(path)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+    if mimetype:
+        if mimetype.startswith("text/") and "charset" not in mimetype:
+            mimetype += "; charset=UTF-8"
+        headers["Content-Type"] = mimetype
+
+    stats = os.stat(path)
+    size = stats.st_size
+    etag = '"%s"' % get_checksum(path)
+    headers["Content-Length"] = str(size)
+    headers["Last-Modified"] = email.utils.formatdate(stats.st_mtime, usegmt=True)
+    headers["ETag"] = etag
+    headers["Accept-Ranges"] = "bytes"
+
+    if_none_match = request.environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        if etag in tags or "*" in tags:
+            return HTTPResponse(status=304, **headers)
+
+    if request.method == "HEAD":
+        return HTTPResponse("", **headers)
+
+    range_header = request.environ.get("HTTP_RANGE")
+    if_range = request.environ.get("HTTP_IF_RANGE")
+    if range_header and (not if_range or if_range == etag):
+        ranges = list(parse_range_header(range_header, size))
+        if not ranges:
+            return HTTPError(416, "Requested Range Not Satisfiable")
+        offset, end = ranges[0]
+        headers["Content-Range"] = "bytes %d-%d/%d" % (offset, end - 1, size)
+        headers["Content-Length"] = str(end - offset)
+        return HTTPResponse(_file_range(open(path, "rb"), offset, end - offset), status=206,
+                            **headers)
+
+    return HTTPResponse(open(path, "rb"), **headers)
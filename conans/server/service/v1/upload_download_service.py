@@ -3,6 +3,7 @@ import os
 import jwt
 
 from conans.errors import NotFoundException, RequestErrorException
+from conans.server.store.disk_adapter import save_file_upload
 from conans.util.log import logger
 from conans.util.files import mkdir
 
@@ -28,7 +29,7 @@ class FileUploadDownloadService(object):
 
     def put_file(self, file_saver, abs_filepath, token, upload_size):
         """
-        file_saver is an object with the save() method without parameters
+        file_saver is an object with the save() method, receiving a file-like object
         """
         try:
             encoded_path, filesize, user = self.updown_auth_manager.get_resource_info(token)
@@ -44,7 +45,7 @@ class FileUploadDownloadService(object):
             mkdir(os.path.dirname(abs_filepath))
             if os.path.exists(abs_filepath):
                 os.remove(abs_filepath)
-            file_saver.save(os.path.dirname(abs_filepath))
+            save_file_upload(file_saver, os.path.dirname(abs_filepath))
 
         except (jwt.ExpiredSignature, jwt.DecodeError, AttributeError):
             raise NotFoundException("File not found")
@@ -1,10 +1,13 @@
 import os
 
-from bottle import FileUpload, static_file
+from bottle import FileUpload
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
+from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException, \
+    RequestErrorException
+from conans.model.ref import PackageReference
 from conans.server.service.common.common import CommonService
-from conans.server.service.mime import get_mime_type
+from conans.server.service.file_server import serve_file
+from conans.server.store.disk_adapter import save_file_upload
 from conans.server.store.server_store import ServerStore
 from conans.util.files import mkdir
 
@@ -32,8 +35,7 @@ class ConanServiceV2(CommonService):
     def get_conanfile_file(self, reference, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, reference)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return serve_file(path)
 
     def upload_recipe_file(self, body, headers, reference, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, reference)
@@ -86,8 +88,7 @@ class ConanServiceV2(CommonService):
     def get_package_file(self, pref, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return serve_file(path)
 
     def upload_package_file(self, body, headers, pref, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, pref.ref)
@@ -103,6 +104,38 @@ class ConanServiceV2(CommonService):
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_package_revision(pref)
 
+    # COPY METHODS
+    def copy_recipe(self, ref, dest_ref, package_ids, force, auth_user):
+        """ copies the recipe revision and the latest revision of the given binaries (all of them
+        if package_ids is None) to dest_ref, without moving them through the client
+        """
+        self._authorizer.check_read_conan(auth_user, ref)
+        self._authorizer.check_write_conan(auth_user, dest_ref)
+        if not self._server_store.path_exists(self._server_store.export(ref)):
+            raise RecipeNotFoundException(ref, print_rev=True)
+        dest_ref = dest_ref.copy_with_rev(ref.revision)
+        if not force and self._server_store.path_exists(self._server_store.export(dest_ref)):
+            raise RequestErrorException("'%s' already exists. Use force to override it"
+                                        % dest_ref.full_str())
+
+        if package_ids is None:
+            packages_folder = self._server_store.packages(ref)
+            package_ids = os.listdir(packages_folder) if os.path.isdir(packages_folder) else []
+        prefs = []
+        for package_id in package_ids:
+            pref = PackageReference(ref, package_id)
+            latest = self._server_store.get_last_package_revision(pref)
+            if not latest:
+                raise PackageNotFoundException(pref)
+            prefs.append(pref.copy_with_revs(ref.revision, latest.revision))
+
+        self._server_store.copy_recipe(ref, dest_ref)
+        for pref in prefs:
+            dest_pref = PackageReference(dest_ref, pref.id, pref.revision)
+            self._server_store.copy_package(pref, dest_pref)
+        return {"reference": dest_ref.full_str(),
+                "packages": {pref.id: pref.revision for pref in prefs}}
+
     # Misc
     @staticmethod
     def _upload_to_path(body, headers, path):
@@ -113,4 +146,4 @@ class ConanServiceV2(CommonService):
             os.unlink(path)
         if not os.path.exists(os.path.dirname(path)):
             mkdir(os.path.dirname(path))
-        file_saver.save(os.path.dirname(path))
+        save_file_upload(file_saver, os.path.dirname(path))
@@ -1,10 +1,108 @@
+import hashlib
+import json
 import os
+import platform
+import shutil
+import uuid
 
 import fasteners
 
 from conans.client.tools.env import no_op
 from conans.errors import NotFoundException
-from conans.util.files import decode_text, md5sum, path_exists, relative_dirs, rmdir
+from conans.util.files import (decode_text, load, md5sum, mkdir, path_exists, relative_dirs,
+                               rmdir, save)
+
+_CHECKSUMS_FOLDER_SUFFIX = ".checksums"
+
+
+def _checksum_path(path):
+    """ the md5 of every stored file is kept in a sidecar file, in a folder next to the one
+    containing the file, so the stored folders only contain the uploaded files. It also keeps
+    the size and modification time of the file it was computed for
+    """
+    folder, filename = os.path.split(path)
+    return os.path.join(folder + _CHECKSUMS_FOLDER_SUFFIX, filename + ".md5")
+
+
+def _is_checksum_file(path):
+    return os.path.dirname(path).endswith(_CHECKSUMS_FOLDER_SUFFIX)
+
+
+def _remove_checksum(path):
+    try:
+        os.remove(_checksum_path(path))
+    except OSError:
+        pass
+
+
+class _ChecksumWriter(object):
+    """ file-like object computing the md5 of the contents while they are written
+    """
+    def __init__(self, f):
+        self._file = f
+        self._md5 = hashlib.md5()
+
+    def write(self, data):
+        self._md5.update(data)
+        self._file.write(data)
+
+    def hexdigest(self):
+        return self._md5.hexdigest()
+
+
+def _replace(src, dst):
+    try:
+        os.replace(src, dst)
+    except AttributeError:  # Python 2, that cannot rename over an existing file in Windows
+        if platform.system() == "Windows" and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+def save_file_upload(file_upload, folder):
+    """ saves the uploaded file (a bottle FileUpload) into the folder, computing its md5 while
+    it streams in, so it doesn't have to be computed again to get the snapshots. It is written
+    to a temporary file that replaces the existing one, that can be hard linked by copy_folder()
+    """
+    path = os.path.join(folder, file_upload.filename)
+    _remove_checksum(path)
+    # In the same filesystem, but not in the snapshots
+    tmp_path = os.path.join(os.path.dirname(_checksum_path(path)), uuid.uuid4().hex + ".upload")
+    mkdir(os.path.dirname(tmp_path))
+    try:
+        with open(tmp_path, "wb") as f:
+            writer = _ChecksumWriter(f)
+            file_upload.save(writer)
+        _replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _save_checksum(path, writer.hexdigest())
+    return path
+
+
+def _save_checksum(path, checksum):
+    st = os.stat(path)
+    save(_checksum_path(path), json.dumps({"md5": checksum, "size": st.st_size,
+                                           "mtime": st.st_mtime}))
+
+
+def get_checksum(path):
+    """ the md5 stored for the file when it was uploaded. For files without it (uploaded by a
+    previous version of the server) or whose size or modification time are not the stored
+    ones, it is computed and stored
+    """
+    try:
+        stored = json.loads(load(_checksum_path(path)))
+        st = os.stat(path)
+        if stored["size"] == st.st_size and stored["mtime"] == st.st_mtime:
+            return stored["md5"]
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+    checksum = md5sum(path)
+    _save_checksum(path, checksum)
+    return checksum
 
 
 class ServerDiskAdapter(object):
@@ -59,7 +157,7 @@ class ServerDiskAdapter(object):
     def _get_paths(self, absolute_path, files_subset):
         if not path_exists(absolute_path, self._store_folder):
             raise NotFoundException("")
-        paths = relative_dirs(absolute_path)
+        paths = [p for p in relative_dirs(absolute_path) if not _is_checksum_file(p)]
         if files_subset is not None:
             paths = set(paths).intersection(set(files_subset))
         abs_paths = [os.path.join(absolute_path, relpath) for relpath in paths]
@@ -68,7 +166,7 @@ class ServerDiskAdapter(object):
     def get_snapshot(self, absolute_path="", files_subset=None):
         """returns a dict with the filepaths and md5"""
         abs_paths = self._get_paths(absolute_path, files_subset)
-        return {filepath: md5sum(filepath) for filepath in abs_paths}
+        return {filepath: get_checksum(filepath) for filepath in abs_paths}
 
     def get_file_list(self, absolute_path="", files_subset=None):
         abs_paths = self._get_paths(absolute_path, files_subset)
@@ -79,12 +177,38 @@ class ServerDiskAdapter(object):
         if not path_exists(path, self._store_folder):
             raise NotFoundException("")
         rmdir(path)
+        rmdir(path.rstrip("/\\") + _CHECKSUMS_FOLDER_SUFFIX)
+
+    def copy_folder(self, src, dst):
+        """ copies the files of a folder, and their checksums, to another one. The files are hard
+        linked when possible, as the stored files are never modified, only removed or replaced
+        by save_file_upload(). The checksum files are always copied, because they are rewritten
+        """
+        if not path_exists(src, self._store_folder):
+            raise NotFoundException("")
+        for src_folder, dst_folder in ((src, dst), (src.rstrip("/\\") + _CHECKSUMS_FOLDER_SUFFIX,
+                                                    dst.rstrip("/\\") + _CHECKSUMS_FOLDER_SUFFIX)):
+            if not os.path.isdir(src_folder):
+                continue
+            for relpath in relative_dirs(src_folder):
+                src_path = os.path.join(src_folder, relpath)
+                dst_path = os.path.join(dst_folder, relpath)
+                mkdir(os.path.dirname(dst_path))
+                if _is_checksum_file(src_path):
+                    if src_path.endswith(".md5"):  # Not the files being uploaded
+                        shutil.copy2(src_path, dst_path)
+                    continue
+                try:
+                    os.link(src_path, dst_path)
+                except (AttributeError, OSError):  # No hard links in the platform or filesystem
+                    shutil.copy2(src_path, dst_path)
 
     def delete_file(self, path):
         """Delete files from bucket. Path already contains base dir"""
         if not path_exists(path, self._store_folder):
             raise NotFoundException("")
         os.remove(path)
+        _remove_checksum(path)
 
     def path_exists(self, path):
         return os.path.exists(path)
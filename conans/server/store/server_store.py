@@ -1,4 +1,5 @@
 import os
+import threading
 from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
@@ -10,11 +11,65 @@ from conans.server.revision_list import RevisionList
 REVISIONS_FILE = "revisions.txt"
 
 
+class _RevisionsCache(object):
+    """ process-wide cache of the parsed revisions files {path: (stamp, RevisionList)}, so
+    the revision lookups don't have to read and parse them under a file lock.
+    The stamp is the (mtime, size) of the file when it was read. If check_mtime is enabled,
+    every lookup compares it with the file in disk to discard entries modified by other
+    processes. If not, the cache is only coherent with the changes done by this process
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def stamp(path):
+        try:
+            stats = os.stat(path)
+        except OSError:
+            return None
+        return stats.st_mtime, stats.st_size
+
+    def get(self, path, check_mtime):
+        """ returns the cached RevisionList, or None if it is not cached or it is outdated
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None:
+            return None
+        stamp, rev_list = entry
+        if check_mtime and stamp != self.stamp(path):
+            return None
+        return rev_list
+
+    def set(self, path, stamp, rev_list):
+        with self._lock:
+            self._entries[path] = stamp, rev_list
+
+    def invalidate(self, path):
+        """ removes the entry of the revisions file, or of all the revision files inside the
+        folder
+        """
+        prefix = os.path.join(path, "")
+        with self._lock:
+            for p in [p for p in self._entries if p == path or p.startswith(prefix)]:
+                del self._entries[p]
+
+
+_revisions_cache = _RevisionsCache()
+
+
 class ServerStore(object):
 
-    def __init__(self, storage_adapter):
+    def __init__(self, storage_adapter, revisions_cache_check=True):
+        """
+        :param revisions_cache_check: check the revision files modification time before using
+            their cached contents. It can be disabled only if this process is the only one
+            modifying the storage
+        """
         self._storage_adapter = storage_adapter
         self._store_folder = storage_adapter._store_folder
+        self._revisions_cache_check = revisions_cache_check
 
     @property
     def store(self):
@@ -115,9 +170,9 @@ class ServerStore(object):
     def remove_conanfile(self, ref):
         assert isinstance(ref, ConanFileReference)
         if not ref.revision:
-            self._storage_adapter.delete_folder(self.conan_revisions_root(ref))
+            self._delete_folder(self.conan_revisions_root(ref))
         else:
-            self._storage_adapter.delete_folder(self.base_folder(ref))
+            self._delete_folder(self.base_folder(ref))
             self._remove_revision_from_index(ref)
         self._delete_empty_dirs(ref)
 
@@ -127,13 +182,13 @@ class ServerStore(object):
 
         if not package_ids_filter:  # Remove all packages
             packages_folder = self.packages(ref)
-            self._storage_adapter.delete_folder(packages_folder)
+            self._delete_folder(packages_folder)
         else:
             for package_id in package_ids_filter:
                 pref = PackageReference(ref, package_id)
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
-                self._storage_adapter.delete_folder(package_folder)
+                self._delete_folder(package_folder)
         self._delete_empty_dirs(ref)
 
     def remove_package(self, pref):
@@ -141,14 +196,39 @@ class ServerStore(object):
         assert pref.revision is not None, "BUG: server store needs PREV remove_package"
         assert pref.ref.revision is not None, "BUG: server store needs RREV remove_package"
         package_folder = self.package(pref)
-        self._storage_adapter.delete_folder(package_folder)
+        self._delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
-        self._storage_adapter.delete_folder(packages_folder)
+        self._delete_folder(packages_folder)
+
+    def _delete_folder(self, folder):
+        self._storage_adapter.delete_folder(folder)
+        _revisions_cache.invalidate(folder)
+
+    # ######### COPY (APIv2)
+    def copy_recipe(self, ref, dest_ref):
+        """ copies the files of the recipe revision, without its packages, to the same revision of
+        dest_ref, that becomes its latest revision
+        """
+        assert ref.revision is not None, "BUG: server store needs RREV copy_recipe"
+        assert dest_ref.revision == ref.revision, "BUG: copy_recipe keeps the RREV"
+        self._copy_folder(self.export(ref), self.export(dest_ref))
+        self.update_last_revision(dest_ref)
+
+    def copy_package(self, pref, dest_pref):
+        assert pref.revision is not None, "BUG: server store needs PREV copy_package"
+        assert dest_pref.revision == pref.revision, "BUG: copy_package keeps the PREV"
+        self._copy_folder(self.package(pref), self.package(dest_pref))
+        self.update_last_package_revision(dest_pref)
+
+    def _copy_folder(self, src, dst):
+        if self.path_exists(dst):
+            self._delete_folder(dst)
+        self._storage_adapter.copy_folder(src, dst)
 
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
@@ -254,17 +334,19 @@ class ServerStore(object):
         self._update_last_revision(rev_file_path, pref)
 
     def _update_last_revision(self, rev_file_path, ref):
+        if ref.revision is None:
+            raise ConanException("Invalid revision for: %s" % ref.full_str())
+        # Each uploaded file updates the revision, nothing to write if it is already the latest
+        rev_list = _revisions_cache.get(rev_file_path, check_mtime=True)
+        latest = rev_list.latest_revision() if rev_list is not None else None
+        if latest and latest.revision == ref.revision:
+            return
         if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
+            rev_list = self._read_revisions_file(rev_file_path)
         else:
             rev_list = RevisionList()
-        if ref.revision is None:
-            raise ConanException("Invalid revision for: %s" % ref.full_str())
         rev_list.add_revision(ref.revision)
-        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                         lock_file=rev_file_path + ".lock")
+        self._write_revisions_file(rev_file_path, rev_list)
 
     def get_package_revisions(self, pref):
         """Returns a RevisionList"""
@@ -281,14 +363,30 @@ class ServerStore(object):
         return ret
 
     def _get_revisions_list(self, rev_file_path):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
+        """ The returned RevisionList can be the cached one, it must not be modified
+        """
+        rev_list = _revisions_cache.get(rev_file_path, self._revisions_cache_check)
+        if rev_list is not None:
+            return rev_list
+        stamp = _revisions_cache.stamp(rev_file_path)
+        if stamp is not None:
+            rev_list = self._read_revisions_file(rev_file_path)
+            _revisions_cache.set(rev_file_path, stamp, rev_list)
             return rev_list
         else:
             return RevisionList()
 
+    def _read_revisions_file(self, rev_file_path):
+        rev_file = self._storage_adapter.read_file(rev_file_path,
+                                                   lock_file=rev_file_path + ".lock")
+        return RevisionList.loads(rev_file)
+
+    def _write_revisions_file(self, rev_file_path, rev_list):
+        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
+                                         lock_file=rev_file_path + ".lock")
+        # Other processes could write it before it is read again, it cannot be cached here
+        _revisions_cache.invalidate(rev_file_path)
+
     def _get_latest_revision(self, rev_file_path):
         rev_list = self._get_revisions_list(rev_file_path)
         if not rev_list:
@@ -297,8 +395,7 @@ class ServerStore(object):
             if self.path_exists(os.path.join(os.path.dirname(rev_file_path), DEFAULT_REVISION_V1)):
                 rev_list = RevisionList()
                 rev_list.add_revision(DEFAULT_REVISION_V1)
-                self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                                 lock_file=rev_file_path + ".lock")
+                self._write_revisions_file(rev_file_path, rev_list)
                 return rev_list.latest_revision()
             else:
                 return None
@@ -315,18 +412,11 @@ class ServerStore(object):
         return join(p_folder, REVISIONS_FILE)
 
     def get_revision_time(self, ref):
-        try:
-            rev_list = self._load_revision_list(ref)
-        except IOError:
-            return None
+        rev_list = self._get_revisions_list(self._recipe_revisions_file(ref))
         return rev_list.get_time(ref.revision)
 
     def get_package_revision_time(self, pref):
-        try:
-            rev_list = self._load_package_revision_list(pref)
-        except (IOError, OSError):
-            return None
-
+        rev_list = self._get_revisions_list(self._package_revisions_file(pref))
         return rev_list.get_time(pref.revision)
 
     def _remove_revision_from_index(self, ref):
@@ -341,18 +431,16 @@ class ServerStore(object):
 
     def _load_revision_list(self, ref):
         path = self._recipe_revisions_file(ref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        return self._read_revisions_file(path)
 
     def _save_revision_list(self, rev_list, ref):
         path = self._recipe_revisions_file(ref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
+        self._write_revisions_file(path, rev_list)
 
     def _save_package_revision_list(self, rev_list, pref):
         path = self._package_revisions_file(pref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
+        self._write_revisions_file(path, rev_list)
 
     def _load_package_revision_list(self, pref):
         path = self._package_revisions_file(pref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        return self._read_revisions_file(path)
@@ -0,0 +1,46 @@
+import unittest
+
+from mock import patch
+
+from conans.model.ref import ConanFileReference
+from conans.paths import PACKAGE_METADATA
+from conans.paths.package_layouts import package_cache_layout
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import save
+
+
+class MetadataWritesTest(unittest.TestCase):
+
+    def setUp(self):
+        # A recipe with several binaries in the remote
+        self.client = TestClient(default_server_user=True)
+        self.client.save({"conanfile.py": GenConanfile().with_option("opt", [1, 2, 3])
+                                                        .with_default_option("opt", 1)})
+        for opt in (1, 2, 3):
+            self.client.run("create . pkg/0.1@user/testing -o pkg:opt=%s" % opt)
+        self.client.run("upload pkg* --all --confirm")
+        self.client.run("remove * -f")
+        self.ref = ConanFileReference.loads("pkg/0.1@user/testing")
+
+    def _metadata_writes(self, command):
+        with patch.object(package_cache_layout, "save", wraps=save) as save_mock:
+            self.client.run(command)
+        return len([c for c in save_mock.call_args_list if c[0][0].endswith(PACKAGE_METADATA)])
+
+    def download_test(self):
+        # Once for the recipe and once for every package, with its revision and remote
+        self.assertEqual(4, self._metadata_writes("download pkg/0.1@user/testing"))
+        metadata = self.client.cache.package_layout(self.ref).load_metadata()
+        self.assertEqual(3, len(metadata.packages))
+        for package in metadata.packages.values():
+            self.assertEqual("default", package.remote)
+            self.assertIsNotNone(package.revision)
+
+    def install_test(self):
+        self.client.run("download pkg/0.1@user/testing -r default --recipe")
+        self.assertEqual(1, self._metadata_writes("install pkg/0.1@user/testing -o pkg:opt=2"))
+        self.assertIn("pkg/0.1@user/testing: Package installed", self.client.out)
+        # Nothing changes, nothing is written
+        self.assertEqual(0, self._metadata_writes("install pkg/0.1@user/testing -o pkg:opt=2"))
+        self.assertEqual(1, self._metadata_writes("install pkg/0.1@user/testing -o pkg:opt=3 "
+                                                  "--build=pkg"))
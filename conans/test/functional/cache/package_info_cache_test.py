@@ -0,0 +1,127 @@
+import os
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient
+from conans.util.files import load
+
+
+class PackageInfoCacheTest(unittest.TestCase):
+
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile, tools
+
+        class Pkg(ConanFile):
+            settings = "build_type"
+            options = {"shared": [True, False]}
+            default_options = {"shared": False}
+
+            def package(self):
+                tools.save(os.path.join(self.package_folder, "lib", "mylib.a"), "")
+
+            def package_id(self):
+                del self.info.settings.build_type
+
+            def package_info(self):
+                self.output.info("Running package_info() %s" % self.settings.build_type)
+                self.cpp_info.libs = tools.collect_libs(self)
+                self.cpp_info.defines = ["MYDEFINE=%s" % self.settings.build_type]
+                self.cpp_info.debug.defines = ["MYDEBUG"]
+                self.cpp_info.names["cmake_find_package"] = "MyPkg"
+                self.cpp_info.includedirs.append("missing")
+                self.cpp_info.filter_empty = False
+                self.env_info.MYVAR = "myvalue"
+                self.env_info.PATH.append("mypath")
+                self.user_info.myinfo = "myuserinfo"
+        """).replace("from conans import", "import os\nfrom conans import")
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.run("config set general.package_info_cache=True")
+        self.client.save({"conanfile.py": self.conanfile})
+        self.client.run("create . pkg/0.1@user/testing")
+        self.assertIn("Running package_info() Release", self.client.out)
+        self.ref = ConanFileReference.loads("pkg/0.1@user/testing")
+
+    def _install(self, args=""):
+        self.client.run("install pkg/0.1@user/testing -g txt %s" % args)
+        return load(os.path.join(self.client.current_folder, "conanbuildinfo.txt"))
+
+    def reuse_test(self):
+        # Stored by the 'conan create'
+        build_info = self._install()
+        self.assertNotIn("Running package_info()", self.client.out)
+        self.client.run("config set general.package_info_cache=False")
+        self.assertEqual(build_info, self._install())
+        self.assertIn("Running package_info() Release", self.client.out)
+        self.assertIn("/missing\n", build_info.replace("\\", "/"))  # Not filtered
+        self.assertIn("mylib", build_info)
+        self.assertIn("MYDEFINE=Release", build_info)
+        self.assertIn("[defines_pkg:debug]\nMYDEBUG", build_info)
+        self.assertIn("[USER_pkg]\nmyinfo=myuserinfo", build_info)
+        self.assertIn("[ENV_pkg]\nMYVAR=myvalue\nPATH=[\"mypath\"]", build_info)
+
+    def hooks_test(self):
+        hook = textwrap.dedent("""
+            def pre_package_info(output, conanfile, **kwargs):
+                output.info("pre_package_info %s" % conanfile.cpp_info.defines)
+
+            def post_package_info(output, conanfile, **kwargs):
+                conanfile.cpp_info.defines.append("HOOKDEFINE")
+            """)
+        self.client.save({os.path.join(self.client.cache.hooks_path, "my_hook.py"): hook})
+        self.client.run("config set hooks.my_hook.py")
+        self.client.run("config set general.package_info_cache=False")
+        build_info = self._install()
+        self.assertIn("pre_package_info []", self.client.out)
+        self.assertIn("MYDEFINE=Release\nHOOKDEFINE\n", build_info)
+        # Stored without the changes of the post_package_info hook, that runs again
+        self.client.run("config set general.package_info_cache=True")
+        self.assertEqual(build_info, self._install("--build"))
+        self.assertEqual(build_info, self._install())
+        self.assertNotIn("Running package_info()", self.client.out)
+        self.assertIn("pre_package_info []", self.client.out)
+
+    def disabled_test(self):
+        self.client.run("config set general.package_info_cache=False")
+        self._install()
+        self.assertIn("Running package_info() Release", self.client.out)
+        self._install()
+        self.assertIn("Running package_info() Release", self.client.out)
+
+    def invalidation_test(self):
+        # Same binary, but other settings
+        self._install()
+        build_info = self._install("-s build_type=Debug")
+        self.assertIn("Running package_info() Debug", self.client.out)
+        self.assertIn("MYDEFINE=Debug", build_info)
+        self._install("-s build_type=Debug")
+        self.assertNotIn("Running package_info()", self.client.out)
+
+        # Other options, other binary
+        self.client.run("create . pkg/0.1@user/testing -o pkg:shared=True")
+        self.client.run("install pkg/0.1@user/testing -o pkg:shared=True")
+        self.assertNotIn("Running package_info()", self.client.out)
+
+        # The package is built again
+        self.client.run("install pkg/0.1@user/testing --build")
+        self.assertIn("Running package_info() Release", self.client.out)
+        self.client.run("install pkg/0.1@user/testing")
+        self.assertNotIn("Running package_info()", self.client.out)
+
+        # Other recipe revision
+        self.client.save({"conanfile.py": self.conanfile + "\n# Other revision"})
+        self.client.run("create . pkg/0.1@user/testing")
+        self.assertIn("Running package_info() Release", self.client.out)
+        self.client.run("install pkg/0.1@user/testing")
+        self.assertNotIn("Running package_info()", self.client.out)
+
+    def remove_test(self):
+        self._install()
+        layout = self.client.cache.package_layout(self.ref)
+        package_id = layout.conan_packages()[0]
+        info_cache = layout.package_info_cache(PackageReference(layout.ref, package_id))
+        self.assertTrue(os.path.exists(info_cache))
+        self.client.run("remove pkg/0.1@user/testing -p %s -f" % package_id)
+        self.assertFalse(os.path.exists(info_cache))
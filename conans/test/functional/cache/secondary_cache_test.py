@@ -0,0 +1,140 @@
+import os
+import platform
+import stat
+import time
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient, \
+    TestServer
+
+
+def _folder_contents(folder):
+    result = {}
+    for root, _, files in os.walk(folder):
+        for f in files:
+            path = os.path.join(root, f)
+            result[os.path.relpath(path, folder)] = os.path.getmtime(path)
+    return result
+
+
+class SecondaryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        # The shared cache, populated by other process, e.g. a nightly job
+        self.shared = TestClient()
+        conanfile = GenConanfile().with_option("shared", [True, False])\
+                                  .with_default_option("shared", False)\
+                                  .with_package_file("file.h", "shared header")
+        self.shared.save({"conanfile.py": conanfile})
+        self.shared.run("create . pkg/0.1@user/testing")
+        self.shared_store = self.shared.storage_folder
+        self.shared_contents = _folder_contents(self.shared_store)
+
+        self.client = TestClient()
+        self.client.run('config set storage.secondary_path="%s"' % self.shared_store)
+        self.ref = ConanFileReference.loads("pkg/0.1@user/testing")
+
+    def tearDown(self):
+        # The shared cache is never modified
+        self.assertEqual(self.shared_contents, _folder_contents(self.shared_store))
+
+    def install_in_place_test(self):
+        client = self.client
+        client.run("install pkg/0.1@user/testing -g txt")
+        self.assertIn("pkg/0.1@user/testing: Already installed!", client.out)
+        self.assertNotIn("Downloading", client.out)
+        package_folder = os.path.join(self.shared_store, "pkg", "0.1", "user", "testing",
+                                      "package", NO_SETTINGS_PACKAGE_ID)
+        self.assertIn(package_folder, client.load("conanbuildinfo.txt"))
+        self.assertFalse(os.path.exists(os.path.join(client.storage_folder, "pkg", "0.1", "user",
+                                                     "testing", "export")))
+
+        client.run("info pkg/0.1@user/testing --paths")
+        self.assertIn("package_folder: %s" % package_folder, client.out)
+
+    def new_binaries_test(self):
+        client = self.client
+        client.run("install pkg/0.1@user/testing -o pkg:shared=True", assert_error=True)
+        self.assertIn("Missing prebuilt package for 'pkg/0.1@user/testing'", client.out)
+        client.run("install pkg/0.1@user/testing -o pkg:shared=True --build=missing")
+        self.assertIn("pkg/0.1@user/testing: Package '", client.out)
+        layout = client.cache.package_layout(self.ref)
+        packages = layout.conan_packages()
+        self.assertEqual(len(packages), 2)
+        new_id = [p for p in packages if p != NO_SETTINGS_PACKAGE_ID][0]
+        new_pref = PackageReference(self.ref, new_id)
+        self.assertTrue(layout.read_package(new_pref).startswith(client.storage_folder))
+        shared_pref = PackageReference(self.ref, NO_SETTINGS_PACKAGE_ID)
+        self.assertTrue(layout.read_package(shared_pref).startswith(self.shared_store))
+        # Writes never go to the secondary storage
+        self.assertTrue(layout.package(shared_pref).startswith(client.storage_folder))
+        # The metadata is written in the local cache, with both packages
+        metadata = layout.load_metadata()
+        self.assertIn(new_id, metadata.packages)
+        self.assertIn(NO_SETTINGS_PACKAGE_ID, metadata.packages)
+        client.run("install pkg/0.1@user/testing -o pkg:shared=True")
+        self.assertIn("pkg/0.1@user/testing: Already installed!", client.out)
+
+        # Removing only removes the local items
+        client.run("remove pkg* -f")
+        self.assertFalse(os.path.exists(layout.package(new_pref)))
+        client.run("install pkg/0.1@user/testing")
+        self.assertIn("pkg/0.1@user/testing: Already installed!", client.out)
+
+    def build_update_read_only_test(self):
+        if platform.system() != "Windows":
+            for root, dirs, files in os.walk(self.shared_store):
+                for f in dirs + files:
+                    path = os.path.join(root, f)
+                    os.chmod(path, stat.S_IMODE(os.stat(path).st_mode) & ~stat.S_IWRITE)
+            self.addCleanup(os.chmod, self.shared_store, stat.S_IRWXU)  # So it can be removed
+            for root, dirs, _ in os.walk(self.shared_store):
+                for d in dirs:
+                    self.addCleanup(os.chmod, os.path.join(root, d), stat.S_IRWXU)
+
+        server = TestServer(users={"user": "password"})
+        servers = {"default": server}
+        client = TestClient(cache_folder=self.client.cache_folder, servers=servers,
+                            users={"default": [("user", "password")]})
+        pref = PackageReference(self.ref, NO_SETTINGS_PACKAGE_ID)
+        layout = client.cache.package_layout(self.ref)
+
+        client.run("install pkg/0.1@user/testing --build")
+        self.assertIn("pkg/0.1@user/testing: Package '%s' created" % NO_SETTINGS_PACKAGE_ID,
+                      client.out)
+        self.assertTrue(layout.read_package(pref).startswith(client.storage_folder))
+        self.assertEqual("shared header", client.load(os.path.join(layout.package(pref),
+                                                                  "file.h")))
+        client.run("remove pkg* -p -f")
+        self.assertTrue(layout.read_package(pref).startswith(self.shared_store))
+
+        # A newer binary in the remote is downloaded to the local cache
+        time.sleep(1)  # The manifests have a resolution of seconds
+        other = TestClient(servers=servers, users={"default": [("user", "password")]})
+        other.save({"conanfile.py": GenConanfile().with_package_file("file.h", "remote header")})
+        other.run("create . pkg/0.1@user/testing")
+        other.run("upload pkg/0.1@user/testing --all -r default")
+        client.run("install pkg/0.1@user/testing --update -r default")
+        self.assertIn("pkg/0.1@user/testing: Retrieving package %s" % NO_SETTINGS_PACKAGE_ID,
+                      client.out)
+        self.assertTrue(layout.read_export().startswith(client.storage_folder))
+        self.assertTrue(layout.read_package(pref).startswith(client.storage_folder))
+        self.assertEqual("remote header", client.load(os.path.join(layout.package(pref),
+                                                                  "file.h")))
+
+    def export_test(self):
+        client = self.client
+        conanfile = GenConanfile().with_package_file("file.h", "local header")
+        client.save({"conanfile.py": conanfile})
+        client.run("create . pkg/0.1@user/testing")
+        layout = client.cache.package_layout(self.ref)
+        self.assertTrue(layout.export().startswith(client.storage_folder))
+        pref = PackageReference(self.ref, NO_SETTINGS_PACKAGE_ID)
+        self.assertEqual("local header", client.load(os.path.join(layout.package(pref),
+                                                                  "file.h")))
+
+    def not_absolute_test(self):
+        self.client.run("config set storage.secondary_path=relative/data")
+        self.client.run("install pkg/0.1@user/testing", assert_error=True)
+        self.assertIn("Conan secondary storage path has to be an absolute path", self.client.out)
@@ -0,0 +1,284 @@
+import json
+import os
+import sys
+import time
+import unittest
+
+from mock import patch
+
+from conans.client.cache.trash import Trash
+from conans.client.cmd.cache_gc import _cache_entries
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient
+from conans.util.files import load, save
+from conans.util.windows import CONAN_LINK
+
+
+class CacheTrashTest(unittest.TestCase):
+
+    def remove_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("remove pkg* -f")
+        self.assertFalse(os.path.exists(os.path.join(client.storage_folder, "pkg")))
+        self.assertEqual(client.cache.trash.entries(), [])
+
+    def background_removal_test(self):
+        client = TestClient()
+        client.run("config set general.background_removal=True")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("remove pkg* -f")
+        self.assertFalse(os.path.exists(os.path.join(client.storage_folder, "pkg")))
+        for _ in range(100):
+            if not client.cache.trash.entries():
+                break
+            time.sleep(0.1)
+        self.assertEqual(client.cache.trash.entries(), [])
+
+    def background_removal_frozen_test(self):
+        # A frozen installer cannot remove other cache than the default one in other process
+        client = TestClient()
+        client.run("config set general.background_removal=True")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkg/0.1@user/testing")
+        with patch.object(sys, "frozen", True, create=True):
+            with patch("conans.client.cache.trash.subprocess.Popen") as popen:
+                client.run("remove pkg* -f")
+        self.assertFalse(popen.called)
+        self.assertEqual(client.cache.trash.entries(), [])
+
+    def clean_trash_test(self):
+        client = TestClient()
+        for name in ("folder1", "folder2"):
+            save(os.path.join(client.cache.trash.folder, name, "file.txt"), "contents")
+        client.run("cache clean-trash")
+        self.assertIn("Removed 2 folders from the trash", client.out)
+        self.assertEqual(client.cache.trash.entries(), [])
+
+    def move_test(self):
+        trash = Trash(os.path.join(temp_folder(), "trash"))
+        folder = os.path.join(temp_folder(), "folder")
+        self.assertIsNone(trash.move(folder))
+        save(os.path.join(folder, "file.txt"), "contents")
+        trashed = trash.move(folder)
+        self.assertFalse(os.path.exists(folder))
+        self.assertEqual(trash.entries(), [trashed])
+        self.assertEqual(trash.drain(), 1)
+        self.assertEqual(trash.entries(), [])
+
+        # The short paths must be removed too, they are not moved
+        save(os.path.join(folder, CONAN_LINK), "short/path")
+        self.assertIsNone(trash.move(folder))
+        self.assertTrue(os.path.exists(folder))
+
+
+class CacheGCTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        conanfile = GenConanfile().with_package_file("file.bin", "x" * 1000)
+        self.client.save({"conanfile.py": conanfile})
+        self.client.run("create . pkga/0.1@user/testing")
+        self.client.run("create . pkgb/0.1@user/testing")
+        self.refa = ConanFileReference.loads("pkga/0.1@user/testing")
+        self.refb = ConanFileReference.loads("pkgb/0.1@user/testing")
+
+    def _set_last_used(self, ref, timestamp):
+        layout = self.client.cache.package_layout(ref)
+        paths = [layout.usage()]
+        for package_id in layout.conan_packages():
+            paths.append(layout.usage(PackageReference(ref, package_id)))
+        for package_id in layout.conan_builds():
+            paths.append(layout.build(PackageReference(ref, package_id)))
+        for path in paths:
+            os.utime(path, (timestamp, timestamp))
+
+    def usage_test(self):
+        layout = self.client.cache.package_layout(self.refa)
+        pref = PackageReference(self.refa, NO_SETTINGS_PACKAGE_ID)
+        self._set_last_used(self.refa, 1000)
+        self.assertEqual(layout.last_used(), 1000)
+        self.assertEqual(layout.last_used(pref), 1000)
+        self.client.run("install pkga/0.1@user/testing")
+        self.assertGreater(layout.last_used(), 1000)
+        self.assertGreater(layout.last_used(pref), 1000)
+        metadata = load(layout.package_metadata())
+        self.client.run("install pkga/0.1@user/testing")
+        self.assertEqual(metadata, load(layout.package_metadata()))
+
+    def older_than_test(self):
+        self._set_last_used(self.refa, time.time() - 3 * 86400)
+        self.client.run("cache gc --older-than=2d --json=gc.json")
+        self.assertIn("pkga/0.1@user/testing: Removed build folder", self.client.out)
+        self.assertIn("pkga/0.1@user/testing: Removed package folder", self.client.out)
+        self.assertIn("pkga/0.1@user/testing: Removed recipe", self.client.out)
+        self.assertNotIn("pkgb/0.1@user/testing", self.client.out)
+        evicted = json.loads(self.client.load("gc.json"))
+        self.assertEqual([e["type"] for e in evicted], ["build", "package", "recipe"])
+        self.assertFalse(os.path.exists(os.path.join(self.client.storage_folder, "pkga")))
+        self.client.run("search")
+        self.assertNotIn("pkga", self.client.out)
+        self.assertIn("pkgb/0.1@user/testing", self.client.out)
+
+    def max_size_test(self):
+        self._set_last_used(self.refb, time.time() - 3 * 86400)
+        self.client.run("cache gc --max-size=1 --dry-run")
+        lines = [line.split(" (")[0] for line in str(self.client.out).splitlines()
+                 if "Would remove" in line]
+        self.assertEqual(lines, ["pkgb/0.1@user/testing: Would remove build folder %s"
+                                 % NO_SETTINGS_PACKAGE_ID,
+                                 "pkga/0.1@user/testing: Would remove build folder %s"
+                                 % NO_SETTINGS_PACKAGE_ID,
+                                 "pkgb/0.1@user/testing: Would remove package folder %s"
+                                 % NO_SETTINGS_PACKAGE_ID,
+                                 "pkga/0.1@user/testing: Would remove package folder %s"
+                                 % NO_SETTINGS_PACKAGE_ID,
+                                 "pkgb/0.1@user/testing: Would remove recipe",
+                                 "pkga/0.1@user/testing: Would remove recipe"])
+        self.assertTrue(os.path.exists(os.path.join(self.client.storage_folder, "pkgb")))
+
+        # Removing the build folders and the oldest package is enough to fit in the size
+        entries = _cache_entries(self.client.cache)
+        max_size = sum(e.size for e in entries if e.kind != "build" and
+                       not (e.kind == "package" and e.ref == self.refb))
+        self.client.run("cache gc --max-size=%d" % max_size)
+        self.assertIn("pkgb/0.1@user/testing: Removed package folder", self.client.out)
+        self.assertNotIn("pkga/0.1@user/testing: Removed package folder", self.client.out)
+        self.assertNotIn("Removed recipe", self.client.out)
+        self.assertEqual(self.client.cache.package_layout(self.refb).conan_packages(), [])
+        layout = self.client.cache.package_layout(self.refa)
+        self.assertEqual(layout.conan_packages(), [NO_SETTINGS_PACKAGE_ID])
+        self.client.run("search pkgb/0.1@user/testing")
+        self.assertIn("There are no packages", self.client.out)
+
+    def locked_test(self):
+        layout = self.client.cache.package_layout(self.refa)
+        with layout.conanfile_read_lock(self.client.out):
+            self.client.run("cache gc --older-than=0s")
+        self.assertIn("pkga/0.1@user/testing: Skipping build folder", self.client.out)
+        self.assertIn("pkga/0.1@user/testing: Skipping recipe, locked by another process",
+                      self.client.out)
+        self.assertIn("pkgb/0.1@user/testing: Removed recipe", self.client.out)
+        self.assertTrue(os.path.exists(layout.conanfile()))
+        self.assertEqual(layout.conan_packages(), [NO_SETTINGS_PACKAGE_ID])
+
+    def editable_test(self):
+        self.client.save({"conanfile.py": GenConanfile()}, clean_first=True)
+        self.client.run("editable add . pkga/0.1@user/testing")
+        self.client.run("cache gc --older-than=0s")
+        self.assertNotIn("pkga/0.1@user/testing", self.client.out)
+        self.assertIn("pkgb/0.1@user/testing: Removed recipe", self.client.out)
+
+    def invalid_arguments_test(self):
+        self.client.run("cache gc", assert_error=True)
+        self.assertIn("Define the maximum size or age of the cache", self.client.out)
+        self.client.run("cache gc --max-size=lots", assert_error=True)
+        self.assertIn("Invalid size 'lots'", self.client.out)
+        self.client.run("cache gc --older-than=3", assert_error=True)
+        self.assertIn("Invalid age '3'", self.client.out)
+
+
+class CacheBundleTest(unittest.TestCase):
+
+    def setUp(self):
+        # app -> pkga, with two binaries of pkga
+        self.client = TestClient()
+        self.client.save({"conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                                        .with_default_option("shared", False)
+                                                        .with_package_file("file.h", "header")})
+        self.client.run("create . pkga/0.1@user/testing")
+        self.client.run("create . pkga/0.1@user/testing -o pkga:shared=True")
+        self.client.save({"conanfile.py": GenConanfile().with_require_plain("pkga/0.1@user/testing")
+                                                        .with_package_file("app.h", "app")},
+                         clean_first=True)
+        self.client.run("create . app/0.1@user/testing")
+
+    def save_restore_test(self):
+        self.client.run("cache save bundle.tar app/0.1@user/testing pkga/0.1@user/testing")
+        self.assertIn("Saved 2 recipes and 3 packages to", self.client.out)
+        bundle = os.path.join(self.client.current_folder, "bundle.tar")
+
+        other = TestClient()
+        other.run('cache restore "%s"' % bundle)
+        self.assertIn("Restored 2 recipes and 3 packages from", other.out)
+        other.run("install app/0.1@user/testing")
+        self.assertIn("app/0.1@user/testing: Already installed!", other.out)
+        self.assertIn("pkga/0.1@user/testing: Already installed!", other.out)
+        other.run("install pkga/0.1@user/testing -o pkga:shared=True")
+        self.assertIn("pkga/0.1@user/testing: Already installed!", other.out)
+        layout = self.client.cache.package_layout(ConanFileReference.loads("app/0.1@user/testing"))
+        other_layout = other.cache.package_layout(layout.ref)
+        self.assertEqual(layout.load_metadata(), other_layout.load_metadata())
+
+        other.run('cache restore "%s"' % bundle)
+        self.assertIn("Restored 0 recipes and 0 packages from %s, 5 skipped" % bundle, other.out)
+
+    def lockfile_test(self):
+        self.client.run("graph lock app/0.1@user/testing")
+        self.client.run("cache save bundle.tar --lockfile=conan.lock")
+        self.assertIn("Saved 2 recipes and 2 packages to", self.client.out)
+
+        other = TestClient()
+        other.run('cache restore "%s"' % os.path.join(self.client.current_folder, "bundle.tar"))
+        other.run("install app/0.1@user/testing")
+        self.assertIn("pkga/0.1@user/testing: Already installed!", other.out)
+        other.run("install pkga/0.1@user/testing -o pkga:shared=True", assert_error=True)
+        self.assertIn("Missing prebuilt package for 'pkga/0.1@user/testing'", other.out)
+
+    def package_reference_test(self):
+        self.client.run("cache save bundle.tar pkga/0.1@user/testing:missing", assert_error=True)
+        self.assertIn("Package 'pkga/0.1@user/testing", self.client.out)
+        self.assertIn("not found in the cache", self.client.out)
+        self.client.run("cache save bundle.tar missing/0.1@user/testing", assert_error=True)
+        self.assertIn("Recipe 'missing/0.1@user/testing' not found in the cache", self.client.out)
+        self.client.run("cache save bundle.tar", assert_error=True)
+        self.assertIn("Specify the references or the lockfile of the bundle", self.client.out)
+
+    def corrupted_test(self):
+        ref = ConanFileReference.loads("app/0.1@user/testing")
+        pref = PackageReference(ref, self.client.cache.package_layout(ref).conan_packages()[0])
+        save(os.path.join(self.client.cache.package_layout(ref).package(pref), "app.h"), "bad")
+        self.client.run("cache save bundle.tar app/0.1@user/testing")
+
+        other = TestClient()
+        other.run('cache restore "%s"' % os.path.join(self.client.current_folder, "bundle.tar"),
+                  assert_error=True)
+        self.assertIn("Failed restoring the bundle:\napp/0.1@user/testing#", other.out)
+        self.assertIn(":%s: Manifest mismatch" % pref.id, other.out)
+        other.run("search app/0.1@user/testing")
+        self.assertIn("There are no packages", other.out)
+
+    def other_revision_test(self):
+        self.client.run("cache save bundle.tar pkga/0.1@user/testing")
+        bundle = os.path.join(self.client.current_folder, "bundle.tar")
+        other = TestClient()
+        other.save({"conanfile.py": GenConanfile()})
+        other.run("create . pkga/0.1@user/testing")
+        other.run('cache restore "%s"' % bundle, assert_error=True)
+        self.assertIn("Recipe 'pkga/0.1@user/testing' is in the cache with other revision",
+                      other.out)
+        other.run('cache restore "%s" --force' % bundle)
+        self.assertIn("Restored 1 recipes and 2 packages", other.out)
+        other.run("install pkga/0.1@user/testing -o pkga:shared=True")
+        self.assertIn("pkga/0.1@user/testing: Already installed!", other.out)
+
+    def other_revision_corrupted_test(self):
+        ref = ConanFileReference.loads("pkga/0.1@user/testing")
+        save(os.path.join(self.client.cache.package_layout(ref).export(), "conanfile.py"), "bad")
+        self.client.run("cache save bundle.tar pkga/0.1@user/testing")
+        bundle = os.path.join(self.client.current_folder, "bundle.tar")
+        other = TestClient()
+        other.save({"conanfile.py": GenConanfile()})
+        other.run("create . pkga/0.1@user/testing")
+        revision = other.cache.package_layout(ref).recipe_revision()
+
+        # Nothing is replaced if the new revision cannot be restored
+        other.run('cache restore "%s" --force' % bundle, assert_error=True)
+        self.assertIn("Failed restoring the bundle:\npkga/0.1@user/testing: Manifest mismatch",
+                      other.out)
+        self.assertEqual(revision, other.cache.package_layout(ref).recipe_revision())
+        other.run("install pkga/0.1@user/testing")
+        self.assertIn("pkga/0.1@user/testing: Already installed!", other.out)
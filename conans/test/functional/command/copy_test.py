@@ -2,7 +2,7 @@ import os
 import unittest
 
 from conans.model.ref import ConanFileReference
-from conans.test.utils.tools import TestClient, TestServer
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
 from conans.util.files import load
 from parameterized.parameterized import parameterized
 
@@ -102,3 +102,39 @@ class Pkg(ConanFile):
         client.run("copy pkg/0.1@user/channel other/channel -p {} --all".format("mimic"),
                    assert_error=True)
         self.assertIn("Cannot specify both --all and --package", client.out)
+
+    def test_copy_in_remote(self):
+        server = TestServer(users={"lasote": "mypass"})
+        client = TestClient(servers={"default": server},
+                            users={"default": [("lasote", "mypass")]})
+        client.save({"conanfile.py": GenConanfile().with_setting("os")})
+        client.run("create . pkg/0.1@lasote/testing -s os=Windows")
+        client.run("create . pkg/0.1@lasote/testing -s os=Linux")
+        client.run("upload pkg/0.1@lasote/testing --all")
+        client.run("remove * -f")
+
+        client.run("copy pkg/0.1@lasote/testing lasote/stable --all -r default")
+        self.assertIn("Copied pkg/0.1@lasote/testing to pkg/0.1@lasote/stable in remote 'default'",
+                      client.out)
+        self.assertEqual(str(client.out).count(" to pkg/0.1@lasote/stable in remote 'default'"), 3)
+        self.assertNotIn("Uploading", client.out)
+        self.assertNotIn("Downloading", client.out)
+        client.run("search pkg/0.1@lasote/stable -r default")
+        self.assertIn("os: Windows", client.out)
+        self.assertIn("os: Linux", client.out)
+        client.run("install pkg/0.1@lasote/stable -s os=Linux")
+        self.assertIn("Downloading conan_package.tgz", client.out)
+
+        # Already existing, and only the recipe
+        client.run("copy pkg/0.1@lasote/testing lasote/stable -r default", assert_error=True)
+        self.assertIn("already exists. Use force to override it", client.out)
+        client.run("copy pkg/0.1@lasote/testing lasote/other -r default")
+        client.run("search pkg/0.1@lasote/other -r default")
+        self.assertIn("There are no packages for reference 'pkg/0.1@lasote/other'", client.out)
+
+    def test_copy_in_remote_not_supported(self):
+        server = TestServer(users={"lasote": "mypass"}, server_capabilities=[])
+        client = TestClient(servers={"default": server},
+                            users={"default": [("lasote", "mypass")]})
+        client.run("copy pkg/0.1@lasote/testing lasote/stable -r default", assert_error=True)
+        self.assertIn("doesn't support copying packages in the server", client.out)
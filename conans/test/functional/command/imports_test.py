@@ -1,7 +1,9 @@
 import os
+import stat
 import textwrap
 import unittest
 
+from conans.client import tools
 from conans.client.importer import IMPORTS_MANIFESTS
 from conans.model.manifest import FileTreeManifest
 from conans.test.utils.test_files import temp_folder
@@ -172,6 +174,35 @@ class ConanLib(ConanFile):
         self.assertIn("Removed 2 imported files", self.client.out)
         self.assertIn("Removed imports manifest file", self.client.out)
 
+    def imports_hardlink_mode_test(self):
+        self.client.save({"conanfile.txt": test1}, clean_first=True)
+        with tools.environment_append({"CONAN_IMPORTS_MODE": "hardlink"}):
+            self.client.run("install conanfile.txt", assert_error=True)
+            self.assertIn("Imports mode 'hardlink' requires a read-only cache "
+                          "(general.read_only_cache)", self.client.out)
+            with tools.environment_append({"CONAN_READ_ONLY_CACHE": "1"}):
+                self.client.run("install conanfile.txt")
+        self.assertIn("imports(): Copied 2 '.txt' files", self.client.out)
+        imported = os.path.join(self.client.current_folder, "file1.txt")
+        self.assertEqual(os.stat(imported).st_nlink, 2)
+        self.assertFalse(os.stat(imported).st_mode & stat.S_IWUSR)
+        self._check_manifest()
+
+        self.client.run("imports . --undo")
+        self.assertIn("Removed 2 imported files", self.client.out)
+        self.assertNotIn("file1.txt", os.listdir(self.client.current_folder))
+        # The package files are still there
+        self.client.run("install conanfile.txt")
+        self.assertEqual("Hello", self.client.load("file1.txt"))
+        self.assertEqual(os.stat(imported).st_nlink, 1)
+
+    def imports_wrong_mode_test(self):
+        self.client.save({"conanfile.txt": test1}, clean_first=True)
+        with tools.environment_append({"CONAN_IMPORTS_MODE": "junction"}):
+            self.client.run("install conanfile.txt", assert_error=True)
+        self.assertIn("Invalid imports mode 'junction', allowed values: copy, hardlink, "
+                      "reflink, symlink", self.client.out)
+
     def _check_manifest(self):
         manifest_content = self.client.load(IMPORTS_MANIFESTS)
         manifest = FileTreeManifest.loads(manifest_content)
@@ -0,0 +1,98 @@
+import json
+import os
+import textwrap
+import unittest
+
+from conans.model.graph_lock import LOCKFILE
+from conans.model.ref import PackageReference
+from conans.paths import CONANINFO
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient
+from conans.util.files import load
+
+
+class InstallMultiProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(default_server_user=True)
+        self.client.save({"conanfile.py": GenConanfile().with_setting("build_type")})
+        self.client.run("create . pkg/0.1@user/testing -s build_type=Debug")
+        self.client.run("create . pkg/0.1@user/testing -s build_type=Release")
+        self.client.run("upload * --all --confirm")
+        self.client.run("remove * -f")
+        debug = textwrap.dedent("""
+            [settings]
+            build_type=Debug
+            """)
+        release = textwrap.dedent("""
+            [settings]
+            build_type=Release
+            """)
+        self.client.save({"conanfile.txt": "[requires]\npkg/[>0.0]@user/testing",
+                          "debug": debug,
+                          "release": release}, clean_first=True)
+
+    def install_multi_profile_test(self):
+        client = self.client
+        client.run("install . -mpr=debug -mpr=release -if=build")
+        # The remote search for the version range is done only once
+        self.assertEqual(1, str(client.out).count("pkg/*@user/testing versions found in "
+                                                  "'default' remote"))
+        self.assertEqual(1, str(client.out).count("Trying with 'default'..."))
+        self.assertIn("Downloading binary packages in 2 parallel threads", client.out)
+        self.assertEqual(2, str(client.out).count("pkg/0.1@user/testing: Package installed"))
+
+        debug_info = load(os.path.join(client.current_folder, "build", "debug", CONANINFO))
+        self.assertIn("build_type=Debug", debug_info)
+        release_info = load(os.path.join(client.current_folder, "build", "release", CONANINFO))
+        self.assertIn("build_type=Release", release_info)
+
+    def install_multi_profile_common_test(self):
+        client = self.client
+        client.save({"base": "[options]\npkg:shared=True",
+                      "pkg/conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                                        .with_default_option("shared", False)
+                                                        .with_setting("build_type"),
+                      "conanfile.txt": "[requires]\npkg/0.1@user/testing"})
+        client.run("create pkg pkg/0.1@user/testing -pr=base -pr=debug")
+        client.run("create pkg pkg/0.1@user/testing -pr=base -pr=release")
+        client.run("install . -pr=base -mpr=debug -mpr=release -if=build")
+        for config, build_type in (("debug", "Debug"), ("release", "Release")):
+            info = load(os.path.join(client.current_folder, "build", config, CONANINFO))
+            self.assertIn("build_type=%s" % build_type, info)
+            self.assertIn("pkg:shared=True", info)
+
+    def install_multi_profile_duplicated_test(self):
+        self.client.run("install . -mpr=debug -mpr=debug", assert_error=True)
+        self.assertIn("ERROR: Duplicated configuration 'debug'", self.client.out)
+
+    def install_multi_profile_reference_test(self):
+        self.client.run("install pkg/0.1@user/testing -mpr=debug", assert_error=True)
+        self.assertIn("--multi-profile can only be used to install a path", self.client.out)
+
+    def install_multi_profile_same_name_test(self):
+        release = load(os.path.join(self.client.current_folder, "release"))
+        self.client.save({"other/debug": release})
+        self.client.run("install . -mpr=debug -mpr=other/debug -if=build")
+        debug_info = load(os.path.join(self.client.current_folder, "build", "debug", CONANINFO))
+        self.assertIn("build_type=Debug", debug_info)
+        release_info = load(os.path.join(self.client.current_folder, "build", "debug_2",
+                                         CONANINFO))
+        self.assertIn("build_type=Release", release_info)
+
+    def install_multi_profile_build_test(self):
+        # The same binary in both configurations is built once, for the first one
+        client = self.client
+        client.save({"dep/conanfile.py": GenConanfile()})
+        client.run("create dep dep/0.1@user/testing")
+        client.save({"conanfile.txt": "[requires]\ndep/0.1@user/testing"})
+        client.run("install . -mpr=debug -mpr=release -if=build --build=dep")
+        self.assertEqual(1, str(client.out).count("dep/0.1@user/testing: Package '%s' created"
+                                                  % NO_SETTINGS_PACKAGE_ID))
+        for config in ("debug", "release"):
+            lock = json.loads(load(os.path.join(client.current_folder, "build", config,
+                                                LOCKFILE)))
+            dep = lock["graph_lock"]["nodes"]["1"]
+            pref = PackageReference.loads(dep["pref"])
+            self.assertEqual(pref.id, NO_SETTINGS_PACKAGE_ID)
+            self.assertIsNotNone(pref.revision)
+            self.assertEqual(dep["modified"], "built")
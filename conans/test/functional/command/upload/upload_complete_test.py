@@ -1,6 +1,7 @@
 import json
 import os
 import platform
+import re
 import stat
 import textwrap
 import unittest
@@ -294,6 +295,38 @@ class UploadTest(unittest.TestCase):
         client.run('search lib1/1.0@user/channel -r default')
         self.assertIn("lib1/1.0@user/channel", client.out)
 
+    def upload_biggest_packages_first_test(self):
+        client = TestClient(default_server_user=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile, tools
+            class Pkg(ConanFile):
+                options = {"size": "ANY"}
+                default_options = {"size": "1"}
+                def package(self):
+                    tools.save("file.bin", "x" * int(str(self.options.size)))
+                    self.copy("*.bin")
+            """)
+        client.save({"conanfile.py": conanfile})
+        client.run("create . lib/1.0@user/channel")
+        small_id = re.search(r"Package '(\w+)' created", str(client.out)).group(1)
+        client.run("create . lib/1.0@user/channel -o lib:size=100000")
+        big_id = re.search(r"Package '(\w+)' created", str(client.out)).group(1)
+        client.run("user -p password -r default user")
+
+        client.run("upload lib* -c --all -r default")
+        out = str(client.out)
+        big_index = re.search(r"Uploading package \d/2: %s" % big_id, out).start()
+        self.assertLess(out.index("Uploading lib/1.0@user/channel to remote"), big_index)
+        self.assertLess(big_index, re.search(r"Uploading package \d/2: %s" % small_id,
+                                             out).start())
+
+        client.run("remove * -r default -f")
+        client.run("config set general.parallel_upload=3")
+        client.run("upload lib* -c --all -r default")
+        client.run("search lib/1.0@user/channel -r default")
+        self.assertIn(small_id, client.out)
+        self.assertIn(big_id, client.out)
+
     def upload_parallel_fail_on_interaction_test(self):
         """Upload 2 packages in parallel and fail because non_interactive forced"""
 
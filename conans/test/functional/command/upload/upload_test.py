@@ -11,8 +11,10 @@ from nose.plugins.attrib import attr
 
 from conans import REVISIONS
 from conans.client.cmd.uploader import CmdUpload
+from conans.client.remote_manager import RemoteManager
 from conans.client.tools.env import environment_append
 from conans.errors import ConanException
+from conans.model.manifest import FileTreeManifest
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import EXPORT_SOURCES_TGZ_NAME, PACKAGE_TGZ_NAME
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
@@ -20,7 +22,7 @@ from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServ
     TurboTestClient, GenConanfile, TestRequester, TestingResponse
 from conans.util.env_reader import get_env
 
-from conans.util.files import gzopen_without_timestamps, is_dirty, save, set_dirty
+from conans.util.files import gzopen_without_timestamps, is_dirty, save, set_dirty, sha1sum
 
 conanfile = """from conans import ConanFile
 class MyPkg(ConanFile):
@@ -799,6 +801,50 @@ class MyPkg(ConanFile):
         self.assertEqual(metadata.recipe.checksums["conanfile.py"]["md5"], recipe_md5)
         self.assertEqual(metadata.recipe.checksums["conanfile.py"]["sha1"], recipe_sha1)
 
+    def reuse_compressed_package_test(self):
+        servers = OrderedDict([("server1", TestServer(users={"user": "password"})),
+                               ("server2", TestServer(users={"user": "password"}))])
+        client = TestClient(servers=servers, users={"server1": [("user", "password")],
+                                                    "server2": [("user", "password")]})
+        client.save({"conanfile.py": conanfile, "file.h": "header"})
+        client.run("create . user/testing")
+        ref = ConanFileReference.loads("Hello0/1.2.1@user/testing")
+        layout = client.cache.package_layout(ref)
+
+        # The checksums are stored only if the package is uploaded
+        with patch.object(RemoteManager, "upload_package",
+                          side_effect=ConanException("Broken upload")):
+            client.run("upload Hello0/1.2.1@user/testing --all -r server1", assert_error=True)
+        self.assertIn("Broken upload", client.out)
+        self.assertEqual(layout.load_metadata().packages[NO_SETTINGS_PACKAGE_ID].checksums, {})
+
+        client.run("upload Hello0/1.2.1@user/testing --all -r server1")
+        self.assertIn("Removing outdated conan_package.tgz", client.out)
+        self.assertIn("Compressing package...", client.out)
+        checksums = layout.load_metadata().packages[NO_SETTINGS_PACKAGE_ID].checksums
+
+        # Neither compressed nor hashed again
+        with patch("conans.client.rest.file_uploader.sha1sum", wraps=sha1sum) as sha1sum_mock:
+            client.run("upload Hello0/1.2.1@user/testing --all -r server2")
+        hashed = [os.path.basename(c[0][0]) for c in sha1sum_mock.call_args_list]
+        self.assertIn("conanfile.py", hashed)
+        self.assertNotIn(PACKAGE_TGZ_NAME, hashed)
+        self.assertNotIn("Compressing package...", client.out)
+        self.assertIn("Uploading conan_package.tgz", client.out)
+        metadata = layout.load_metadata()
+        self.assertEqual(metadata.packages[NO_SETTINGS_PACKAGE_ID].checksums, checksums)
+
+        # A change in the package manifest invalidates the compressed package
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        package_folder = layout.package(pref)
+        save(os.path.join(package_folder, "include", "new.h"), "new header")
+        FileTreeManifest.create(package_folder).save(package_folder)
+        client.run("upload Hello0/1.2.1@user/testing --all -r server2")
+        self.assertIn("Removing outdated conan_package.tgz", client.out)
+        self.assertIn("Compressing package...", client.out)
+        metadata = layout.load_metadata()
+        self.assertNotEqual(metadata.packages[NO_SETTINGS_PACKAGE_ID].checksums, checksums)
+
     def upload_without_cleaned_user_test(self):
         """ When a user is not authenticated, uploads failed first time
         https://github.com/conan-io/conan/issues/5878
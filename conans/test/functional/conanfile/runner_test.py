@@ -1,10 +1,13 @@
+import codecs
 import os
 import unittest
 
 import six
 
 from conans.client.runner import ConanRunner
+from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, TestBufferConanOutput
+from conans.util.files import save
 
 
 class RunnerTest(unittest.TestCase):
@@ -179,3 +182,17 @@ class ConanFileToolsTest(ConanFile):
         client.run("build .", assert_error=True)
         self.assertIn("Error while executing 'mkdir test_folder'", client.out)
         self.assertFalse(os.path.exists(test_folder))
+
+    def decode_output_test(self):
+        folder = temp_folder()
+        # A UTF-8 BOM, UTF-8 lines, a Windows-1252 line and a last line without EOL
+        content = (codecs.BOM_UTF8 + u"first line\nseñal\n".encode("utf-8") +
+                   u"señal 1252\n".encode("cp1252") + b"x" * 100000 + b"\nlast")
+        save(os.path.join(folder, "output.txt"), content)
+        script = ("import sys; getattr(sys.stdout, 'buffer', sys.stdout)"
+                  ".write(open('output.txt', 'rb').read())")
+        out = six.StringIO()
+        runner = ConanRunner(log_run_to_output=True)
+        runner('python -c "%s"' % script, output=out, cwd=folder)
+        self.assertEqual(out.getvalue(), u"first line\nseñal\nseñal 1252\n" +
+                         "x" * 100000 + "\nlast")
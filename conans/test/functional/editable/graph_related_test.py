@@ -49,14 +49,14 @@ class ExistingCacheTestMixin(object):
         self.assertTrue(os.path.exists(self.t.cache.package_layout(self.ref).base_folder()))
         self.assertListEqual(sorted(os.listdir(self.t.cache.package_layout(self.ref).base_folder())),
                              ['build', 'export', 'export_source', 'locks', 'metadata.json',
-                              'metadata.json.lock', 'package', 'source'])
+                              'metadata.json.lock', 'package', 'source', 'usage'])
 
     def tearDown(self):
         self.t.run('editable remove {}'.format(self.ref))
         self.assertTrue(os.path.exists(self.t.cache.package_layout(self.ref).base_folder()))
         self.assertListEqual(sorted(os.listdir(self.t.cache.package_layout(self.ref).base_folder())),
                              ['build', 'export', 'export_source', 'locks', 'metadata.json',
-                              'metadata.json.lock', 'package', 'source'])
+                              'metadata.json.lock', 'package', 'source', 'usage'])
 
 
 class RelatedToGraphBehavior(object):
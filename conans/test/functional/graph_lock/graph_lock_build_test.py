@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+import textwrap
+import unittest
+
+from mock import patch
+
+from conans.model.graph_lock import LOCKFILE
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import load
+
+
+class GraphLockBuildTest(unittest.TestCase):
+
+    def setUp(self):
+        # app -> (libb, libc) -> liba
+        self.client = TestClient()
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("export . liba/1.0@user/testing")
+        self.client.save({"conanfile.py": GenConanfile().with_require_plain("liba/1.0@user/testing")})
+        self.client.run("export . libb/1.0@user/testing")
+        self.client.run("export . libc/1.0@user/testing")
+        self.client.save({"conanfile.py": GenConanfile().with_require_plain("libb/1.0@user/testing")
+                                                        .with_require_plain("libc/1.0@user/testing")})
+        self.client.run("export . app/1.0@user/testing")
+        self.client.run("graph lock app/1.0@user/testing --build=missing")
+
+    def build_test(self):
+        client = self.client
+        client.run("graph build . --build=missing --workers=2 --json=build.json")
+        self.assertIn("Building 4 packages with 2 workers", client.out)
+        self.assertIn("liba/1.0@user/testing: Built in", client.out)
+        self.assertIn("Build summary:", client.out)
+
+        results = json.loads(client.load("build.json"))
+        self.assertEqual([r["status"] for r in results], ["Built"] * 4)
+        built = [r["reference"].split(":")[0].split("#")[0] for r in results]
+        self.assertEqual(built[0], "liba/1.0@user/testing")
+        self.assertEqual(set(built[1:3]), {"libb/1.0@user/testing", "libc/1.0@user/testing"})
+        self.assertEqual(built[3], "app/1.0@user/testing")
+        self.assertEqual(client.load(LOCKFILE).count('"modified": "built"'), 4)
+
+        client.run("install app/1.0@user/testing --lockfile")
+        self.assertIn("app/1.0@user/testing:%s - Cache" % results[3]["reference"].split(":")[1]
+                      .split("#")[0], client.out)
+
+    def build_in_process_test(self):
+        # The executable of a frozen installer cannot run modules, nor other cache than the default
+        client = self.client
+        with patch.object(sys, "frozen", True, create=True):
+            with patch("conans.client.cmd.graph_build.subprocess.call") as call:
+                client.run("graph build . --build=missing --workers=2 --json=build.json")
+        self.assertFalse(call.called)
+        results = json.loads(client.load("build.json"))
+        self.assertEqual([r["status"] for r in results], ["Built"] * 4)
+        self.assertEqual(client.load(LOCKFILE).count('"modified": "built"'), 4)
+
+    def build_error_test(self):
+        client = self.client
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                requires = "liba/1.0@user/testing"
+                def build(self):
+                    raise Exception("Broken libb")
+            """)
+        client.save({"conanfile.py": conanfile})
+        client.run("export . libb/1.0@user/testing")
+        client.run("graph lock app/1.0@user/testing --build=missing")
+        client.run("graph build . --build=missing --workers=1", assert_error=True)
+        self.assertIn("libb/1.0@user/testing: Build failed in", client.out)
+        self.assertIn("Broken libb", client.out)
+        self.assertIn("(node 1): Skipped -", client.out)
+        self.assertIn("ERROR: Failed building libb/1.0@user/testing", client.out)
+        lockfile = load(os.path.join(client.current_folder, LOCKFILE))
+        self.assertEqual(lockfile.count('"modified": "built"'), 1)
@@ -454,6 +454,18 @@ class GraphLockRevisionTest(unittest.TestCase):
         client.run("info . --lockfile")
         self.assertIn("Revision: fa090239f8ba41ad559f8e934494ee2a", client.out)
 
+    def locked_update_no_remote_test(self):
+        client = self.client
+        client.run("install . --lockfile --update")
+        self._check_lock("PkgB/0.1@")
+        # All the locked revisions are in the cache, the remote is not contacted, even if updating
+        client.run("remote update default http://unreachable.invalid")
+        client.run("install . --lockfile --update")
+        self.assertIn("PkgA/0.1@user/channel from 'default' - Cache", client.out)
+        self.assertIn("PkgA/0.1@user/channel:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9 - Cache",
+                      client.out)
+        self._check_lock("PkgB/0.1@")
+
     def export_lock_test(self):
         # locking a version range at export
         self.client.run("export . user/channel --lockfile")
@@ -1,6 +1,8 @@
 import os
+import textwrap
 import unittest
 
+from conans.client import tools
 from conans.model.ref import ConanFileReference
 from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer
 
@@ -421,3 +423,47 @@ class HookTest(unittest.TestCase):
         client.run("export . danimtb/testing")
         self.assertIn("[HOOK - my_hook/my_hook.py] pre_export(): my_printer(): CUSTOM MODULE",
                       client.out)
+
+    def upload_hooks_order_test(self):
+        hook = textwrap.dedent("""
+            import os
+            from conans.errors import ConanException
+
+            def pre_upload(output, **kwargs):
+                output.info("ORDER")
+
+            def pre_upload_recipe(output, **kwargs):
+                output.info("ORDER")
+                if os.getenv("BROKEN_RECIPE_UPLOAD"):
+                    raise ConanException("Broken recipe upload")
+
+            def post_upload_recipe(output, **kwargs):
+                output.info("ORDER")
+
+            def pre_upload_package(output, **kwargs):
+                output.info("ORDER")
+
+            def post_upload_package(output, **kwargs):
+                output.info("ORDER")
+
+            def post_upload(output, **kwargs):
+                output.info("ORDER")
+            """)
+        server = TestServer([], users={"danimtb": "pass"})
+        client = TestClient(servers={"default": server}, users={"default": [("danimtb", "pass")]})
+        client.save({os.path.join(client.cache.hooks_path, "order.py"): hook,
+                     "conanfile.py": conanfile_basic})
+        client.run("config set hooks.order.py")
+        client.run("create . danimtb/testing")
+        for parallel in ("", "--parallel"):
+            client.run("upload basic/0.1@danimtb/testing -r default --all -c %s" % parallel)
+            hooks = [line.split("]")[1].split("(")[0].strip() for line in str(client.out)
+                     .splitlines() if line.endswith("ORDER")]
+            self.assertEqual(hooks, ["pre_upload", "pre_upload_recipe", "post_upload_recipe",
+                                     "pre_upload_package", "post_upload_package",
+                                     "post_upload"])
+
+        with tools.environment_append({"BROKEN_RECIPE_UPLOAD": "1"}):
+            client.run("upload basic/0.1@danimtb/testing -r default --all -c", assert_error=True)
+        self.assertIn("Broken recipe upload", client.out)
+        self.assertNotIn("pre_upload_package", client.out)
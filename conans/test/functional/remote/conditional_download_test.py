@@ -0,0 +1,75 @@
+import os
+import unittest
+
+from mock import Mock
+
+from conans.client.rest.file_downloader import FileDownloader
+from conans.model.ref import ConanFileReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import GenConanfile, TestBufferConanOutput, TestClient, \
+    TestRequester, TestServer
+from conans.util.files import load, md5sum, save
+
+
+class ConditionalDownloadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer(write_permissions=[("*/*@*/*", "*")])
+        client = TestClient(servers={"default": self.server},
+                            users={"default": [("lasote", "mypass")]})
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("upload pkg/0.1@user/testing --all -c")
+
+        ref = ConanFileReference.loads("pkg/0.1@user/testing")
+        ref = ref.copy_with_rev(self.server.server_store.get_last_revision(ref).revision)
+        self.file_path = self.server.server_store.get_conanfile_file_path(ref, "conanfile.py")
+        self.url = "/v2/conans/pkg/0.1/user/testing/revisions/%s/files/conanfile.py" \
+                   % ref.revision
+
+    def etag_test(self):
+        response = self.server.app.get(self.url)
+        self.assertEqual(response.headers["ETag"], '"%s"' % md5sum(self.file_path))
+        self.assertEqual(response.body.decode(), load(self.file_path))
+
+        response = self.server.app.get(self.url, headers={"If-None-Match": '"other"'})
+        self.assertEqual(response.status_code, 200)
+        response = self.server.app.get(self.url,
+                                       headers={"If-None-Match": '"%s"' % md5sum(self.file_path)})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
+
+    def range_test(self):
+        content = load(self.file_path)
+        response = self.server.app.get(self.url, headers={"Range": "bytes=5-"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body.decode(), content[5:])
+        self.assertEqual(response.headers["Content-Range"],
+                         "bytes 5-%d/%d" % (len(content) - 1, len(content)))
+
+        # The range is ignored if the file changed
+        response = self.server.app.get(self.url, headers={"Range": "bytes=5-",
+                                                          "If-Range": '"other"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body.decode(), content)
+
+        response = self.server.app.get(self.url, headers={"Range": "bytes=1000-"},
+                                       expect_errors=True)
+        self.assertEqual(response.status_code, 416)
+
+    def file_downloader_up_to_date_test(self):
+        output = TestBufferConanOutput()
+        downloader = FileDownloader(TestRequester({"default": self.server}), output, True,
+                                    Mock(retry=0, retry_wait=0))
+        url = self.server.fake_url + self.url
+        dest = os.path.join(temp_folder(), "downloaded.py")
+        downloader.download(url, dest)
+        self.assertEqual(load(dest), load(self.file_path))
+
+        downloader.download(url, dest, overwrite=True)
+        self.assertIn("already up to date", output)
+        self.assertEqual(load(dest), load(self.file_path))
+
+        save(dest, "modified")
+        downloader.download(url, dest, overwrite=True)
+        self.assertEqual(load(dest), load(self.file_path))
@@ -4,6 +4,7 @@ import unittest
 from collections import OrderedDict
 from time import sleep
 
+from conans.client.tools import environment_append
 from conans.model.ref import ConanFileReference
 from conans.paths import CONANFILE
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
@@ -257,6 +258,53 @@ class MultiRemoteTest(unittest.TestCase):
         # s2 is not even tried
         self.assertNotIn("MyLib/0.1@conan/testing: Trying with 's2'...", client2.out)
 
+    def parallel_remote_lookup_test(self):
+        ref = ConanFileReference.loads("Hello0/0.1@lasote/stable")
+        self.client.save(cpp_hello_conan_files("Hello0", "0.1", build=False))
+        self.client.run("export . lasote/stable")
+        self.client.run("upload %s -r=remote1" % str(ref))
+        self.client.run("upload %s -r=remote2" % str(ref))
+
+        client2 = TestClient(servers=self.servers, users=self.users)
+        client2.run("config set general.parallel_remote_lookup=True")
+        client2.run("install %s --build=missing" % str(ref))
+        # Only the highest priority remote that has the recipe is tried
+        self.assertNotIn("Trying with 'remote0'...", client2.out)
+        self.assertIn("Hello0/0.1@lasote/stable: Trying with 'remote1'...", client2.out)
+        self.assertNotIn("Trying with 'remote2'...", client2.out)
+        client2.run("info %s" % str(ref))
+        self.assertIn("remote1=http://", client2.out)
+
+        # Failures different to not found stop the lookup as in the sequential mode
+        self.servers["remote0"].fake_url = "http://asdlhaljksdhlajkshdljakhsd.com"  # Do not exist
+        client3 = TestClient(servers=self.servers, users=self.users)
+        with environment_append({"CONAN_PARALLEL_REMOTE_LOOKUP": "1"}):
+            client3.run("install %s --build=missing" % str(ref), assert_error=True)
+        self.assertIn("Unable to connect to remote0=http://asdlhaljksdhlajkshdljakhsd.com",
+                      client3.out)
+        self.assertNotIn("Trying with 'remote1'...", client3.out)
+
+    def parallel_remote_lookup_login_test(self):
+        servers = OrderedDict()
+        users = {}
+        for i in range(3):
+            servers["remote%d" % i] = TestServer(read_permissions=[("*/*@*/*", "lasote")],
+                                                 users={"lasote": "mypass"})
+            users["remote%d" % i] = [("lasote", "mypass")]
+        client = TestClient(servers=servers, users=users)
+        client.save(cpp_hello_conan_files("Hello0", "0.1", build=False))
+        client.run("export . lasote/stable")
+        client.run("upload Hello0/0.1@lasote/stable -r=remote2")
+
+        # Every remote asks for the credentials, but the lookup doesn't fail
+        client2 = TestClient(servers=servers, users=users)
+        client2.run("config set general.parallel_remote_lookup=True")
+        client2.run("install Hello0/0.1@lasote/stable --build=missing")
+        self.assertIn("Hello0/0.1@lasote/stable: Trying with 'remote2'...", client2.out)
+        self.assertNotIn("Trying with 'remote0'...", client2.out)
+        for i in range(3):
+            self.assertEqual(1, str(client2.out).count('Please log in to "remote%d"' % i))
+
     def install_from_remotes_test(self):
         for i in range(3):
             ref = ConanFileReference.loads("Hello%d/0.1@lasote/stable" % i)
@@ -0,0 +1,93 @@
+import json
+import os
+import time
+import unittest
+from collections import OrderedDict
+
+from conans.client.cache.remote_lookups import NOT_FOUND, REMOTE_LOOKUPS_FILE, RemoteLookups
+from conans.client.cache.remote_registry import Remote
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+from conans.util.files import load, save
+
+
+class RemoteLookupsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.servers = OrderedDict()
+        self.servers["default"] = TestServer(write_permissions=[("*/*@*/*", "*")])
+        self.servers["other"] = TestServer(write_permissions=[("*/*@*/*", "*")])
+        self.users = {"default": [("lasote", "mypass")], "other": [("lasote", "mypass")]}
+        self.client = TestClient(servers=self.servers, users=self.users)
+
+    def _create_upload(self, version, remote):
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . pkg/%s@user/testing" % version)
+        self.client.run("upload pkg/%s@user/testing --all -r=%s" % (version, remote))
+
+    def version_range_search_test(self):
+        self._create_upload("1.0", "default")
+        client = TestClient(servers=self.servers, users=self.users)
+        client.run("config set general.remote_lookups_ttl=300")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkg/[>0.5]@user/testing")})
+        client.run("install .")
+        self.assertIn("Version range '>0.5' required by 'conanfile.py' resolved to "
+                      "'pkg/1.0@user/testing' in remote 'default'", client.out)
+        self.assertTrue(os.path.exists(os.path.join(client.cache_folder, REMOTE_LOOKUPS_FILE)))
+
+        # The new version is not seen until the answer expires or the remote is updated
+        self._create_upload("1.1", "default")
+        client.run("remove pkg* -f")
+        client.run("install .")
+        self.assertIn("resolved to 'pkg/1.0@user/testing' in remote", client.out)
+        client.run("remove pkg* -f")
+        client.run("install . --update")
+        self.assertIn("resolved to 'pkg/1.1@user/testing' in remote", client.out)
+
+    def recipe_not_found_test(self):
+        self._create_upload("1.0", "other")
+        client = TestClient(servers=self.servers, users=self.users)
+        client.run("config set general.remote_lookups_ttl=300")
+        client.run("install pkg/1.0@user/testing")
+        self.assertIn("pkg/1.0@user/testing: Trying with 'default'...", client.out)
+        self.assertIn("pkg/1.0@user/testing: Trying with 'other'...", client.out)
+
+        client.run("remove pkg* -f")
+        client.run("install pkg/1.0@user/testing")
+        self.assertNotIn("Trying with 'default'...", client.out)
+        self.assertIn("pkg/1.0@user/testing: Trying with 'other'...", client.out)
+
+        client.run("remove pkg* -f")
+        client.run("install pkg/1.0@user/testing --update")
+        self.assertIn("pkg/1.0@user/testing: Trying with 'default'...", client.out)
+
+    def disabled_test(self):
+        self._create_upload("1.0", "other")
+        client = TestClient(servers=self.servers, users=self.users)
+        client.run("install pkg/1.0@user/testing")
+        client.run("remove pkg* -f")
+        client.run("install pkg/1.0@user/testing")
+        self.assertIn("pkg/1.0@user/testing: Trying with 'default'...", client.out)
+        self.assertFalse(os.path.exists(os.path.join(client.cache_folder, REMOTE_LOOKUPS_FILE)))
+
+    def flush_test(self):
+        folder = temp_folder()
+        lookups_file = os.path.join(folder, REMOTE_LOOKUPS_FILE)
+        expired = "%s http://expired pkg/0.1@user/testing" % NOT_FOUND
+        save(lookups_file, json.dumps({expired: [time.time() - 1000, True]}))
+        remote = Remote("default", "http://myremote", True, False)
+        lookups = RemoteLookups(folder, 300)
+        lookups.set(NOT_FOUND, remote, "pkg/1.0@user/testing", True)
+        self.assertTrue(lookups.get(NOT_FOUND, remote, "pkg/1.0@user/testing"))
+        # Nothing is written until the end of the command
+        self.assertIn(expired, load(lookups_file))
+
+        # Other process answered meanwhile
+        other = RemoteLookups(folder, 300)
+        other.set(NOT_FOUND, remote, "pkg/2.0@user/testing", True)
+        other.flush()
+
+        lookups.flush()
+        stored = json.loads(load(lookups_file))
+        self.assertEqual(sorted(stored), ["%s http://myremote pkg/%s@user/testing" % (NOT_FOUND, v)
+                                          for v in ("1.0", "2.0")])
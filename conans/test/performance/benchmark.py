@@ -0,0 +1,121 @@
+""" Benchmarks of the hot paths of the client (export, graph resolution, info, install, upload,
+search and remove) against an in-process server, using the synthetic graphs and packages of
+conans.test.performance.graphs. The timings, and the peak memory allocated to compute the
+graph (py3 only), are written as JSON, to track them over time:
+
+    python -m conans.test.performance.benchmark --output=timings.json --size=20
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from collections import OrderedDict
+
+try:
+    import tracemalloc
+except ImportError:  # py2
+    tracemalloc = None
+
+from conans import __version__ as client_version
+from conans.test.performance.graphs import SCENARIOS, USER_CHANNEL
+from conans.test.utils.tools import TestClient, TestServer
+
+
+OPERATIONS = ["export", "graph", "info", "install", "install_cached", "upload", "search",
+              "search_remote", "remove", "install_remote"]
+
+
+class Benchmark(object):
+
+    def __init__(self, graph, files=10, file_size=1024):
+        self._graph = graph
+        self._files = files
+        self._file_size = file_size
+        self.timings = OrderedDict((op, []) for op in OPERATIONS)
+        self.graph_memory = []  # peak bytes allocated by 'conan graph lock'
+
+    def _timed(self, operation, client, commands):
+        start = time.time()
+        for command in commands:
+            client.run(command)
+        self.timings[operation].append(time.time() - start)
+
+    def run(self):
+        server = TestServer(write_permissions=[("*/*@*/*", "*")])
+        client = TestClient(servers={"default": server},
+                            users={"default": [("lasote", "mypass")]})
+
+        exports = []
+        for name in self._graph.nodes:
+            recipe = self._graph.recipe(name, self._files, self._file_size)
+            client.save({"%s/conanfile.py" % name: recipe})
+            exports.append("export %s %s" % (name, USER_CHANNEL))
+        self._timed("export", client, exports)
+
+        client.save({"conanfile.py": self._graph.consumer()}, clean_first=True)
+        self._timed("graph", client, ["graph lock ."])
+        if tracemalloc is not None:
+            tracemalloc.start()
+            client.run("graph lock .")
+            self.graph_memory.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        self._timed("info", client, ["info ."])
+        self._timed("install", client, ["install . --build=missing"])
+        self._timed("install_cached", client, ["install ."])
+        self._timed("upload", client, ['upload "*" --all --confirm -r default'])
+        self._timed("search", client, ['search "*"'])
+        self._timed("search_remote", client, ['search "*" -r default'])
+        self._timed("remove", client, ['remove "*" -f'])
+        self._timed("install_remote", client, ["install ."])
+
+
+def run_benchmarks(scenarios=None, size=10, files=10, file_size=1024, repeat=1):
+    """ runs 'repeat' times every scenario, each time with a new client and server, and
+    returns the timings (in seconds) of all the runs of every operation
+    """
+    results = OrderedDict()
+    results["conan_version"] = client_version
+    results["python_version"] = platform.python_version()
+    results["platform"] = platform.platform()
+    results["scenarios"] = OrderedDict()
+    for name in scenarios or SCENARIOS:
+        graph = SCENARIOS[name](size)
+        benchmark = Benchmark(graph, files, file_size)
+        for _ in range(repeat):
+            benchmark.run()
+        results["scenarios"][name] = OrderedDict([("recipes", len(graph.nodes)),
+                                                  ("files", files),
+                                                  ("file_size", file_size),
+                                                  ("timings", benchmark.timings),
+                                                  ("graph_memory", benchmark.graph_memory)])
+    return results
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description="Benchmarks the client against an "
+                                                 "in-process server with synthetic graphs")
+    parser.add_argument("-o", "--output", help="JSON file to write the results, stdout if "
+                                               "not defined")
+    parser.add_argument("-s", "--scenario", action="append", choices=list(SCENARIOS),
+                        help="Scenario to run, can be repeated. All of them by default")
+    parser.add_argument("--size", type=int, default=10,
+                        help="Size of the graphs (packages, chain length or layers)")
+    parser.add_argument("--files", type=int, default=10, help="Files in every package")
+    parser.add_argument("--file-size", type=int, default=1024,
+                        help="Size in bytes of the files of the packages")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of every scenario")
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(args.scenario, args.size, args.files, args.file_size,
+                             args.repeat)
+    output = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
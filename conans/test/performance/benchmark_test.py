@@ -0,0 +1,54 @@
+import json
+import os
+import unittest
+
+from nose.plugins.attrib import attr
+
+from conans.test.performance.benchmark import OPERATIONS, main
+from conans.test.performance.graphs import SCENARIOS, build_requires_graph, diamond_graph
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load
+
+
+class SyntheticGraphsTest(unittest.TestCase):
+
+    def diamond_test(self):
+        graph = diamond_graph(3, width=2)
+        self.assertEqual(list(graph.nodes), ["diamond0_0", "diamond0_1", "diamond1_0",
+                                             "diamond1_1", "diamond2_0", "diamond2_1"])
+        self.assertEqual(graph.nodes["diamond1_0"], (["diamond0_0", "diamond0_1"], []))
+        self.assertEqual(graph.roots, ["diamond2_0", "diamond2_1"])
+
+    def build_requires_test(self):
+        graph = build_requires_graph(2, version_ranges=True)
+        self.assertEqual(graph.roots, ["lib1"])
+        recipe = graph.recipe("lib1", files=3, file_size=10)
+        self.assertIn("requires = ('lib0/[>=1.0 <2.0]@bench/testing',)", recipe)
+        self.assertIn("build_requires = ('tool0/[>=1.0 <2.0]@bench/testing', "
+                      "'tool1/[>=1.0 <2.0]@bench/testing')", recipe)
+        self.assertIn("for i in range(3):", recipe)
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def _run(self, *args):
+        output = os.path.join(temp_folder(), "timings.json")
+        main(["--output=%s" % output, "--files=2", "--file-size=16"] + list(args))
+        return json.loads(load(output))
+
+    def json_output_test(self):
+        results = self._run("--scenario=wide", "--size=1")
+        self.assertEqual(list(results["scenarios"]), ["wide"])
+        scenario = results["scenarios"]["wide"]
+        self.assertEqual(list(scenario["timings"]), OPERATIONS)
+        for timings in scenario["timings"].values():
+            self.assertEqual(len(timings), 1)
+        self.assertIn("graph_memory", scenario)
+
+    @attr("slow")
+    def all_scenarios_test(self):
+        results = self._run("--size=2")
+        self.assertEqual(list(results["scenarios"]), list(SCENARIOS))
+        for scenario in results["scenarios"].values():
+            self.assertEqual(list(scenario["timings"]), OPERATIONS)
+            self.assertIn("graph_memory", scenario)
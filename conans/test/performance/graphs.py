@@ -0,0 +1,121 @@
+from collections import OrderedDict
+
+
+USER_CHANNEL = "bench/testing"
+VERSION_RANGE = "[>=1.0 <2.0]"
+
+_recipe = """import os
+from conans import ConanFile
+
+
+class BenchConan(ConanFile):
+{attributes}
+    settings = "os", "build_type"
+    requires = {requires}
+    build_requires = {build_requires}
+
+    def package(self):
+        for i in range({files}):
+            path = os.path.join(self.package_folder, "data", "file%d.bin" % i)
+            if not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as f:
+                f.write(os.urandom({file_size}))
+"""
+
+
+class SyntheticGraph(object):
+    """ Recipes of a synthetic dependency graph, in topological order (dependencies first).
+    Every recipe is defined by the names of its requires and build_requires, the consumer
+    requires all the recipes that are not required by any other one
+    """
+    def __init__(self, version_ranges=False):
+        self.nodes = OrderedDict()  # name: (requires, build_requires)
+        self.version_ranges = version_ranges
+
+    def add(self, name, requires=None, build_requires=None):
+        self.nodes[name] = (requires or [], build_requires or [])
+
+    def _require(self, name):
+        version = VERSION_RANGE if self.version_ranges else "1.0"
+        return "%s/%s@%s" % (name, version, USER_CHANNEL)
+
+    @property
+    def roots(self):
+        required = set()
+        for requires, build_requires in self.nodes.values():
+            required.update(requires)
+            required.update(build_requires)
+        return [name for name in self.nodes if name not in required]
+
+    def recipe(self, name, files=0, file_size=0):
+        requires, build_requires = self.nodes[name]
+        attributes = '    name = "%s"\n    version = "1.0"' % name
+        return self._conanfile(attributes, requires, build_requires, files, file_size)
+
+    def consumer(self):
+        return self._conanfile('    name = "consumer"', self.roots, [], 0, 0)
+
+    def _conanfile(self, attributes, requires, build_requires, files, file_size):
+        return _recipe.format(attributes=attributes,
+                              requires=tuple(self._require(r) for r in requires),
+                              build_requires=tuple(self._require(r) for r in build_requires),
+                              files=files, file_size=file_size)
+
+
+def wide_graph(size, version_ranges=False):
+    """ 'size' independent packages, all of them required by the consumer
+    """
+    graph = SyntheticGraph(version_ranges)
+    for i in range(size):
+        graph.add("wide%d" % i)
+    return graph
+
+
+def deep_graph(size, version_ranges=False):
+    """ a chain of 'size' packages, each one requiring the previous one
+    """
+    graph = SyntheticGraph(version_ranges)
+    for i in range(size):
+        graph.add("deep%d" % i, requires=["deep%d" % (i - 1)] if i else None)
+    return graph
+
+
+def diamond_graph(size, version_ranges=False, width=3):
+    """ 'size' layers of 'width' packages, every package requiring all the packages of the
+    previous layer, so every layer closes width*width diamonds
+    """
+    graph = SyntheticGraph(version_ranges)
+    previous = []
+    for i in range(size):
+        layer = ["diamond%d_%d" % (i, j) for j in range(width)]
+        for name in layer:
+            graph.add(name, requires=previous)
+        previous = layer
+    return graph
+
+
+def build_requires_graph(size, version_ranges=False):
+    """ a chain of 'size' libraries, every one of them build-requiring the same 2 tools
+    """
+    graph = SyntheticGraph(version_ranges)
+    graph.add("tool0")
+    graph.add("tool1", requires=["tool0"])
+    tools = ["tool0", "tool1"]
+    for i in range(size):
+        graph.add("lib%d" % i, requires=["lib%d" % (i - 1)] if i else None,
+                  build_requires=tools)
+    return graph
+
+
+def version_ranges_graph(size):
+    """ a diamond graph in which all the requirements are version ranges
+    """
+    return diamond_graph(size, version_ranges=True)
+
+
+SCENARIOS = OrderedDict([("wide", wide_graph),
+                         ("deep", deep_graph),
+                         ("diamond", diamond_graph),
+                         ("build_requires", build_requires_graph),
+                         ("version_ranges", version_ranges_graph)])
@@ -10,7 +10,7 @@ from conans.client.output import ConanOutput
 from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import mkdir
+from conans.util.files import load, mkdir
 from conans.util.files import save
 
 
@@ -68,3 +68,17 @@ class CacheTest(unittest.TestCase):
             metadata.packages[pref2.id].revision = "prevision"
 
         self.assertTrue(layout2.package_exists(pref2))
+
+    def test_update_metadata_unchanged(self):
+        layout = self.cache.package_layout(self.ref)
+        with layout.update_metadata() as metadata:
+            metadata.recipe.revision = "revision"
+        metadata_path = layout.package_metadata()
+        os.utime(metadata_path, (0, 0))
+        with layout.update_metadata() as metadata:
+            metadata.recipe.revision = "revision"
+        self.assertEqual(os.path.getmtime(metadata_path), 0)  # Not rewritten
+        with layout.update_metadata() as metadata:
+            metadata.packages["1"].revision = "prev1"
+        self.assertNotEqual(os.path.getmtime(metadata_path), 0)
+        self.assertEqual(layout.load_metadata().packages["1"].revision, "prev1")
@@ -1,11 +1,13 @@
 import mock
 import os
 import platform
+import stat
+import time
 import unittest
 
-from conans.client.file_copier import FileCopier
+from conans.client.file_copier import FileCopier, _MATCHERS, _MATCHERS_MAX_SIZE, _matcher
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import load, save
+from conans.util.files import load, save, walk
 
 
 class FileCopierTest(unittest.TestCase):
@@ -200,3 +202,94 @@ class FileCopierTest(unittest.TestCase):
             copier("*", src=os.path.join(src_folder, "sub"))
 
         self.assertEqual(copy2_mock.call_count, len(src_folders))
+
+    def folder_index_reused_test(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include", "header.h"), "")
+        save(os.path.join(src_folder, "lib", "mylib.a"), "")
+        save(os.path.join(src_folder, "lib", "mylib.so"), "")
+        save(os.path.join(src_folder, "bin", "mylib.dll"), "")
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        with mock.patch("conans.client.file_copier.walk", wraps=walk) as walk_mock:
+            copier("*.h", dst="include", keep_path=False)
+            copier("*.a", dst="lib", keep_path=False)
+            copier("*.so", dst="lib", src="lib")
+            copier("*.dll", dst="bin", keep_path=False)
+            self.assertEqual(walk_mock.call_count, 1)
+        self.assertEqual(["mylib.a", "mylib.so"],
+                         sorted(os.listdir(os.path.join(dst_folder, "lib"))))
+        self.assertEqual(["mylib.dll"], os.listdir(os.path.join(dst_folder, "bin")))
+
+    def folder_index_invalidated_test(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "lib", "mylib.a"), "")
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        copier("*.a", dst="lib", keep_path=False)
+        # A new file (and folder) must be copied in following calls
+        save(os.path.join(src_folder, "lib", "other", "otherlib.a"), "")
+        copier("*.a", dst="lib", keep_path=False)
+        self.assertEqual(["mylib.a", "otherlib.a"],
+                         sorted(os.listdir(os.path.join(dst_folder, "lib"))))
+
+    def folder_index_same_timestamp_test(self):
+        # File systems with coarse timestamps might keep the one of the modified folder
+        src_folder = temp_folder()
+        lib_folder = os.path.join(src_folder, "lib")
+        save(os.path.join(lib_folder, "mylib.a"), "")
+        mtime = os.stat(lib_folder).st_mtime
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        copier("*.a", dst="lib", keep_path=False)
+        save(os.path.join(lib_folder, "otherlib.a"), "")
+        os.utime(lib_folder, (mtime, mtime))
+        copier("*.a", dst="lib", keep_path=False)
+        self.assertEqual(["mylib.a", "otherlib.a"],
+                         sorted(os.listdir(os.path.join(dst_folder, "lib"))))
+
+    def folder_index_old_folders_test(self):
+        # The folders modified long before they were listed are only checked by timestamp
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "lib", "mylib.a"), "")
+        old = time.time() - 3600
+        for folder in (src_folder, os.path.join(src_folder, "lib")):
+            os.utime(folder, (old, old))
+
+        copier = FileCopier([src_folder], temp_folder())
+        copier("*.a", dst="lib", keep_path=False)
+        with mock.patch("os.listdir", wraps=os.listdir) as listdir_mock:
+            copier("*.a", dst="lib", keep_path=False)
+            copier("*.a", src="lib")
+            self.assertEqual(listdir_mock.call_count, 0)
+
+    def matchers_bounded_test(self):
+        for i in range(_MATCHERS_MAX_SIZE + 10):
+            self.assertTrue(_matcher("*.%d" % i)("file.%d" % i))
+        self.assertLessEqual(len(_MATCHERS), _MATCHERS_MAX_SIZE)
+
+    @unittest.skipUnless(platform.system() != "Windows", "Requires Symlinks")
+    def copy_modes_test(self):
+        for mode in ("hardlink", "symlink", "reflink", "copy"):
+            src_folder = temp_folder()
+            src_file = os.path.join(src_folder, "lib", "mylib.so")
+            save(src_file, "mylib")
+            dst_folder = temp_folder()
+            copier = FileCopier([src_folder], dst_folder, copy_mode=mode)
+            copier("*.so")
+            copied = os.path.join(dst_folder, "lib", "mylib.so")
+            self.assertEqual("mylib", load(copied))
+            self.assertEqual(mode == "symlink", os.path.islink(copied))
+            self.assertEqual(os.stat(copied).st_nlink, 2 if mode == "hardlink" else 1)
+            # The linked files are the original ones, they cannot be modified
+            writable = bool(os.stat(src_file).st_mode & stat.S_IWUSR)
+            self.assertEqual(writable, mode not in ("hardlink", "symlink"))
+            os.chmod(src_file, os.stat(src_file).st_mode | stat.S_IWUSR)
+
+            # Copying again over an existing link never modifies the original file
+            FileCopier([src_folder], dst_folder)("*.so")
+            save(copied, "modified")
+            self.assertEqual("mylib", load(os.path.join(src_folder, "lib", "mylib.so")))
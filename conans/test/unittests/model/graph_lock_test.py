@@ -0,0 +1,53 @@
+import unittest
+
+from conans.model.graph_lock import GraphLock, GraphLockNode
+from conans.model.ref import ConanFileReference
+
+
+class GraphLockTest(unittest.TestCase):
+
+    def setUp(self):
+        # consumer -> app -> (liba, libb), libb -> liba, app -(build_require)-> tool
+        pref = "{}/1.0@user/testing#rev1:" + "a" * 40 + "#prev1"
+        nodes = {"0": {"pref": None, "options": "", "path": "conanfile.py", "requires": ["1"]},
+                 "1": {"pref": pref.format("app"), "options": "shared=True",
+                       "requires": ["2", "3"], "build_requires": ["4"]},
+                 "2": {"pref": pref.format("liba"), "options": "libb:shared=False"},
+                 "3": {"pref": pref.format("libb"), "options": "shared=False",
+                       "requires": ["2"]},
+                 "4": {"pref": pref.format("tool"), "options": ""}}
+        self.data = {"nodes": nodes}
+        self.graph_lock = GraphLock.from_dict(self.data)
+        self.graph_lock.revisions_enabled = True
+
+    def serialization_test(self):
+        self.assertEqual(self.graph_lock.as_dict(), self.data)
+        self.assertEqual(self.graph_lock.pref("1").ref.name, "app")
+        self.graph_lock._nodes["1"].options.shared = False
+        self.assertEqual(self.graph_lock.as_dict()["nodes"]["1"]["options"], "shared=False")
+
+    def closure_affected_test(self):
+        self.assertEqual(self.graph_lock._closure_affected(), set())
+        self.graph_lock._nodes["2"].modified = GraphLockNode.MODIFIED_BUILT
+        self.assertEqual(self.graph_lock._closure_affected(), {"0", "1", "3"})
+        self.graph_lock.clean_modified()
+        self.graph_lock._nodes["4"].modified = GraphLockNode.MODIFIED_BUILT
+        self.assertEqual(self.graph_lock._closure_affected(), {"0", "1"})
+
+        new_lock = GraphLock.from_dict(self.data)
+        new_lock._nodes["3"].requires = []
+        new_lock._nodes["3"].modified = GraphLockNode.MODIFIED_BUILT
+        self.graph_lock.update_lock(new_lock)
+        self.graph_lock._nodes["2"].modified = GraphLockNode.MODIFIED_BUILT
+        self.assertEqual(self.graph_lock._closure_affected(), {"0", "1"})
+
+    def get_node_test(self):
+        self.assertEqual(self.graph_lock.get_node(None), "0")
+        ref = ConanFileReference.loads("libb/1.0@user/testing#rev1")
+        self.assertEqual(self.graph_lock.get_node(ref), "3")
+        self.assertEqual(self.graph_lock.get_node(ref.copy_with_rev("rev2")), "3")
+
+        self.graph_lock.update_exported_ref("3", ref.copy_with_rev("rev2"))
+        self.assertEqual(self.graph_lock.get_node(ref.copy_with_rev("rev2")), "3")
+        self.assertEqual(self.graph_lock.pref("3").ref.revision, "rev2")
+        self.assertEqual(self.graph_lock.get_node(ConanFileReference.loads("tool/1.0")), "4")
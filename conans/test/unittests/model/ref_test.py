@@ -107,6 +107,33 @@ class RefTest(unittest.TestCase):
         self.assertTrue(ref == ref2)
         self.assertFalse(ref != ref2)
 
+    def interned_fields_test(self):
+        ref = ConanFileReference.loads("opencv/2.4.10@lasote/testing#23")
+        ref2 = ConanFileReference.loads("".join("opencv/2.4.11@lasote/testing#23"))
+        self.assertIs(ref.name, ref2.name)
+        self.assertIs(ref.user, ref2.user)
+        self.assertIs(ref.channel, ref2.channel)
+        self.assertIs(ref.revision, ref2.revision)
+        pref = PackageReference(ref, "".join("123123123"))
+        pref2 = PackageReference(ref2, "".join("123123123"))
+        self.assertIs(pref.id, pref2.id)
+        self.assertFalse(hasattr(ref, "__dict__"))
+        self.assertFalse(hasattr(pref, "__dict__"))
+
+    def shared_loads_test(self):
+        ref = ConanFileReference.loads("opencv/2.4.10@lasote/testing#23")
+        self.assertIs(ref, ConanFileReference.loads("opencv/2.4.10@lasote/testing#23"))
+        self.assertIs(repr(ref), repr(ref))
+        pref = PackageReference.loads("opencv/2.4.10@lasote/testing#23:123123123#989")
+        self.assertIs(pref, PackageReference.loads("opencv/2.4.10@lasote/testing#23:123123123#989"))
+        self.assertIs(pref.ref, ref)
+
+        # Loading without validation doesn't skip later validations of the same text
+        ConanFileReference.loads("o/2.4.10@laso/testing", validate=False)
+        self.assertRaises(ConanException, ConanFileReference.loads, "o/2.4.10@laso/testing")
+        PackageReference.loads("o/2.4.10@laso/testing:123", validate=False)
+        self.assertRaises(ConanException, PackageReference.loads, "o/2.4.10@laso/testing:123")
+
 
 class ConanNameTestCase(unittest.TestCase):
 
@@ -0,0 +1,124 @@
+import os
+import time
+import unittest
+from datetime import timedelta
+
+import mock
+from bottle import FileUpload
+from six import BytesIO
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.revision_list import RevisionList
+from conans.server.store.disk_adapter import ServerDiskAdapter, save_file_upload
+from conans.server.store.server_store import ServerStore, REVISIONS_FILE
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+class ServerStoreRevisionsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        updown_auth_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        self.adapter = ServerDiskAdapter("http://url", temp_folder(), updown_auth_manager)
+        self.ref = ConanFileReference.loads("pkg/1.0@user/channel#rev1")
+
+    def _store(self, revisions_cache_check=True):
+        return ServerStore(self.adapter, revisions_cache_check=revisions_cache_check)
+
+    def cached_lookups_test(self):
+        store = self._store()
+        store.update_last_revision(self.ref)
+        self.assertEqual(store.get_last_revision(self.ref).revision, "rev1")
+
+        with mock.patch.object(self.adapter, "read_file") as read_file:
+            self.assertEqual(store.get_last_revision(self.ref).revision, "rev1")
+            revisions = store.get_recipe_revisions(self.ref.copy_clear_rev())
+            self.assertEqual([r.revision for r in revisions], ["rev1"])
+            self.assertIsNotNone(store.get_revision_time(self.ref))
+            self.assertFalse(read_file.called)
+
+        # Other ServerStore objects of the process share the cache
+        with mock.patch.object(self.adapter, "read_file") as read_file:
+            self.assertEqual(self._store().get_last_revision(self.ref).revision, "rev1")
+            self.assertFalse(read_file.called)
+
+    def changes_are_coherent_test(self):
+        store = self._store(revisions_cache_check=False)
+        ref2 = self.ref.copy_with_rev("rev2")
+        pref = PackageReference(self.ref, "pid", "prev1")
+        for path in (store.export(self.ref), store.export(ref2), store.package(pref)):
+            save(os.path.join(path, "conanmanifest.txt"), "")
+
+        store.update_last_revision(self.ref)
+        self.assertEqual(store.get_last_revision(self.ref).revision, "rev1")
+        store.update_last_revision(ref2)
+        self.assertEqual(store.get_last_revision(self.ref).revision, "rev2")
+
+        store.update_last_package_revision(pref)
+        self.assertEqual(store.get_last_package_revision(pref).revision, "prev1")
+        store.remove_package(pref)
+        self.assertIsNone(store.get_last_package_revision(pref))
+
+        store.remove_conanfile(ref2)
+        self.assertEqual(store.get_last_revision(self.ref).revision, "rev1")
+        store.remove_conanfile(self.ref.copy_clear_rev())
+        self.assertIsNone(store.get_last_revision(self.ref))
+
+    def modified_by_other_process_test(self):
+        store = self._store()
+        store.update_last_revision(self.ref)
+        self.assertEqual(store.get_last_revision(self.ref).revision, "rev1")
+
+        time.sleep(0.01)
+        rev_list = RevisionList()
+        rev_list.add_revision("other_rev")
+        rev_file = os.path.join(store.conan_revisions_root(self.ref.copy_clear_rev()),
+                                REVISIONS_FILE)
+        save(rev_file, rev_list.dumps())
+        self.assertEqual(store.get_last_revision(self.ref).revision, "other_rev")
+
+
+class ServerStoreCopyTest(unittest.TestCase):
+
+    def copy_package_test(self):
+        updown_auth_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        adapter = ServerDiskAdapter("http://url", temp_folder(), updown_auth_manager)
+        store = ServerStore(adapter)
+        pref = PackageReference.loads("pkg/1.0@user/testing#rev1:pid#prev1")
+        dest_pref = PackageReference.loads("pkg/1.0@user/stable#rev1:pid#prev1")
+        save(os.path.join(store.package(pref), "conanmanifest.txt"), "manifest")
+        store.update_last_package_revision(pref)
+        snapshot = store.get_package_snapshot(pref)  # Stores the checksums of the files
+
+        store.copy_package(pref, dest_pref)
+        self.assertEqual(store.get_package_snapshot(dest_pref), snapshot)
+        self.assertEqual(store.get_last_package_revision(dest_pref).revision, "prev1")
+        src = os.path.join(store.package(pref), "conanmanifest.txt")
+        dst = os.path.join(store.package(dest_pref), "conanmanifest.txt")
+        if hasattr(os, "link"):
+            self.assertTrue(os.path.samefile(src, dst))
+        src_checksum = os.path.join(store.package(pref) + ".checksums", "conanmanifest.txt.md5")
+        dst_checksum = os.path.join(store.package(dest_pref) + ".checksums",
+                                    "conanmanifest.txt.md5")
+        self.assertFalse(os.path.samefile(src_checksum, dst_checksum))
+
+    def upload_after_copy_test(self):
+        # The files hard linked by the copy are replaced by the uploads, not modified
+        updown_auth_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        adapter = ServerDiskAdapter("http://url", temp_folder(), updown_auth_manager)
+        store = ServerStore(adapter)
+        ref = ConanFileReference.loads("pkg/1.0@user/testing#rev1")
+        dest_ref = ConanFileReference.loads("pkg/1.0@user/stable#rev1")
+        folder = store.export(ref)
+        save(os.path.join(folder, "conanfile.py"), "contents")
+        store.update_last_revision(ref)
+        store.copy_recipe(ref, dest_ref)
+        snapshot = store.get_recipe_snapshot(dest_ref)
+
+        save_file_upload(FileUpload(BytesIO(b"new contents"), "file", "conanfile.py"), folder)
+        self.assertEqual(load(os.path.join(folder, "conanfile.py")), "new contents")
+        self.assertEqual(load(os.path.join(store.export(dest_ref), "conanfile.py")), "contents")
+        self.assertEqual(store.get_recipe_snapshot(dest_ref), snapshot)
+        self.assertNotEqual(store.get_recipe_snapshot(ref), snapshot)
+        self.assertEqual(os.listdir(folder + ".checksums"), ["conanfile.py.md5"])
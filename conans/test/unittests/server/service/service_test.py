@@ -1,5 +1,7 @@
 import os
 import unittest
+
+import mock
 from datetime import timedelta
 from time import sleep
 
@@ -26,8 +28,8 @@ class MockFileSaver(object):
         self.filename = filename
         self.content = content
 
-    def save(self, abspath):
-        save(os.path.join(abspath, self.filename), self.content)
+    def save(self, destination):
+        destination.write(self.content.encode())
 
 
 class FileUploadDownloadServiceTest(unittest.TestCase):
@@ -74,6 +76,36 @@ class FileUploadDownloadServiceTest(unittest.TestCase):
         self.assertRaises(RequestErrorException, self.service.put_file, file_saver,
                           self.absolute_file_path, token, len(self.content) + 1)
 
+    def test_file_upload_checksum(self):
+        token = self.updown_auth_manager.get_token_for(self.relative_file_path,
+                                                       "pepe", len(self.content))
+        file_saver = MockFileSaver("thefile.txt", self.content)
+        self.service.put_file(file_saver, self.absolute_file_path, token, len(self.content))
+
+        adapter = ServerDiskAdapter("http://url", self.storage_dir, self.updown_auth_manager)
+        with mock.patch("conans.server.store.disk_adapter.md5sum") as md5sum_mock:
+            snapshot = adapter.get_snapshot(self.disk_path)
+            self.assertFalse(md5sum_mock.called)
+        # The checksum file is not part of the stored files
+        self.assertEqual(snapshot, {self.absolute_file_path: md5sum(self.absolute_file_path)})
+
+        # If the file is modified after the upload, the checksum is computed again, even if
+        # the file system keeps the same modification time
+        mtime = os.path.getmtime(self.absolute_file_path)
+        save(self.absolute_file_path, "other content")
+        os.utime(self.absolute_file_path, (mtime, mtime))
+        snapshot = adapter.get_snapshot(self.disk_path)
+        self.assertEqual(snapshot, {self.absolute_file_path: md5sum(self.absolute_file_path)})
+
+        # Same size, other modification time
+        save(self.absolute_file_path, "other CONTENT")
+        os.utime(self.absolute_file_path, (mtime + 1, mtime + 1))
+        snapshot = adapter.get_snapshot(self.disk_path)
+        self.assertEqual(snapshot, {self.absolute_file_path: md5sum(self.absolute_file_path)})
+        with mock.patch("conans.server.store.disk_adapter.md5sum") as md5sum_mock:
+            adapter.get_snapshot(self.disk_path)
+            self.assertFalse(md5sum_mock.called)
+
 
 class ConanServiceTest(unittest.TestCase):
 
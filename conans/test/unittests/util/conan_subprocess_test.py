@@ -0,0 +1,30 @@
+import os
+import sys
+import unittest
+
+from mock import patch
+
+import conans
+from conans.util.runners import conan_subprocess
+
+
+class ConanSubprocessTest(unittest.TestCase):
+
+    def module_test(self):
+        cmd, env = conan_subprocess("/path/cache", ["conans.module", "arg"], ["command", "arg"])
+        self.assertEqual(cmd, [sys.executable, "-m", "conans.module", "arg"])
+        python_path = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+        self.assertEqual(env["PYTHONPATH"].split(os.pathsep)[0], python_path)
+
+    def frozen_test(self):
+        cache_folder = os.path.join(os.path.abspath("home"), ".conan")
+        with patch.object(sys, "frozen", True, create=True):
+            cmd, env = conan_subprocess(cache_folder, ["conans.module", "arg"],
+                                        ["command", "arg"])
+            self.assertEqual(cmd, [sys.executable, "command", "arg"])
+            self.assertEqual(env["CONAN_USER_HOME"], os.path.abspath("home"))
+            # Other cache than the one of CONAN_USER_HOME has to run in the same process
+            cmd, env = conan_subprocess(os.path.abspath("cache"), ["conans.module", "arg"],
+                                        ["command", "arg"])
+            self.assertIsNone(cmd)
+            self.assertIsNone(env)
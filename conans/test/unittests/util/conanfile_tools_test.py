@@ -57,6 +57,16 @@ class Pkg(ConanFile):
         content = load(os.path.join(output_dir, "example.txt"))
         self.assertEqual(content, "Hello world!")
 
+    def test_gunzip(self):
+        tmp_dir = temp_folder()
+        gz_path = os.path.join(tmp_dir, "example.txt.gz")
+        import gzip
+        with gzip.open(gz_path, "wb") as f:
+            f.write(b"Hello world!" * 1000)
+        output_file = os.path.join(tmp_dir, "output_dir", "example.txt")
+        tools.unzip(gz_path, output_file, output=ConanOutput(stream=sys.stdout))
+        self.assertEqual(load(output_file), "Hello world!" * 1000)
+
     def test_replace_in_file(self):
         tmp_dir = temp_folder()
         text_file = os.path.join(tmp_dir, "text.txt")
@@ -0,0 +1,82 @@
+import os
+import platform
+import stat
+import zipfile
+from unittest import TestCase
+
+from six import StringIO
+
+from conans.client.output import ConanOutput
+from conans.client.tools.files import unzip
+from conans.test.unittests.util.files_extract_wildcard_test import create_archive
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save, save_files
+
+
+class UnzipParallelTest(TestCase):
+
+    def setUp(self):
+        self.src_dir = temp_folder()
+        self.files = {"file%d.txt" % i: "content %d" % i * (i + 1) for i in range(10)}
+        self.files.update({"foo/file.cpp": "code",
+                           "foo/bar/file.txt": "text",
+                           "foo/bar/baz/file.txt": "more text"})
+        save_files(self.src_dir, self.files)
+        self.archive = create_archive(os.path.join(temp_folder(), "archive.zip"), self.src_dir,
+                                      self.files)
+
+    def _unzip(self, threads, **kwargs):
+        stream = StringIO()
+        dst_dir = temp_folder()
+        unzip(self.archive, dst_dir, output=ConanOutput(stream), threads=threads, **kwargs)
+        return dst_dir, stream.getvalue()
+
+    def _extracted(self, dst_dir):
+        result = set()
+        for root, _, files in os.walk(dst_dir):
+            result.update(os.path.relpath(os.path.join(root, f), dst_dir).replace("\\", "/")
+                          for f in files)
+        return result
+
+    def test_contents(self):
+        # More threads than files too
+        for threads in (2, 3, 20):
+            dst_dir, output = self._unzip(threads)
+            self.assertEqual(self._extracted(dst_dir), set(self.files))
+            for name, content in self.files.items():
+                self.assertEqual(load(os.path.join(dst_dir, name)), content)
+            self.assertNotIn("ERROR", output)
+
+    def test_patterns(self):
+        dst_dir, _ = self._unzip(3, pattern="foo/bar/*")
+        self.assertEqual(self._extracted(dst_dir), {"foo/bar/file.txt", "foo/bar/baz/file.txt"})
+        dst_dir, _ = self._unzip(3, pattern="nothing")
+        self.assertEqual(self._extracted(dst_dir), set())
+
+    def test_permissions(self):
+        if platform.system() == "Windows":
+            return
+        tmp_dir = temp_folder()
+        file_path = os.path.join(tmp_dir, "a_file.txt")
+        save(file_path, "contents")
+        os.chmod(file_path, stat.S_IRUSR)
+        with zipfile.ZipFile(os.path.join(tmp_dir, "zipfile.zip"), mode="w") as zf:
+            zf.write(file_path, "a_file.txt")
+        for keep_permissions in (True, False):
+            dest_dir = temp_folder()
+            unzip(os.path.join(tmp_dir, "zipfile.zip"), dest_dir,
+                  keep_permissions=keep_permissions, output=ConanOutput(StringIO()), threads=2)
+            mode = stat.S_IMODE(os.stat(os.path.join(dest_dir, "a_file.txt")).st_mode)
+            if keep_permissions:
+                self.assertEqual(mode, stat.S_IRUSR)
+            else:
+                self.assertNotEqual(mode, stat.S_IRUSR)
+
+    def test_errors(self):
+        # A folder where a file has to be extracted, the others are extracted
+        dst_dir = temp_folder()
+        os.makedirs(os.path.join(dst_dir, "file3.txt", "subfolder"))
+        stream = StringIO()
+        unzip(self.archive, dst_dir, output=ConanOutput(stream), threads=3)
+        self.assertIn("ERROR: Error extract file3.txt", stream.getvalue())
+        self.assertEqual(load(os.path.join(dst_dir, "file4.txt")), self.files["file4.txt"])
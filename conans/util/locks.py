@@ -9,6 +9,12 @@ from conans.util.log import logger
 
 class NoLock(object):
 
+    def try_acquire(self):
+        return True
+
+    def release(self):
+        pass
+
     def __enter__(self):
         pass
 
@@ -21,6 +27,13 @@ class SimpleLock(object):
     def __init__(self, filename):
         self._lock = fasteners.InterProcessLock(filename, logger=logger)
 
+    def try_acquire(self):
+        """ acquires the lock without waiting, returns False if it is already locked """
+        return self._lock.acquire(blocking=False)
+
+    def release(self):
+        self._lock.release()
+
     def __enter__(self):
         self._lock.acquire()
 
@@ -99,10 +112,21 @@ class WriteLock(Lock):
             self._info_locked()
             time.sleep(WRITE_BUSY_DELAY)
 
-    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+    def try_acquire(self):
+        """ acquires the lock without waiting, returns False if there are readers or writers """
+        with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+            if self._readers() != 0:
+                return False
+            save(self._count_file, "-1")
+            return True
+
+    def release(self):
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
             save(self._count_file, "0")
 
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        self.release()
+
         if exc_type is not None:
             # If there was an exception while locking this, might be empty
             # Try to clean up the trailing filelocks
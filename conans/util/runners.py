@@ -102,3 +102,24 @@ def check_output_runner(cmd, stderr=None):
             os.unlink(tmp_file)
         except OSError:
             pass
+
+
+def conan_subprocess(cache_folder, module_args, command_args):
+    """ the command line and environment that run conan in other process with the given cache:
+    'python -m' with the module_args, importing this same conans package, or the executable of
+    a frozen (PyInstaller) installer with the conan command_args, as it cannot run modules.
+    Returns (None, None) if it cannot be run in other process, so it has to run in this one
+    """
+    env = os.environ.copy()
+    if getattr(sys, "frozen", False):
+        # The cache of the installer executable is always the one of CONAN_USER_HOME
+        if not sys.executable or os.path.basename(cache_folder) != ".conan":
+            return None, None
+        env["CONAN_USER_HOME"] = os.path.dirname(cache_folder)
+        return [sys.executable] + command_args, env
+
+    if not sys.executable:
+        return None, None
+    python_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (python_path, env.get("PYTHONPATH")) if p)
+    return [sys.executable, "-m"] + module_args, env